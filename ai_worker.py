@@ -0,0 +1,279 @@
+import gc
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+
+from maze import Maze
+from pathfinding import DistanceField, find_path
+from replanner import IncrementalPlanner
+
+
+class AIWorker:
+    """
+    Monster pathfinding off the main thread, in a thread or a process.
+
+    It takes the same requests as ReplanScheduler: queued replans are
+    posted to the worker once per frame, and finished next-step paths are
+    collected without blocking, so a monster keeps walking its last path
+    until its result arrives. One worker serves every round; each new maze
+    is sent to it through the request queue with set_maze. A thread shares
+    the game's maze; for a process the maze's cells are moved into a shared
+    memory block, which the process builds its own adjacency index over,
+    and cells changed with set_cell are announced to it. A process runs on
+    its own core, while a thread still shares the interpreter lock with
+    rendering.
+    """
+
+    def __init__(self, kind="thread", mode="astar"):
+        self.kind = kind
+        self.pending = {}  # Monster index -> (start, goal), newest only
+        self.in_flight = {}  # Monster index -> start of the posted request
+        self.monsters = {}  # Monster index -> monster
+        self.queue_depth = 0  # Requests posted but not yet answered
+        self.used_ms = 0.0  # Time spent posting and collecting last frame
+        self.served = 0
+        self.dropped = 0
+        # Totals and peaks over every frame, for report
+        self.frames = 0
+        self.total_ms = 0.0
+        self.peak_ms = 0.0
+        self.peak_queue_depth = 0
+        self.maze = None
+        self.generation = 0  # Bumped per maze; tags results from the worker
+        self.version = 0  # Maze version the worker has been told about
+        self.shared = None  # Shared memory block holding the cells
+        self.retired = []  # Outgrown blocks still viewed by old mazes
+
+        if kind == "process":
+            context = multiprocessing.get_context("spawn")
+            self.requests = context.Queue()
+            self.results = context.Queue()
+            self.worker = context.Process(
+                target=_serve_shared,
+                args=(mode, self.requests, self.results),
+                daemon=True,
+            )
+        else:
+            self.requests = queue.Queue()
+            self.results = queue.Queue()
+            self.worker = threading.Thread(
+                target=_serve,
+                args=(lambda maze: maze, mode, self.requests, self.results),
+                daemon=True,
+            )
+        self.worker.start()
+
+    def set_maze(self, maze):
+        """
+        Start serving maze, dropping every request for the previous one.
+        The worker builds the maze's search structures itself.
+        """
+        self.generation += 1
+        self.pending = {}
+        self.in_flight = {}
+        self.monsters = {}
+        self.served = self.dropped = self.frames = self.peak_queue_depth = 0
+        self.total_ms = self.peak_ms = 0.0
+        self.maze = maze
+        self.version = maze.version
+        if self.kind == "process":
+            # The block is reused from round to round while the maze fits
+            size = len(maze.cells)
+            if self.shared is None or self.shared.size < size:
+                if self.shared is not None:
+                    self.shared.unlink()
+                    self.retired.append(self.shared)
+                self.shared = shared_memory.SharedMemory(create=True, size=size)
+            maze.use_buffer(self.shared.buf[:size])
+            self.requests.put(
+                ("maze", (self.shared.name, maze.width, maze.height), self.generation)
+            )
+        else:
+            self.requests.put(("maze", maze, self.generation))
+
+    def request(self, monster, maze, start, goal):
+        """
+        Queue a replan for monster from start to goal, replacing any request
+        it already has waiting to be posted.
+        """
+        if monster.index in self.pending:
+            self.dropped += 1
+        self.monsters[monster.index] = monster
+        self.pending[monster.index] = (start, goal)
+
+    def run(self):
+        """
+        Post this frame's maze edits and requests to the worker and hand
+        any finished paths to their monsters. Never waits for the worker.
+        """
+        began = time.perf_counter()
+        if self.kind == "process" and self.maze.version != self.version:
+            # The cells are already in the shared block; the process only
+            # has to rebuild what it derived from them
+            self.requests.put(("cells", self.maze.changed_cells[self.version :]))
+            self.version = self.maze.version
+        if self.pending:
+            for index, (start, goal) in self.pending.items():
+                self.in_flight[index] = start
+            self.requests.put(("paths", self.pending))
+            self.pending = {}
+
+        while True:
+            try:
+                generation, answers = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.generation:
+                continue  # Answers about an earlier maze
+            for index, start, path in answers:
+                if self.in_flight.get(index) == start:
+                    del self.in_flight[index]
+                monster = self.monsters[index]
+                if (monster.target_x, monster.target_y) != start:
+                    self.dropped += 1
+                    continue
+                monster.path = path
+                self.served += 1
+        self.queue_depth = len(self.in_flight)
+        self.used_ms = (time.perf_counter() - began) * 1000
+        self.frames += 1
+        self.total_ms += self.used_ms
+        self.peak_ms = max(self.peak_ms, self.used_ms)
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+
+    def report(self):
+        """
+        One-line summary of paths served and main-thread time so far.
+        """
+        average = self.total_ms / self.frames if self.frames else 0.0
+        return (
+            f"{self.served} paths served by the {self.kind} worker, "
+            f"{self.dropped} dropped, in flight peak {self.peak_queue_depth}; "
+            f"{average:.2f} ms/frame average and {self.peak_ms:.2f} ms peak "
+            f"posting and collecting"
+        )
+
+    def close(self):
+        """
+        Stop the worker and release the shared memory blocks. The current
+        maze gets its cells back in a private buffer.
+        """
+        self.requests.put(None)
+        self.worker.join(timeout=1)
+        if self.shared is not None:
+            self.maze.use_buffer(bytearray(len(self.maze.cells)))
+            self.shared.unlink()
+            self.retired.append(self.shared)
+            self.shared = None
+        gc.collect()
+        for block in self.retired:
+            try:
+                block.close()
+            except BufferError:
+                pass  # An old maze still views it; freed when that goes
+        self.retired = []
+
+
+def _serve_shared(mode, requests, results):
+    """
+    Worker process entry point: serve mazes whose cells are in shared
+    memory blocks, attaching to each block the first time it is named.
+    """
+    blocks = {}  # Block name -> SharedMemory
+
+    def open_maze(spec):
+        name, width, height = spec
+        if name not in blocks:
+            blocks[name] = shared_memory.SharedMemory(name=name)
+        return Maze.from_cells(width, height, blocks[name].buf[: width * height])
+
+    try:
+        _serve(open_maze, mode, requests, results)
+    finally:
+        # Views of the blocks must be gone before they can be closed
+        gc.collect()
+        for block in blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                pass
+
+
+def _serve(open_maze, mode, requests, results):
+    """
+    Serve the messages posted by AIWorker until given None:
+    ("maze", maze or block spec, generation) switches mazes, ("cells",
+    [(x, y), ...]) reports cells written by the game, and ("paths",
+    {monster index: (start, goal)}) is answered with (generation,
+    [(monster index, start, [start, next step]), ...]).
+    """
+    maze = None
+    generation = 0
+    planners = {}  # Monster index -> IncrementalPlanner
+    field = None
+    field_version = 0  # Maze version the field was built for
+    while True:
+        messages = [requests.get()]
+        while True:
+            try:
+                messages.append(requests.get_nowait())
+            except queue.Empty:
+                break
+
+        # Only the newest request of each monster is worth answering
+        batch = {}
+        for message in messages:
+            if message is None:
+                return
+            kind = message[0]
+            if kind == "maze":
+                # Requests so far were about the previous maze
+                batch = {}
+                planners = {}
+                field = None
+                maze = open_maze(message[1])
+                maze.prepare_pathfinding(mode)
+                generation = message[2]
+            elif kind == "cells":
+                maze.cells_written(message[1])
+            else:
+                batch.update(message[1])
+        if not batch:
+            continue
+
+        answers = []
+        for index, (start, goal) in batch.items():
+            if mode == "field":
+                # One field toward the player serves every monster
+                if field is None or field.root != goal or field_version != maze.version:
+                    field = DistanceField(maze, goal)
+                    field_version = maze.version
+                next_pos = field.next_step(start)
+                path = [start] if next_pos is None else [start, next_pos]
+            else:
+                path = maze.path_cache.get(start, goal)
+                if path is None:
+                    path = _find_path(maze, mode, planners, index, start, goal)
+                    maze.path_cache.put(start, goal, path)
+            answers.append((index, start, path[:2]))
+        results.put((generation, answers))
+
+
+def _find_path(maze, mode, planners, index, start, goal):
+    """
+    Search with the configured pathfinding mode, as Monster does on the main
+    thread.
+    """
+    if mode == "incremental":
+        if index not in planners:
+            planners[index] = IncrementalPlanner(maze)
+        return planners[index].find_path(start, goal)
+    if mode == "junction":
+        return maze.get_junction_graph().find_path(start, goal)
+    if mode == "hierarchical":
+        from config import HPA_REFINE_STEPS
+
+        return maze.get_hierarchy().find_path(start, goal, HPA_REFINE_STEPS)
+    return find_path(maze, start, goal)
@@ -0,0 +1,77 @@
+"""
+Startup cost of loading every sprite from the memory-mapped atlas against
+decoding the PNG files, each with a fresh asset registry, and a check that
+both give the same pixels.
+
+Run from the repository root (builds the atlas if it is missing):
+    python benchmarks/bench_atlas.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from config import ATLAS_PATH
+from sprites import AssetRegistry, write_atlas
+
+ROUNDS = 20
+
+
+def sprite_paths():
+    paths = []
+    for folder, _, files in sorted(os.walk("assets")):
+        for name in sorted(files):
+            if name.lower().endswith(".png"):
+                paths.append(os.path.join(folder, name).split(os.sep))
+    return paths
+
+
+def load_all(atlas_path, paths):
+    """
+    Load every sprite with a fresh registry, as a new process would.
+    Returns (registry, seconds).
+    """
+    began = time.perf_counter()
+    registry = AssetRegistry(atlas_path)
+    for parts in paths:
+        registry.image(*parts)
+    return registry, time.perf_counter() - began
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    if not os.path.exists(ATLAS_PATH):
+        write_atlas(ATLAS_PATH)
+    paths = sprite_paths()
+
+    png_times = []
+    atlas_times = []
+    for _ in range(ROUNDS):
+        png, seconds = load_all(None, paths)
+        png_times.append(seconds)
+        atlas, seconds = load_all(ATLAS_PATH, paths)
+        atlas_times.append(seconds)
+
+    identical = all(
+        pygame.image.tobytes(png.images[path], "RGBA")
+        == pygame.image.tobytes(atlas.images[path], "RGBA")
+        for path in png.images
+    )
+    print(f"PNG files: {png.report()}")
+    print(f"atlas:     {atlas.report()}")
+    print(
+        f"startup load of {len(paths)} sprites: "
+        f"{min(png_times) * 1000:.2f} ms decoding PNGs, "
+        f"{min(atlas_times) * 1000:.2f} ms from the atlas "
+        f"(best of {ROUNDS}); pixels identical: {identical}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Frame time during play with dirty-rect rendering, which repaints and pushes
+only the areas that changed, against clearing, redrawing and flipping the
+whole screen every frame.
+
+Run from the repository root:
+    python benchmarks/bench_dirty_rects.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from config import STATE_PLAYING
+from game import Game
+
+FRAMES = 600
+
+
+def run(screen, dirty):
+    """
+    Seconds per frame spent drawing and presenting, and the share of the
+    screen sent to the display on an average frame.
+    """
+    random.seed(FRAMES)
+    game = Game(screen)
+    game.menu_state = STATE_PLAYING
+    game.game_state = STATE_PLAYING
+    game.new_game()
+    game.next_storm_time = float("inf")  # Storms are always drawn in full
+    game.renderer.enabled = dirty
+    elapsed = 0.0
+    area = 0
+    for frame in range(FRAMES):
+        game.update()
+        game.game_state = STATE_PLAYING  # Keep playing if caught
+        if frame % 10 == 0:
+            # A burst of movement particles, as when the player steps
+            x, y = game.player.x, game.player.y
+            game.add_movement_particles((x, y), (x + 1, y))
+        began = time.perf_counter()
+        game.draw()
+        rects = game.renderer.previous + game.renderer.current
+        game.renderer.present()
+        elapsed += time.perf_counter() - began
+        if game.renderer.incremental:
+            area += sum(rect.width * rect.height for rect in rects)
+        else:
+            area += screen.get_width() * screen.get_height()
+    game.close()
+    return elapsed / FRAMES, area / FRAMES / (screen.get_width() * screen.get_height())
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    full, full_area = run(screen, False)
+    dirty, dirty_area = run(screen, True)
+    print(
+        f"full redraw: {full * 1000:.3f} ms/frame, "
+        f"{full_area:.0%} of the screen pushed"
+    )
+    print(
+        f"dirty rects: {dirty * 1000:.3f} ms/frame, "
+        f"{dirty_area:.0%} of the screen pushed ({full / dirty:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare the hierarchical planner in hierarchy.py with A* over the cell grid
+on large mazes: build time, abstract graph size, and mean and worst time
+per query when only the first abstract steps are refined.
+
+Run from the repository root:
+    python benchmarks/bench_hierarchy.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from hierarchy import HierarchicalPlanner
+from maze import Maze
+from pathfinding import find_path
+
+CLUSTER_SIZE = 16
+REFINE_STEPS = 2
+
+
+def time_queries(search, pairs):
+    times = []
+    for start, goal in pairs:
+        began = time.perf_counter()
+        search(start, goal)
+        times.append(time.perf_counter() - began)
+    return sum(times) / len(times), max(times)
+
+
+def run(width, height, queries):
+    random.seed(width * height)
+    maze = Maze(width, height)
+    cells = [
+        (x, y) for y in range(height) for x in range(width) if maze.grid[y][x] == 0
+    ]
+    pairs = [(random.choice(cells), random.choice(cells)) for _ in range(queries)]
+
+    began = time.perf_counter()
+    planner = HierarchicalPlanner(maze, CLUSTER_SIZE)
+    build_time = time.perf_counter() - began
+
+    grid_mean, grid_worst = time_queries(
+        lambda start, goal: find_path(maze, start, goal), pairs
+    )
+    hpa_mean, hpa_worst = time_queries(
+        lambda start, goal: planner.find_path(start, goal, REFINE_STEPS), pairs
+    )
+
+    print(
+        f"{width}x{height}: {len(planner.node_cells)} abstract nodes, "
+        f"built in {build_time * 1000:.0f} ms"
+    )
+    print(
+        f"  cell grid a*: {grid_mean * 1000:.2f} ms/query, "
+        f"worst {grid_worst * 1000:.2f} ms"
+    )
+    print(
+        f"  hierarchical: {hpa_mean * 1000:.2f} ms/query, "
+        f"worst {hpa_worst * 1000:.2f} ms"
+    )
+
+
+def main():
+    run(201, 201, 50)
+    run(501, 501, 20)
+    run(1001, 1001, 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compare A* over the junction graph in junctions.py with A* over the cell
+grid on large mazes: graph size, search nodes expanded and time per query.
+
+Run from the repository root:
+    python benchmarks/bench_junctions.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from maze import Maze
+from pathfinding import find_path
+from replanner import IncrementalPlanner
+
+
+def run(width, height, queries):
+    random.seed(width * height)
+    maze = Maze(width, height)
+    cells = [
+        (x, y) for y in range(height) for x in range(width) if maze.grid[y][x] == 0
+    ]
+    pairs = [(random.choice(cells), random.choice(cells)) for _ in range(queries)]
+
+    began = time.perf_counter()
+    graph = maze.get_junction_graph()
+    build_time = time.perf_counter() - began
+
+    began = time.perf_counter()
+    for start, goal in pairs:
+        find_path(maze, start, goal)
+    grid_time = (time.perf_counter() - began) / queries
+
+    began = time.perf_counter()
+    graph_expanded = 0
+    for start, goal in pairs:
+        graph.find_path(start, goal)
+        graph_expanded += graph.expanded
+    graph_time = (time.perf_counter() - began) / queries
+
+    # A fresh incremental planner runs the same cell-grid A* and counts
+    # the cells it expands
+    grid_expanded = 0
+    for start, goal in pairs:
+        planner = IncrementalPlanner(maze)
+        planner.find_path(start, goal)
+        grid_expanded += planner.expanded
+
+    print(
+        f"{width}x{height}: {len(cells)} open cells, "
+        f"{len(graph.node_cells)} nodes, {len(graph.edge_ends)} edges, "
+        f"built in {build_time * 1000:.1f} ms"
+    )
+    print(
+        f"  cell grid a*: {grid_expanded / queries:.0f} expanded, "
+        f"{grid_time * 1000:.3f} ms/query"
+    )
+    print(
+        f"  junction a*:  {graph_expanded / queries:.0f} expanded, "
+        f"{graph_time * 1000:.3f} ms/query"
+    )
+
+
+def main():
+    run(25, 17, 1000)
+    run(201, 201, 100)
+    run(501, 501, 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Time maze construction and measure its peak memory at several sizes.
+
+Run from the repository root:
+    python benchmarks/bench_maze.py
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from maze import HAS_NUMPY, Maze
+
+
+def generate(width, height, vectorized=HAS_NUMPY):
+    """
+    Carve and braid a grid without the later start/exit and power-up steps.
+    """
+    maze = Maze.__new__(Maze)
+    maze.width = width
+    maze.height = height
+    maze.vectorized = vectorized
+    maze.cells = maze._generate_maze()
+    maze.grid = maze._make_grid()
+    maze._braid_maze()
+    return maze
+
+
+def measure(build, width, height, repeats, vectorized, trace=True):
+    random.seed(width * height)
+    began = time.perf_counter()
+    for _ in range(repeats):
+        build(width, height, vectorized=vectorized)
+    elapsed = (time.perf_counter() - began) / repeats
+    if not trace:
+        return elapsed, None
+
+    # Memory is traced in a separate pass so tracing does not skew timings
+    tracemalloc.start()
+    build(width, height, vectorized=vectorized)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(width, height, repeats, trace_full=True):
+    """
+    Report both backends at one size. Tracing a full maze at the largest
+    size takes minutes, so trace_full=False only times it.
+    """
+    backends = (False, True) if HAS_NUMPY else (False,)
+    for vectorized in backends:
+        backend = "numpy" if vectorized else "python"
+        for name, build in (("generate", generate), ("full maze", Maze)):
+            trace = trace_full or build is generate
+            elapsed, peak = measure(build, width, height, repeats, vectorized, trace)
+            memory = f", peak {peak / 1024 / 1024:.2f} MiB" if trace else ""
+            print(f"{width}x{height} {name} ({backend}): {elapsed * 1000:.1f} ms{memory}")
+
+
+def main():
+    run(25, 17, 200)
+    run(501, 501, 3)
+    run(2001, 2001, 1, trace_full=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Cost of drawing the maze each frame from the cached maze layer, against
+drawing every wall, path line and corner arc again as the game used to.
+
+Run from the repository root:
+    python benchmarks/bench_maze_layer.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from config import MAZE_HEIGHT, MAZE_WIDTH
+from game import Game
+
+FRAMES = 300
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    game = Game(screen)
+
+    began = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.blit(game.render_maze_layer(), (0, 0))
+    redrawn = (time.perf_counter() - began) / FRAMES
+
+    game.get_maze_layer()
+    began = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.blit(game.get_maze_layer(), (0, 0))
+    cached = (time.perf_counter() - began) / FRAMES
+    game.close()
+
+    print(
+        f"{MAZE_WIDTH}x{MAZE_HEIGHT} maze: {redrawn * 1000:.3f} ms/frame redrawn, "
+        f"{cached * 1000:.3f} ms/frame cached layer ({redrawn / cached:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
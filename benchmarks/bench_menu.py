@@ -0,0 +1,204 @@
+"""
+Idle CPU cost of a whole main menu frame through Game.draw, with its
+cached background, particle sprites and option text, against clearing the
+screen and then drawing every line, allocating a glow per particle and
+rendering and scaling all text each frame as the menu used to.
+
+Run from the repository root:
+    python benchmarks/bench_menu.py
+"""
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from config import BACKGROUND_COLOR
+from game import Game
+
+FRAMES = 600
+
+
+def draw_uncached(game):
+    """
+    The old Game.draw_main_menu.
+    """
+    # Fill background with dark color
+    game.screen.fill((0, 10, 0))  # Darker green for more atmosphere
+
+    # Draw animated maze lines in background
+    for line in game.menu_maze_lines:
+        color = (0, line["alpha"], 0)
+        pygame.draw.line(
+            game.screen, color, line["start"], line["end"], line["width"]
+        )
+
+    # Update and draw particles
+    current_time = time.time()
+    for particle in game.menu_particles:
+        # Update position with smooth wave motion
+        particle["x"] += (
+            math.sin(current_time + particle["y"] * 0.01) * particle["direction"]
+        )
+        particle["y"] = (
+            particle["y"] - particle["speed"] * 0.016
+        ) % game.screen_height
+
+        # Draw particle with glow effect
+        glow_radius = particle["size"] * 3
+        glow_surface = pygame.Surface(
+            (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
+        )
+        pygame.draw.circle(
+            glow_surface,
+            (*particle["color"][:3], particle["alpha"] // 3),
+            (glow_radius, glow_radius),
+            glow_radius,
+        )
+        game.screen.blit(
+            glow_surface, (particle["x"] - glow_radius, particle["y"] - glow_radius)
+        )
+
+        # Draw core particle
+        pygame.draw.circle(
+            game.screen,
+            (*particle["color"][:3], particle["alpha"]),
+            (int(particle["x"]), int(particle["y"])),
+            particle["size"],
+        )
+
+    # Animate title
+    game.menu_animations["title_glow"] = (
+        game.menu_animations["title_glow"] + 0.02
+    ) % (2 * math.pi)
+    glow_intensity = abs(math.sin(game.menu_animations["title_glow"]))
+
+    # Draw main title with dramatic glow effect
+    title_text = "MAZE RUNNER"
+    title_shadow_color = (0, int(40 * glow_intensity), 0)
+    title_color = (
+        0,
+        int(200 + 55 * glow_intensity),
+        int(100 + 155 * glow_intensity),
+    )
+
+    # Draw multiple layers of shadow for depth
+    for offset in range(3, 0, -1):
+        title_surface = game.title_font.render(title_text, True, title_shadow_color)
+        game.screen.blit(
+            title_surface,
+            (
+                game.screen_width // 2 - title_surface.get_width() // 2 + offset,
+                120 + offset,
+            ),
+        )
+
+    # Draw main title
+    title_surface = game.title_font.render(title_text, True, title_color)
+    game.screen.blit(
+        title_surface,
+        (game.screen_width // 2 - title_surface.get_width() // 2, 120),
+    )
+
+    # Draw subtitle with pulsing effect
+    subtitle_color = (
+        0,
+        int(150 + 105 * glow_intensity),
+        int(200 + 55 * glow_intensity),
+    )
+    subtitle = game.menu_font.render("Escape from AI", True, subtitle_color)
+    subtitle_pos = (game.screen_width // 2 - subtitle.get_width() // 2, 220)
+    game.screen.blit(subtitle, subtitle_pos)
+
+    # Draw menu options with enhanced hover effects
+    for i, option in enumerate(game.menu_options):
+        # Update hover scale with smooth animation
+        target_scale = 1.2 if i == game.selected_option else 1.0
+        game.menu_animations["option_scales"][i] += (
+            target_scale - game.menu_animations["option_scales"][i]
+        ) * 0.2
+
+        # Calculate colors based on selection
+        if i == game.selected_option:
+            base_color = (0, 255, 200)
+            glow_color = (0, 200, 150, 100)
+        else:
+            base_color = (0, 150, 100)
+            glow_color = (0, 100, 50, 50)
+
+        # Apply pulsing effect to selected option
+        if i == game.selected_option:
+            color_pulse = abs(math.sin(time.time() * 4)) * 55
+            base_color = tuple(min(255, c + color_pulse) for c in base_color)
+
+        # Render text with current scale
+        text = game.menu_font.render(option, True, base_color)
+        scaled_size = (
+            int(text.get_width() * game.menu_animations["option_scales"][i]),
+            int(text.get_height() * game.menu_animations["option_scales"][i]),
+        )
+        text = pygame.transform.smoothscale(text, scaled_size)
+
+        # Position text
+        pos_x = game.screen_width // 2 - text.get_width() // 2
+        pos_y = 350 + i * 80
+
+        # Draw glow effect
+        if i == game.selected_option:
+            glow_surf = pygame.Surface(
+                (text.get_width() + 40, text.get_height() + 20), pygame.SRCALPHA
+            )
+            for size in range(20, 0, -5):
+                pygame.draw.rect(
+                    glow_surf,
+                    (*glow_color[:3], glow_color[3] // size),
+                    (
+                        size,
+                        size,
+                        text.get_width() + 40 - size * 2,
+                        text.get_height() + 20 - size * 2,
+                    ),
+                    border_radius=10,
+                )
+            game.screen.blit(glow_surf, (pos_x - 20, pos_y - 10))
+
+        # Draw text with shadow
+        shadow = game.menu_font.render(option, True, (0, 40, 20))
+        shadow = pygame.transform.smoothscale(shadow, scaled_size)
+        game.screen.blit(shadow, (pos_x + 2, pos_y + 2))
+        game.screen.blit(text, (pos_x, pos_y))
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    game = Game(screen)
+
+    began = time.perf_counter()
+    for _ in range(FRAMES):
+        # The old Game.draw cleared the screen before every menu frame
+        game.screen.fill(BACKGROUND_COLOR)
+        draw_uncached(game)
+    uncached = (time.perf_counter() - began) / FRAMES
+
+    game.draw()
+    began = time.perf_counter()
+    for _ in range(FRAMES):
+        game.draw()
+    cached = (time.perf_counter() - began) / FRAMES
+    game.close()
+
+    print(
+        f"main menu: {uncached * 1000:.3f} ms/frame uncached, "
+        f"{cached * 1000:.3f} ms/frame cached ({uncached / cached:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Update cost of the NumPy particle engine in particles.py against a list of
+Particle objects with dead ones removed one by one, as each effect's
+ParticleSystem used to do, with 1,000 to 50,000 live particles. Then draw
+cost with cached sprites in one blits call against two new surfaces and
+circles per particle. Finally the whole per-frame cost, update plus draw,
+and how many particles fit in a 60 FPS frame either way.
+
+Run from the repository root:
+    python benchmarks/bench_particles.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from particles import Particle, ParticleEngine
+
+COUNTS = (1000, 10000, 50000)
+DRAW_COUNTS = (100, 1000, 10000)
+FRAME_MS = 1000 / 60
+BURST = 30
+FRAMES = 60
+DT = 1 / 60
+
+
+def lifetimes(count):
+    """
+    Spread lifetimes so some bursts die on every frame.
+    """
+    random.seed(count)
+    return [random.uniform(0.2, 1.2) for _ in range(count // BURST)]
+
+
+def run_objects(count):
+    particles = []
+    for lifetime in lifetimes(count):
+        particles.extend(Particle(400, 300, lifetime) for _ in range(BURST))
+    began = time.perf_counter()
+    for _ in range(FRAMES):
+        for particle in particles[:]:
+            particle.update(DT)
+            if particle.lifetime <= 0:
+                particles.remove(particle)
+    return (time.perf_counter() - began) / FRAMES
+
+
+def run_engine(count):
+    engine = ParticleEngine()
+    for lifetime in lifetimes(count):
+        engine.emit(400, 300, BURST, lifetime)
+    began = time.perf_counter()
+    for _ in range(FRAMES):
+        engine.update(DT)
+    return (time.perf_counter() - began) / FRAMES
+
+
+def draw_uncached(screen, x, y, size, color, alpha):
+    """
+    The old Particle.draw: two new surfaces and two circles per particle.
+    """
+    particle_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+    pygame.draw.circle(
+        particle_surface, (*color, alpha), (int(size), int(size)), size
+    )
+    glow_size = size * 2
+    glow_surface = pygame.Surface(
+        (int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA
+    )
+    pygame.draw.circle(
+        glow_surface,
+        (*color, int(alpha * 0.5)),
+        (int(glow_size), int(glow_size)),
+        glow_size,
+    )
+    screen.blit(glow_surface, (int(x - glow_size), int(y - glow_size)))
+    screen.blit(particle_surface, (int(x - size), int(y - size)))
+
+
+def draw_engine(count, screen):
+    """
+    Draw a spread-out, partly faded engine; returns (uncached, cached)
+    seconds per frame.
+    """
+    random.seed(count)
+    engine = ParticleEngine()
+    for _ in range(count // BURST):
+        engine.emit(
+            random.uniform(0, 800), random.uniform(0, 600), BURST,
+            random.uniform(0.5, 1.5),
+        )
+    engine.update(0.3)
+    n = len(engine)
+    alpha = (engine.lifetime[:n] / engine.max_lifetime[:n] * 255).astype(int)
+    particles = list(
+        zip(
+            engine.x[:n].tolist(),
+            engine.y[:n].tolist(),
+            engine.size[:n].tolist(),
+            engine.color[:n].tolist(),
+            alpha.tolist(),
+        )
+    )
+    from config import PARTICLE_COLORS
+
+    frames = max(3, FRAMES * 100 // count)
+    began = time.perf_counter()
+    for _ in range(frames):
+        for x, y, size, color, particle_alpha in particles:
+            draw_uncached(screen, x, y, size, PARTICLE_COLORS[color], particle_alpha)
+    uncached = (time.perf_counter() - began) / frames
+
+    engine.draw(screen)  # Render the sprites the frames below need
+    began = time.perf_counter()
+    for _ in range(frames):
+        engine.draw(screen)
+    cached = (time.perf_counter() - began) / frames
+    return uncached, cached
+
+
+def main():
+    for count in COUNTS:
+        objects = run_objects(count)
+        engine = run_engine(count)
+        print(
+            f"{count:>6} particles: {objects * 1000:8.3f} ms/frame Particle objects, "
+            f"{engine * 1000:7.3f} ms/frame engine ({objects / engine:.0f}x)"
+        )
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    frames = []
+    for count in DRAW_COUNTS:
+        uncached, cached = draw_engine(count, screen)
+        print(
+            f"draw {count:>5} particles: {uncached * 1000:8.3f} ms/frame uncached, "
+            f"{cached * 1000:7.3f} ms/frame cached sprites; "
+            f"about {int(count * FRAME_MS / 1000 / uncached):>6} vs "
+            f"{int(count * FRAME_MS / 1000 / cached):>6} particles per 60 FPS frame"
+        )
+        old = run_objects(count) + uncached
+        new = run_engine(count) + cached
+        frames.append((count, old, new))
+
+    for count, old, new in frames:
+        print(
+            f"frame {count:>5} particles: {old * 1000:8.3f} ms before, "
+            f"{new * 1000:7.3f} ms now ({old / new:.1f}x); "
+            f"about {int(count * FRAME_MS / 1000 / old):>6} vs "
+            f"{int(count * FRAME_MS / 1000 / new):>6} particles per 60 FPS frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Hit rate and time saved by the maze's LRU path cache while several
+monsters chase a player who stops now and then, as in play.
+
+Run from the repository root:
+    python benchmarks/bench_path_cache.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from maze import Maze
+from pathfinding import PathCache, find_path
+
+
+def chase(maze, monsters, ticks):
+    """
+    Script the (start, goal) queries of monsters stepping along their paths
+    toward a player who moves on two ticks out of three. A monster that
+    reaches the player starts again from a random cell.
+    """
+    cells = [
+        (x, y)
+        for y in range(maze.height)
+        for x in range(maze.width)
+        if maze.grid[y][x] == 0
+    ]
+    player = random.choice(cells)
+    positions = [random.choice(cells) for _ in range(monsters)]
+    queries = []
+    for tick in range(ticks):
+        for i, position in enumerate(positions):
+            queries.append((position, player))
+            path = find_path(maze, position, player)
+            if len(path) > 2:
+                positions[i] = path[1]
+            else:
+                # Caught the player: respawn so the chase goes on
+                positions[i] = random.choice(cells)
+        if tick % 3:
+            player = random.choice(maze.get_neighbors(*player) or [player])
+    return queries
+
+
+def run(width, height, monsters, ticks):
+    random.seed(width * height + monsters)
+    maze = Maze(width, height)
+    queries = chase(maze, monsters, ticks)
+
+    began = time.perf_counter()
+    for start, goal in queries:
+        find_path(maze, start, goal)
+    plain_time = time.perf_counter() - began
+
+    cache = PathCache(maze)
+    began = time.perf_counter()
+    for start, goal in queries:
+        if cache.get(start, goal) is None:
+            cache.put(start, goal, find_path(maze, start, goal))
+    cached_time = time.perf_counter() - began
+
+    print(
+        f"{width}x{height}, {monsters} monsters: "
+        f"hit rate {cache.hits / len(queries):.0%}, "
+        f"{plain_time * 1000:.1f} ms uncached, {cached_time * 1000:.1f} ms cached"
+    )
+
+
+def main():
+    run(25, 17, 2, 300)
+    run(25, 17, 6, 300)
+    run(101, 101, 6, 300)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare the parent-pointer A* in pathfinding.py with the old path-copying
+search that used to live in Monster._find_path_to_player.
+
+Run from the repository root:
+    python benchmarks/bench_pathfinding.py
+"""
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from maze import Maze
+from pathfinding import DistanceField, find_path, manhattan
+
+
+def legacy_find_path(maze, start, goal):
+    """
+    The original search: every heap entry carries a full copy of its path.
+    """
+    open_set = []
+    heapq.heappush(open_set, (manhattan(start, goal), 0, start, [start]))
+    visited = set()
+    while open_set:
+        f, g, current, path = heapq.heappop(open_set)
+        if current == goal:
+            return path
+        visited.add(current)
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            neighbor = (current[0] + dx, current[1] + dy)
+            if (
+                0 <= neighbor[0] < maze.width
+                and 0 <= neighbor[1] < maze.height
+                and maze.grid[neighbor[1]][neighbor[0]] == 0
+                and neighbor not in visited
+            ):
+                heapq.heappush(
+                    open_set,
+                    (
+                        g + 1 + manhattan(neighbor, goal),
+                        g + 1,
+                        neighbor,
+                        path + [neighbor],
+                    ),
+                )
+    return [start]
+
+
+def run(width, height, queries, reach=None):
+    """
+    Time both searches on the same random queries. With reach set, each goal
+    lies within that Manhattan distance of its start, like a monster chasing
+    a nearby player; the legacy search is far too slow for maze-wide queries
+    on large grids.
+    """
+    random.seed(width * height)
+    maze = Maze(width, height)
+    cells = [
+        (x, y) for y in range(height) for x in range(width) if maze.grid[y][x] == 0
+    ]
+    pairs = []
+    while len(pairs) < queries:
+        start, goal = random.choice(cells), random.choice(cells)
+        if reach is None or manhattan(start, goal) <= reach:
+            pairs.append((start, goal))
+
+    timings = {}
+    for name, search in (("legacy", legacy_find_path), ("a*", find_path)):
+        began = time.perf_counter()
+        results = [search(maze, start, goal) for start, goal in pairs]
+        timings[name] = (time.perf_counter() - began) / queries
+        if name == "legacy":
+            expected = results
+        elif results != expected:
+            raise AssertionError(f"paths differ on {width}x{height}")
+
+    print(
+        f"{width}x{height}: legacy {timings['legacy'] * 1000:.3f} ms/query, "
+        f"a* {timings['a*'] * 1000:.3f} ms/query, "
+        f"speedup {timings['legacy'] / timings['a*']:.1f}x"
+    )
+
+
+def run_replan_tick(width, height, monster_counts, ticks=20):
+    """
+    Time one monster replan tick: a search per monster versus one shared
+    player-rooted distance field plus a lookup per monster.
+    """
+    random.seed(width + height)
+    maze = Maze(width, height)
+    cells = [
+        (x, y) for y in range(height) for x in range(width) if maze.grid[y][x] == 0
+    ]
+    for count in monster_counts:
+        monsters = [random.choice(cells) for _ in range(count)]
+        players = [random.choice(cells) for _ in range(ticks)]
+
+        began = time.perf_counter()
+        for player in players:
+            for monster in monsters:
+                find_path(maze, monster, player)
+        per_monster = (time.perf_counter() - began) / ticks
+
+        began = time.perf_counter()
+        for player in players:
+            field = DistanceField(maze, player)
+            for monster in monsters:
+                field.next_step(monster)
+        shared = (time.perf_counter() - began) / ticks
+
+        print(
+            f"{width}x{height}, {count} monsters: a* per monster "
+            f"{per_monster * 1000:.3f} ms/tick, shared field {shared * 1000:.3f} ms/tick"
+        )
+
+
+def main():
+    run(25, 17, 2000)
+    run(201, 201, 50, reach=60)
+    run(401, 401, 20, reach=60)
+    run_replan_tick(25, 17, (2, 20, 100))
+    run_replan_tick(201, 201, (2, 20, 100), ticks=5)
+
+
+if __name__ == "__main__":
+    main()
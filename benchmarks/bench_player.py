@@ -0,0 +1,88 @@
+"""
+Cost of drawing the player with its cached pre-baked frames, against
+scaling, tinting and flashing the frame on every draw as it used to.
+
+Run from the repository root:
+    python benchmarks/bench_player.py
+"""
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+import sprites
+from player import Player
+
+FRAMES = 2000
+
+
+def draw_uncached(player, frame, screen):
+    """
+    The old per-draw work: scale, copy, tint and flash.
+    """
+    scaled = pygame.transform.smoothscale(
+        frame, (int(frame.get_width() * 1.5), int(frame.get_height() * 1.5))
+    )
+    tinted = scaled.copy()
+    tint_value = int(255 * player.health / 100)
+    tint_surface = pygame.Surface(tinted.get_size())
+    tint_surface.fill((tint_value, tint_value, tint_value))
+    tinted.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_MULT)
+    if player.invulnerable:
+        flash = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.01))
+        flash_surface = pygame.Surface(tinted.get_size(), pygame.SRCALPHA)
+        flash_surface.fill((255, 0, 0, flash))
+        tinted.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    screen.blit(tinted, tinted.get_rect(center=(100, 100)))
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((200, 200))
+    player = Player(2, 2)
+    player.state = "walk"
+    # The originals, before the player scaled its frames at load
+    originals = [
+        pygame.image.load(
+            os.path.join("assets", "elf_front_walk", f"elf_front_walk{i}.png")
+        ).convert_alpha()
+        for i in range(1, 9)
+    ]
+
+    for invulnerable in (False, True):
+        player.invulnerable = invulnerable
+        began = time.perf_counter()
+        for tick in range(FRAMES):
+            draw_uncached(player, originals[tick % 8], screen)
+        uncached = (time.perf_counter() - began) / FRAMES
+
+        began = time.perf_counter()
+        for tick in range(FRAMES):
+            player.animation_frame = tick % 8
+            player.draw(screen)
+        cached = (time.perf_counter() - began) / FRAMES
+
+        label = "flashing" if invulnerable else "normal"
+        print(
+            f"{label}: {uncached * 1000:.3f} ms/draw uncached, "
+            f"{cached * 1000:.3f} ms/draw cached"
+        )
+
+    # A new round's player draws from the variants already baked
+    baked = len(sprites._player_variants)
+    player = Player(2, 2)
+    player.state = "walk"
+    for tick in range(FRAMES):
+        player.animation_frame = tick % 8
+        player.draw(screen)
+    print(f"variants baked again for a new player: {len(sprites._player_variants) - baked}")
+
+
+if __name__ == "__main__":
+    main()
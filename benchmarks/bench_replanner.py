@@ -0,0 +1,109 @@
+"""
+Compare the incremental planner in replanner.py with a fresh A* search per
+replan while a monster chases a wandering player through large braided mazes.
+
+Run from the repository root:
+    python benchmarks/bench_replanner.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from maze import Maze
+from pathfinding import find_path
+from replanner import IncrementalPlanner
+
+
+def chase(maze, steps):
+    """
+    Build a chase script: the player takes one random step per replan and
+    the monster follows the shortest path toward it.
+    """
+    cells = [
+        (x, y)
+        for y in range(maze.height)
+        for x in range(maze.width)
+        if maze.grid[y][x] == 0
+    ]
+    monster = random.choice(cells)
+    player = random.choice(cells)
+    script = []
+    for _ in range(steps):
+        script.append((monster, player))
+        path = find_path(maze, monster, player)
+        if len(path) > 1:
+            monster = path[1]
+        player = random.choice(maze.get_neighbors(*player) or [player])
+    return script
+
+
+def run(width, height, steps):
+    random.seed(width * height)
+    maze = Maze(width, height)
+    script = chase(maze, steps)
+
+    began = time.perf_counter()
+    for monster, player in script:
+        find_path(maze, monster, player)
+    full_time = (time.perf_counter() - began) / steps
+
+    # Expansions a from-scratch search needs, for comparison with repairs
+    full_expanded = 0
+    for monster, player in script:
+        planner = IncrementalPlanner(maze)
+        planner.find_path(monster, player)
+        full_expanded += planner.expanded
+
+    planner = IncrementalPlanner(maze)
+    planner.find_path(*script[0])
+    repair_expanded = 0
+    began = time.perf_counter()
+    for monster, player in script[1:]:
+        planner.find_path(monster, player)
+        repair_expanded += planner.expanded
+    repair_time = (time.perf_counter() - began) / (steps - 1)
+
+    print(
+        f"{width}x{height}: full search {full_time * 1000:.3f} ms, "
+        f"{full_expanded / steps:.0f} cells/replan; "
+        f"incremental {repair_time * 1000:.3f} ms, "
+        f"{repair_expanded / (steps - 1):.0f} cells/replan"
+    )
+
+
+def check_wall_on_route(width, height, trials=50):
+    """
+    Wall off a cell in the middle of each planned route and check that the
+    planner's next path avoids it, as a fresh search does.
+    """
+    random.seed(width + height)
+    maze = Maze(width, height)
+    cells = maze.path_cells
+    planner = IncrementalPlanner(maze)
+    for _ in range(trials):
+        start = divmod(int(random.choice(cells)), width)[::-1]
+        goal = divmod(int(random.choice(cells)), width)[::-1]
+        path = planner.find_path(start, goal)
+        if len(path) < 3:
+            continue
+        maze.set_cell(*path[len(path) // 2], 1)
+        repaired = planner.find_path(start, goal)
+        if len(repaired) != len(find_path(maze, start, goal)) or any(
+            maze.is_wall(x, y) for x, y in repaired
+        ):
+            raise AssertionError(f"planner ignored a new wall on {width}x{height}")
+    print(f"{width}x{height}: planner respects walls placed on its routes")
+
+
+def main():
+    check_wall_on_route(41, 41)
+    run(25, 17, 200)
+    run(201, 201, 200)
+    run(401, 401, 200)
+
+
+if __name__ == "__main__":
+    main()
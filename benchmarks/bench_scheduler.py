@@ -0,0 +1,82 @@
+"""
+Frame-time cost of monster replans on a large maze when every monster
+replans on the same frame: all searches run synchronously, or queued in
+the replan scheduler in scheduler.py with a per-frame budget.
+
+Run from the repository root:
+    python benchmarks/bench_scheduler.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from maze import Maze
+from pathfinding import find_path
+from scheduler import ReplanScheduler
+
+BUDGET_MS = 2.0
+
+
+class Chaser:
+    """
+    The parts of a monster the scheduler uses.
+    """
+
+    def __init__(self, cell):
+        self.target_x, self.target_y = cell
+        self.path = []
+
+    def replan(self, maze, start, goal):
+        self.path = find_path(maze, start, goal)
+
+
+def run(width, height, monsters, frames):
+    random.seed(width * height)
+    maze = Maze(width, height)
+    cells = [
+        (x, y) for y in range(height) for x in range(width) if maze.grid[y][x] == 0
+    ]
+    player = random.choice(cells)
+    # Keep searches local, as when monsters hunt a nearby player
+    nearby = [
+        cell
+        for cell in cells
+        if abs(cell[0] - player[0]) + abs(cell[1] - player[1]) < 60
+    ]
+    chasers = [Chaser(random.choice(nearby)) for _ in range(monsters)]
+
+    began = time.perf_counter()
+    for chaser in chasers:
+        chaser.replan(maze, (chaser.target_x, chaser.target_y), player)
+    sync_ms = (time.perf_counter() - began) * 1000
+
+    scheduler = ReplanScheduler(BUDGET_MS)
+    for chaser in chasers:
+        scheduler.request(chaser, maze, (chaser.target_x, chaser.target_y), player)
+    frame_ms = []
+    depths = []
+    for _ in range(frames):
+        scheduler.run()
+        frame_ms.append(scheduler.used_ms)
+        depths.append(scheduler.queue_depth)
+        if not scheduler.queue_depth:
+            break
+
+    print(
+        f"{width}x{height}, {monsters} monsters: synchronous {sync_ms:.1f} ms "
+        f"in one frame; scheduled over {len(frame_ms)} frames, "
+        f"worst {max(frame_ms):.1f} ms, queue depth {depths[0]} -> {depths[-1]}"
+    )
+
+
+def main():
+    run(201, 201, 10, 100)
+    run(201, 201, 50, 100)
+    run(401, 401, 100, 200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Cost of spawning and drawing monsters with the shared sprite frames in
+sprites.py, against loading the spritesheet per monster and transforming
+frames on every draw as monsters used to.
+
+Run from the repository root:
+    python benchmarks/bench_sprites.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from monster import Monster
+
+COUNT = 100
+FRAMES = 60
+
+
+def load_frames():
+    """
+    The old per-monster load: read the sheet and slice five frames.
+    """
+    spritesheet = pygame.image.load("assets/enemy_spritesheet.png").convert_alpha()
+    frame_size = spritesheet.get_height() // 5
+    return [
+        spritesheet.subsurface(
+            pygame.Rect(i * frame_size + 1, 1, frame_size - 2, frame_size - 2)
+        )
+        for i in range(5)
+    ]
+
+
+def transformed(frame, facing):
+    """
+    The old per-draw transform for a facing.
+    """
+    if facing == "left":
+        return pygame.transform.flip(frame, True, False)
+    if facing == "up":
+        return pygame.transform.rotate(frame, 90)
+    if facing == "down":
+        return pygame.transform.rotate(frame, -90)
+    return frame
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    random.seed(COUNT)
+    facings = [random.choice(("right", "left", "up", "down")) for _ in range(COUNT)]
+
+    began = time.perf_counter()
+    old_frames = [load_frames() for _ in range(COUNT)]
+    old_spawn = time.perf_counter() - began
+
+    began = time.perf_counter()
+    monsters = [
+        Monster(random.randrange(20), random.randrange(15), i) for i in range(COUNT)
+    ]
+    new_spawn = time.perf_counter() - began
+
+    began = time.perf_counter()
+    for tick in range(FRAMES):
+        for frames, facing in zip(old_frames, facings):
+            screen.blit(transformed(frames[tick % 5], facing), (100, 100))
+    old_draw = (time.perf_counter() - began) / FRAMES
+
+    for monster, facing in zip(monsters, facings):
+        monster.facing = facing
+    began = time.perf_counter()
+    for tick in range(FRAMES):
+        for monster in monsters:
+            monster.animation_frame = tick % 5
+            monster.draw(screen)
+    new_draw = (time.perf_counter() - began) / FRAMES
+
+    print(
+        f"spawn {COUNT} monsters: {old_spawn * 1000:.1f} ms loading per monster, "
+        f"{new_spawn * 1000:.1f} ms shared (first load included)"
+    )
+    print(
+        f"draw {COUNT} monsters: {old_draw * 1000:.2f} ms/frame transforming, "
+        f"{new_draw * 1000:.2f} ms/frame pre-baked"
+    )
+
+
+if __name__ == "__main__":
+    main()
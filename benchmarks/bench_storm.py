@@ -0,0 +1,84 @@
+"""
+Cost of drawing the storm overlay from the pre-baked torch mask and noise
+texture pool in storm.py, against drawing the torch gradient, scanlines and
+grain from scratch every frame as the game used to.
+
+Run from the repository root:
+    python benchmarks/bench_storm.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from config import CELL_SIZE
+from storm import StormOverlay
+
+WIDTH, HEIGHT = 800, 600
+FRAMES = 60
+
+
+def draw_uncached(screen, px, py):
+    """
+    The old storm frame: a new black overlay with about 117 circles for the
+    torch, then a new overlay with scanlines and grain drawn by set_at.
+    """
+    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 255))
+    torch_radius = int(2.5 * CELL_SIZE)
+    torch_soft_edge = int(1.2 * CELL_SIZE)
+    for r in range(torch_radius + torch_soft_edge, 0, -1):
+        if r > torch_radius:
+            alpha = int(255 * ((r - torch_radius) / torch_soft_edge) ** 2)
+        else:
+            alpha = 0
+        pygame.draw.circle(overlay, (0, 0, 0, alpha), (px, py), r)
+    screen.blit(overlay, (0, 0))
+
+    crt_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    for y in range(0, HEIGHT, 3):
+        pygame.draw.line(crt_overlay, (0, 40, 0, 32), (0, y), (WIDTH, y))
+    for _ in range(WIDTH * HEIGHT // 80):
+        x = random.randint(0, WIDTH - 1)
+        y = random.randint(0, HEIGHT - 1)
+        g = random.randint(32, 96)
+        crt_overlay.set_at((x, y), (0, g, 0, random.randint(16, 48)))
+    screen.blit(crt_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    random.seed(FRAMES)
+    positions = [
+        (random.randrange(WIDTH), random.randrange(HEIGHT)) for _ in range(FRAMES)
+    ]
+
+    began = time.perf_counter()
+    for px, py in positions:
+        draw_uncached(screen, px, py)
+    uncached = (time.perf_counter() - began) / FRAMES
+
+    began = time.perf_counter()
+    storm = StormOverlay(WIDTH, HEIGHT)
+    bake = time.perf_counter() - began
+    began = time.perf_counter()
+    for px, py in positions:
+        storm.draw(screen, px, py)
+    cached = (time.perf_counter() - began) / FRAMES
+
+    print(
+        f"storm frame: {uncached * 1000:.2f} ms drawn from scratch, "
+        f"{cached * 1000:.2f} ms pre-baked ({uncached / cached:.0f}x); "
+        f"baking {len(storm.noise)} noise textures took {bake * 1000:.0f} ms once"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Simulation time per frame for many monsters: Monster objects updated one
+by one against the NumPy swarm in swarm.py, both walking the shared
+distance field toward a moving player. Drawing is not included.
+
+Run from the repository root:
+    python benchmarks/bench_swarm.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from maze import Maze
+from monster import Monster
+from pathfinding import DistanceField
+from swarm import MonsterSwarm
+
+FRAMES = 300
+DT = 1 / 60
+
+
+class Player:
+    def __init__(self, cell):
+        self.x, self.y = cell
+
+
+def player_fields(maze):
+    """
+    Distance fields for a player taking a random step every 10 frames.
+    """
+    cell = maze.start_pos
+    fields = []
+    field = DistanceField(maze, cell)
+    for frame in range(FRAMES):
+        if frame % 10 == 0:
+            cell = random.choice(maze.get_neighbors(*cell) or [cell])
+            field = DistanceField(maze, cell)
+        fields.append(field)
+    return fields
+
+
+def run_objects(maze, count, fields):
+    cells = [
+        (int(cell) % maze.width, int(cell) // maze.width)
+        for cell in random.sample(list(maze.path_cells), count)
+    ]
+    monsters = [Monster(x, y, i) for i, (x, y) in enumerate(cells)]
+    hits = 0
+    began = time.perf_counter()
+    for field in fields:
+        player = Player(field.root)
+        for monster in monsters:
+            monster.update(DT, player, maze, field)
+            if int(monster.x) == int(player.x) and int(monster.y) == int(player.y):
+                hits += 1
+    return (time.perf_counter() - began) / FRAMES
+
+
+def run_swarm(maze, count, fields):
+    swarm = MonsterSwarm(maze, count)
+    began = time.perf_counter()
+    for field in fields:
+        swarm.update(DT, field)
+        swarm.collisions(*field.root)
+    return (time.perf_counter() - began) / FRAMES
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    random.seed(101)
+    maze = Maze(101, 101)
+    fields = player_fields(maze)
+    for count in (1000, 5000):
+        elapsed = run_objects(maze, count, fields)
+        print(f"{count} Monster objects: {elapsed * 1000:.2f} ms/frame")
+    for count in (1000, 5000, 20000):
+        elapsed = run_swarm(maze, count, fields)
+        print(f"{count} swarm monsters: {elapsed * 1000:.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
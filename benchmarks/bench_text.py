@@ -0,0 +1,68 @@
+"""
+Cost of the HUD and win screen text with the shared font registry and LRU
+text cache in text.py, against creating SysFont objects and rendering every
+label on every frame as the game used to.
+
+Run from the repository root:
+    python benchmarks/bench_text.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pygame
+
+from text import TextCache, fonts
+
+FRAMES = 600
+FPS = 60
+
+
+def labels(frame):
+    """
+    The labels of one frame: a running timer, a shield countdown and the
+    win screen.
+    """
+    seconds = frame / FPS
+    return [
+        (("Consolas", 20, True), f"TIME: {int(seconds)}s", (0, 255, 80)),
+        (("Consolas", 28, True), f"SHIELD {int(10 - seconds)}s", (0, 200, 255)),
+        (("Consolas", 48, True), "YOU ESCAPED!", (0, 255, 80)),
+        (("Consolas", 32, True), f"Time: {int(seconds)} seconds", (0, 255, 80)),
+        (("Consolas", 28, True), "Press R to play again", (255, 255, 80)),
+    ]
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+
+    began = time.perf_counter()
+    for frame in range(FRAMES):
+        for (name, size, bold), text, color in labels(frame):
+            font = pygame.font.SysFont(name, size, bold=bold)
+            screen.blit(font.render(text, True, color), (0, 0))
+    uncached = (time.perf_counter() - began) / FRAMES
+
+    cache = TextCache()
+    began = time.perf_counter()
+    for frame in range(FRAMES):
+        for (name, size, bold), text, color in labels(frame):
+            font = fonts.get(name, size, bold)
+            screen.blit(cache.render(font, text, color), (0, 0))
+    cached = (time.perf_counter() - began) / FRAMES
+
+    print(
+        f"{len(labels(0))} labels over {FRAMES} frames: "
+        f"{uncached * 1000:.3f} ms/frame with SysFont and render per frame, "
+        f"{cached * 1000:.3f} ms/frame cached ({uncached / cached:.0f}x); "
+        f"{cache.misses} renders, {cache.hits} cache hits"
+    )
+
+
+if __name__ == "__main__":
+    main()
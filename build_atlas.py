@@ -0,0 +1,33 @@
+"""
+Pack every sprite under assets/ into the atlas the game memory-maps at
+startup, so images are read without decoding PNGs.
+
+Run from the repository root after changing any sprite:
+    python build_atlas.py
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config import ATLAS_PATH
+from sprites import write_atlas
+
+
+def main():
+    pygame.init()
+    began = time.perf_counter()
+    count = write_atlas(ATLAS_PATH)
+    elapsed = time.perf_counter() - began
+    size = os.path.getsize(ATLAS_PATH)
+    print(
+        f"packed {count} images into {ATLAS_PATH} "
+        f"({size / 1024:.0f} KiB) in {elapsed * 1000:.0f} ms"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ TITLE = "Maze Runner - Escape from AI"
 
 # Game constants
 FPS = 60
+# During play, redraw and push to the display only the areas that changed
+# instead of the whole screen every frame
+DIRTY_RECT_RENDERING = True
 CELL_SIZE = 32
 WALL_THICKNESS = 3
 
@@ -52,6 +55,31 @@ MONSTER_COUNT = 2
 MONSTER_BASE_SPEED = 3
 MONSTER_GLOW_INTENSITY = 0.6
 MONSTER_TRAIL_LENGTH = 4
+# Swarm mode keeps every monster in NumPy arrays and updates them all in one
+# vectorized step per frame; it needs NumPy and always uses the shared
+# distance field
+MONSTER_SWARM = False
+SWARM_MONSTER_COUNT = 500
+# Monster pathfinding: "field" (one shared distance field toward the player),
+# "astar" (a fresh A* search per monster), "incremental" (per-monster A*
+# search tree that is repaired between replans), "junction" (A* over the
+# maze's junctions with corridors collapsed into weighted edges) or
+# "hierarchical" (HPA* over square clusters, for very large mazes)
+PATHFINDING_MODE = "field"
+# Hierarchical mode: cluster side in cells, and how many abstract steps of
+# each route are expanded into cells (monsters only take the first step)
+HPA_CLUSTER_SIZE = 16
+HPA_REFINE_STEPS = 2
+# Number of (start, goal) paths each maze keeps in its LRU path cache
+PATH_CACHE_SIZE = 256
+# Milliseconds per frame the replan scheduler may spend on monster searches
+REPLAN_BUDGET_MS = 2.0
+# Run monster pathfinding off the main thread: None (on the main thread,
+# within the budget above), "thread" or "process"
+AI_WORKER = None
+# Packed sprite atlas written by build_atlas.py; images missing from it, or
+# every image when there is no atlas, are loaded from their PNG files
+ATLAS_PATH = "assets/sprites.atlas"
 
 # Power-up settings
 POWERUP_COUNT = 4
@@ -65,6 +93,21 @@ WALL_GLOW_INTENSITY = 0.5
 FOG_FADE_SPEED = 2.0
 PARTICLE_COUNT = 15  # Reduced for better performance
 PARTICLE_LIFETIME = 0.8
+# Particle sprites are cached per color, size rounded to this step and
+# alpha rounded to one of this many levels
+PARTICLE_SIZE_STEP = 0.5
+PARTICLE_ALPHA_LEVELS = 16
+# Most dirty rects particles report per frame; neighbouring bursts are
+# merged beyond this
+PARTICLE_MAX_RECTS = 8
+
+# Number of rendered text surfaces kept in the LRU text cache
+TEXT_CACHE_SIZE = 128
+# Main menu: rendered text kept for the menu, glow intensity levels of the
+# title and selected option, and option scale step their text is cached at
+MENU_TEXT_CACHE_SIZE = 128
+MENU_GLOW_LEVELS = 16
+MENU_SCALE_STEP = 0.02
 
 # Game states
 STATE_TITLE = 0
@@ -92,3 +135,5 @@ PULSE_DURATION = 1.0
 STORM_MIN_INTERVAL = 8  # seconds
 STORM_MAX_INTERVAL = 15
 STORM_DURATION = 8  # seconds
+# Pre-generated grain textures the storm overlay cycles through
+STORM_NOISE_TEXTURES = 8
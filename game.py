@@ -2,11 +2,20 @@ import pygame
 import random
 import time
 import sys
-from maze import Maze
+from maze import HAS_NUMPY, Maze
 from player import Player
 from monster import Monster
+from swarm import MonsterSwarm
 from powerups import PowerUp, SpeedPowerUp, FreezePowerUp
-from particles import ParticleSystem
+from particles import ParticleEngine, ParticleList
+from pathfinding import DistanceField
+from scheduler import ReplanScheduler
+from sprites import assets
+from spatial import CellIndex
+from ai_worker import AIWorker
+from renderer import DirtyRenderer
+from storm import StormOverlay
+from text import TextCache, fonts
 from config import *
 import math
 
@@ -14,6 +23,8 @@ import math
 class Game:
     def __init__(self, screen):
         self.screen = screen
+        # Sends only the changed parts of the screen to the display in play
+        self.renderer = DirtyRenderer(screen, DIRTY_RECT_RENDERING)
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         self.game_state = STATE_TITLE
@@ -23,6 +34,10 @@ class Game:
         self.storm_timer = 0
         self.storm_warning_timer = 0
         self.next_storm_time = random.uniform(STORM_MIN_INTERVAL, STORM_MAX_INTERVAL)
+        # Torch mask, scanlines and grain for storms, baked once
+        self.storm_overlay = StormOverlay(self.screen_width, self.screen_height)
+        # Rendered labels, so text is only re-rendered when it changes
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
         if not pygame.mixer.get_init():
             print("Warning: Mixer not initialized")
         if not pygame.mixer.get_init() or not pygame.mixer.get_init()[0]:
@@ -30,10 +45,10 @@ class Game:
         print(f"MP3 supported: {pygame.mixer.get_init()}")
         # Enhanced fonts with larger sizes
         pygame.font.init()
-        self.title_font = pygame.font.SysFont("Verdana", 92, bold=True)
-        self.menu_font = pygame.font.SysFont("Verdana", 42)
-        self.font = pygame.font.SysFont("Verdana", 32)
-        self.small_font = pygame.font.SysFont("Verdana", 24)
+        self.title_font = fonts.get("Verdana", 92, bold=True)
+        self.menu_font = fonts.get("Verdana", 42)
+        self.font = fonts.get("Verdana", 32)
+        self.small_font = fonts.get("Verdana", 24)
 
         # Menu options and animations
         self.menu_options = ["Start Game", "How to Play", "Exit"]
@@ -50,8 +65,8 @@ class Game:
         pygame.mixer.init(44100, -16, 2, 2048)
         self.init_sounds()
 
-        # Initialize particle systems
-        self.particle_systems = []
+        # One particle engine serves every effect
+        self.particles = ParticleEngine() if HAS_NUMPY else ParticleList()
         self.menu_particles = []
         self.init_menu_particles()
 
@@ -61,17 +76,26 @@ class Game:
         self.pulse_value = 0
         self.pulse_direction = 1
 
+        # One background AI worker, if configured, serves every round
+        self.ai_worker = AIWorker(AI_WORKER, PATHFINDING_MODE) if AI_WORKER else None
+
         # Initialize game elements
         self.new_game()
 
         # Maze background for menu
         self.menu_maze_lines = self.generate_menu_maze_lines()
+        # Cached menu scene: background, particle and option glows, title
+        # per glow level, and text
+        self.menu_background = None
+        self.menu_glow_cache = {}
+        self.menu_title_cache = {}
+        self.menu_text_cache = TextCache(MENU_TEXT_CACHE_SIZE)
 
         # Cache terminal fonts for UI
-        self.term_font = pygame.font.SysFont("Consolas", 20, bold=True)
-        self.term_font_big = pygame.font.SysFont("Consolas", 48, bold=True)
-        self.term_font_med = pygame.font.SysFont("Consolas", 32, bold=True)
-        self.term_font_small = pygame.font.SysFont("Consolas", 28, bold=True)
+        self.term_font = fonts.get("Consolas", 20, bold=True)
+        self.term_font_big = fonts.get("Consolas", 48, bold=True)
+        self.term_font_med = fonts.get("Consolas", 32, bold=True)
+        self.term_font_small = fonts.get("Consolas", 28, bold=True)
 
     def init_menu_particles(self):
         self.menu_particles = []
@@ -108,19 +132,64 @@ class Game:
                     )
         return lines
 
+    def get_menu_background(self):
+        """
+        The menu's dark fill and background maze lines, drawn once into a
+        cached surface.
+        """
+        if self.menu_background is None:
+            background = pygame.Surface((self.screen_width, self.screen_height))
+            background = background.convert()
+            # Fill background with dark color
+            background.fill((0, 10, 0))  # Darker green for more atmosphere
+            for line in self.menu_maze_lines:
+                color = (0, line["alpha"], 0)
+                pygame.draw.line(
+                    background, color, line["start"], line["end"], line["width"]
+                )
+            self.menu_background = background
+        return self.menu_background
+
+    def render_menu_particle(self, particle):
+        """
+        A menu particle's glow with its solid core drawn over it, centered on
+        the particle.
+        """
+        glow_radius = particle["size"] * 3
+        glow_color = (*particle["color"][:3], particle["alpha"] // 3)
+        center = (glow_radius, glow_radius)
+
+        def draw_particle(surface):
+            pygame.draw.circle(surface, glow_color, center, glow_radius)
+            pygame.draw.circle(surface, particle["color"][:3], center, particle["size"])
+
+        return self.get_menu_glow(
+            (glow_color, glow_radius, particle["color"][:3], particle["size"]),
+            (glow_radius * 2, glow_radius * 2),
+            draw_particle,
+        )
+
+    def get_menu_glow(self, key, size, draw):
+        """
+        A cached SRCALPHA glow surface of the given size, drawn by draw on
+        first use.
+        """
+        surface = self.menu_glow_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            draw(surface)
+            # Run-length encode the transparent parts so blits skip them
+            surface.set_alpha(255, pygame.RLEACCEL)
+            self.menu_glow_cache[key] = surface
+        return surface
+
     def draw_main_menu(self):
-        # Fill background with dark color
-        self.screen.fill((0, 10, 0))  # Darker green for more atmosphere
-
-        # Draw animated maze lines in background
-        for line in self.menu_maze_lines:
-            color = (0, line["alpha"], 0)
-            pygame.draw.line(
-                self.screen, color, line["start"], line["end"], line["width"]
-            )
+        # Static background with the maze lines, drawn once
+        self.screen.blit(self.get_menu_background(), (0, 0))
 
         # Update and draw particles
         current_time = time.time()
+        blits = []
         for particle in self.menu_particles:
             # Update position with smooth wave motion
             particle["x"] += (
@@ -130,61 +199,29 @@ class Game:
                 particle["y"] - particle["speed"] * 0.016
             ) % self.screen_height
 
-            # Draw particle with glow effect
-            glow_radius = particle["size"] * 3
-            glow_surface = pygame.Surface(
-                (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
-            )
-            pygame.draw.circle(
-                glow_surface,
-                (*particle["color"][:3], particle["alpha"] // 3),
-                (glow_radius, glow_radius),
-                glow_radius,
-            )
-            self.screen.blit(
-                glow_surface, (particle["x"] - glow_radius, particle["y"] - glow_radius)
-            )
-
-            # Draw core particle
-            pygame.draw.circle(
-                self.screen,
-                (*particle["color"][:3], particle["alpha"]),
-                (int(particle["x"]), int(particle["y"])),
-                particle["size"],
-            )
+            # Particle with glow effect, cached per particle
+            sprite = particle.get("sprite")
+            if sprite is None:
+                sprite = particle["sprite"] = self.render_menu_particle(particle)
+            radius = particle["size"] * 3
+            blits.append((sprite, (particle["x"] - radius, particle["y"] - radius)))
+        self.screen.blits(blits, False)
 
-        # Animate title
+        # Animate title; the glow is snapped to MENU_GLOW_LEVELS levels so
+        # its renders can be cached
         self.menu_animations["title_glow"] = (
             self.menu_animations["title_glow"] + 0.02
         ) % (2 * math.pi)
-        glow_intensity = abs(math.sin(self.menu_animations["title_glow"]))
-
-        # Draw main title with dramatic glow effect
-        title_text = "MAZE RUNNER"
-        title_shadow_color = (0, int(40 * glow_intensity), 0)
-        title_color = (
-            0,
-            int(200 + 55 * glow_intensity),
-            int(100 + 155 * glow_intensity),
+        glow_intensity = self.menu_glow_level(
+            abs(math.sin(self.menu_animations["title_glow"]))
         )
 
-        # Draw multiple layers of shadow for depth
-        for offset in range(3, 0, -1):
-            title_surface = self.title_font.render(title_text, True, title_shadow_color)
-            self.screen.blit(
-                title_surface,
-                (
-                    self.screen_width // 2 - title_surface.get_width() // 2 + offset,
-                    120 + offset,
-                ),
-            )
-
-        # Draw main title
-        title_surface = self.title_font.render(title_text, True, title_color)
-        self.screen.blit(
-            title_surface,
-            (self.screen_width // 2 - title_surface.get_width() // 2, 120),
-        )
+        # Title and its shadows for this glow level, composed once
+        title = self.menu_title_cache.get(glow_intensity)
+        if title is None:
+            title = self.render_menu_title(glow_intensity)
+            self.menu_title_cache[glow_intensity] = title
+        self.screen.blit(*title)
 
         # Draw subtitle with pulsing effect
         subtitle_color = (
@@ -192,7 +229,9 @@ class Game:
             int(150 + 105 * glow_intensity),
             int(200 + 55 * glow_intensity),
         )
-        subtitle = self.menu_font.render("Escape from AI", True, subtitle_color)
+        subtitle = self.menu_text_cache.render(
+            self.menu_font, "Escape from AI", subtitle_color
+        )
         subtitle_pos = (self.screen_width // 2 - subtitle.get_width() // 2, 220)
         self.screen.blit(subtitle, subtitle_pos)
 
@@ -203,6 +242,11 @@ class Game:
             self.menu_animations["option_scales"][i] += (
                 target_scale - self.menu_animations["option_scales"][i]
             ) * 0.2
+            # Text is cached per MENU_SCALE_STEP of scale
+            scale = (
+                round(self.menu_animations["option_scales"][i] / MENU_SCALE_STEP)
+                * MENU_SCALE_STEP
+            )
 
             # Calculate colors based on selection
             if i == self.selected_option:
@@ -214,16 +258,15 @@ class Game:
 
             # Apply pulsing effect to selected option
             if i == self.selected_option:
-                color_pulse = abs(math.sin(time.time() * 4)) * 55
+                color_pulse = int(
+                    self.menu_glow_level(abs(math.sin(time.time() * 4))) * 55
+                )
                 base_color = tuple(min(255, c + color_pulse) for c in base_color)
 
             # Render text with current scale
-            text = self.menu_font.render(option, True, base_color)
-            scaled_size = (
-                int(text.get_width() * self.menu_animations["option_scales"][i]),
-                int(text.get_height() * self.menu_animations["option_scales"][i]),
+            text = self.menu_text_cache.render_scaled(
+                self.menu_font, option, base_color, scale
             )
-            text = pygame.transform.smoothscale(text, scaled_size)
 
             # Position text
             pos_x = self.screen_width // 2 - text.get_width() // 2
@@ -231,29 +274,72 @@ class Game:
 
             # Draw glow effect
             if i == self.selected_option:
-                glow_surf = pygame.Surface(
-                    (text.get_width() + 40, text.get_height() + 20), pygame.SRCALPHA
+                glow_width = text.get_width() + 40
+                glow_height = text.get_height() + 20
+
+                def draw_glow(glow_surf):
+                    for size in range(20, 0, -5):
+                        pygame.draw.rect(
+                            glow_surf,
+                            (*glow_color[:3], glow_color[3] // size),
+                            (
+                                size,
+                                size,
+                                glow_width - size * 2,
+                                glow_height - size * 2,
+                            ),
+                            border_radius=10,
+                        )
+
+                glow_surf = self.get_menu_glow(
+                    (glow_color, glow_width, glow_height),
+                    (glow_width, glow_height),
+                    draw_glow,
                 )
-                for size in range(20, 0, -5):
-                    pygame.draw.rect(
-                        glow_surf,
-                        (*glow_color[:3], glow_color[3] // size),
-                        (
-                            size,
-                            size,
-                            text.get_width() + 40 - size * 2,
-                            text.get_height() + 20 - size * 2,
-                        ),
-                        border_radius=10,
-                    )
                 self.screen.blit(glow_surf, (pos_x - 20, pos_y - 10))
 
             # Draw text with shadow
-            shadow = self.menu_font.render(option, True, (0, 40, 20))
-            shadow = pygame.transform.smoothscale(shadow, scaled_size)
+            shadow = self.menu_text_cache.render_scaled(
+                self.menu_font, option, (0, 40, 20), scale
+            )
             self.screen.blit(shadow, (pos_x + 2, pos_y + 2))
             self.screen.blit(text, (pos_x, pos_y))
 
+    def render_menu_title(self, glow_intensity):
+        """
+        The menu title with its shadows at one glow level, composed into one
+        SRCALPHA surface. Returns (surface, screen position).
+        """
+        # Draw main title with dramatic glow effect
+        title_text = "MAZE RUNNER"
+        title_shadow_color = (0, int(40 * glow_intensity), 0)
+        title_color = (
+            0,
+            int(200 + 55 * glow_intensity),
+            int(100 + 155 * glow_intensity),
+        )
+        shadow = self.text_cache.render(self.title_font, title_text, title_shadow_color)
+        title_surface = self.text_cache.render(self.title_font, title_text, title_color)
+        block = pygame.Surface(
+            (title_surface.get_width() + 3, title_surface.get_height() + 3),
+            pygame.SRCALPHA,
+        )
+
+        # Draw multiple layers of shadow for depth
+        for offset in range(3, 0, -1):
+            block.blit(shadow, (offset, offset))
+
+        # Draw main title
+        block.blit(title_surface, (0, 0))
+        block.set_alpha(255, pygame.RLEACCEL)
+        return block, (self.screen_width // 2 - title_surface.get_width() // 2, 120)
+
+    def menu_glow_level(self, intensity):
+        """
+        Snap a 0-1 glow intensity to one of MENU_GLOW_LEVELS levels.
+        """
+        return round(intensity * (MENU_GLOW_LEVELS - 1)) / (MENU_GLOW_LEVELS - 1)
+
     def init_sounds(self):
         try:
             pygame.mixer.init()
@@ -272,41 +358,78 @@ class Game:
             self.sounds = {}
 
     def new_game(self):
+        if hasattr(self, "replan_scheduler"):
+            self.report_round()
         self.maze = Maze(MAZE_WIDTH, MAZE_HEIGHT)
+        self.maze_layer = None  # Rendered on first draw
+        self.maze_layer_key = None
         self.player = Player(*self.maze.start_pos)
+        self.player_field = None
+        # Monster searches are queued here and served within a frame budget,
+        # or handed to the background worker
+        if self.ai_worker is not None:
+            # The worker builds the pathfinding mode's search graph itself
+            self.ai_worker.set_maze(self.maze)
+            self.replan_scheduler = self.ai_worker
+        else:
+            # Build the pathfinding mode's search graph now rather than in
+            # the first replan frame
+            self.maze.prepare_pathfinding(PATHFINDING_MODE)
+            self.replan_scheduler = ReplanScheduler(REPLAN_BUDGET_MS)
         self.monsters = []
+        # Monsters by the cell they are in, for the collision check
+        self.monster_cells = CellIndex()
+        self.swarm = None
 
-        # Create monsters with varied behaviors
-        for i in range(MONSTER_COUNT):
-            while True:
-                x = random.randint(0, MAZE_WIDTH - 1)
-                y = random.randint(0, MAZE_HEIGHT - 1)
-                if (
-                    self.maze.grid[y][x] == 0
-                    and abs(x - self.maze.start_pos[0])
-                    + abs(y - self.maze.start_pos[1])
-                    > 10
-                ):
-                    self.monsters.append(Monster(x, y, i))
-                    break
+        if MONSTER_SWARM and HAS_NUMPY:
+            # The whole swarm lives in NumPy arrays instead of Monster objects
+            self.swarm = MonsterSwarm(self.maze, SWARM_MONSTER_COUNT)
+        else:
+            # Create monsters with varied behaviors
+            for i in range(MONSTER_COUNT):
+                while True:
+                    x = random.randint(0, MAZE_WIDTH - 1)
+                    y = random.randint(0, MAZE_HEIGHT - 1)
+                    # Spawn at least 10 steps of actual walking away from the player
+                    if self.maze.distance_from_start(x, y) > 10:
+                        self.monsters.append(Monster(x, y, i))
+                        self.monster_cells.add(self.monsters[-1], (x, y))
+                        break
 
         # Create power-ups with enhanced visuals
-        self.powerups = []
+        # Indexed by cell so pickups only look at the player's cell
+        self.powerups = CellIndex()
         for i, pos in enumerate(self.maze.powerup_positions):
             if i % 2 == 0:
-                self.powerups.append(SpeedPowerUp(*pos))
+                self.powerups.add(SpeedPowerUp(*pos), pos)
             else:
-                self.powerups.append(FreezePowerUp(*pos))
+                self.powerups.add(FreezePowerUp(*pos), pos)
 
         # Reset timers and effects
         self.last_time = pygame.time.get_ticks() / 1000.0
         self.game_time = 0
         self.effect_timer = 0
-        self.particle_systems = []
+        self.particles.clear()
 
         if self.game_state != STATE_TITLE:
             self.game_state = STATE_PLAYING
 
+    def report_round(self):
+        """
+        Log how monster pathfinding kept up with the round being left.
+        """
+        print(f"Pathfinding: {self.replan_scheduler.report()}")
+
+    def close(self):
+        """
+        Log the last round and how sprites were loaded, and stop the
+        background AI worker, if there is one.
+        """
+        self.report_round()
+        print(f"Sprites: {assets.report()}")
+        if self.ai_worker is not None:
+            self.ai_worker.close()
+
     def handle_event(self, event):
         if self.menu_state == STATE_MENU:
             if event.type == pygame.KEYDOWN:
@@ -328,6 +451,7 @@ class Game:
                     elif self.selected_option == 1:  # How to Play
                         self.menu_state = STATE_HOW_TO_PLAY
                     elif self.selected_option == 2:  # Exit
+                        self.close()
                         pygame.quit()
                         sys.exit()
                 return
@@ -420,45 +544,45 @@ class Game:
                 self.player.shield = False
                 self.player.shield_timer = 0
 
-        # Update monsters and check collisions
+        # One distance field toward the player serves every monster; it is
+        # only rebuilt when the player's cell changes. The swarm always
+        # walks it.
+        if self.swarm is not None or (PATHFINDING_MODE == "field" and not AI_WORKER):
+            player_cell = (int(self.player.x + 0.5), int(self.player.y + 0.5))
+            if self.player_field is None or self.player_field.root != player_cell:
+                self.player_field = DistanceField(self.maze, player_cell)
+
+        # Update monsters, then check collisions in the player's cell only
         for monster in self.monsters:
-            monster.update(dt, self.player, self.maze)
-            if (
-                int(monster.x) == int(self.player.x)
-                and int(monster.y) == int(self.player.y)
-                and not monster.frozen
-            ):
-                # --- Shield logic: if player has shield, consume it instead of health ---
-                if hasattr(self.player, "shield") and self.player.shield:
-                    self.player.shield = False
-                    self.player.shield_timer = 0
-                    self.add_powerup_effect((int(self.player.x), int(self.player.y)))
-                elif self.player.health > 0:
-                    is_dead = self.player.take_damage()
-                    if is_dead:
-                        self.game_state = STATE_GAME_OVER
-                        if "game_over" in self.sounds:
-                            self.sounds["game_over"].play()
-                        self.add_game_over_effect()
-                else:
-                    self.game_state = STATE_GAME_OVER
-                    if "game_over" in self.sounds:
-                        self.sounds["game_over"].play()
-                    self.add_game_over_effect()
+            monster.update(
+                dt, self.player, self.maze, self.player_field, self.replan_scheduler
+            )
+            self.monster_cells.move(monster, (int(monster.x), int(monster.y)))
+        player_pos = (int(self.player.x), int(self.player.y))
+        for monster in self.monster_cells.at(player_pos):
+            if not monster.frozen:
+                self.handle_monster_hit()
+        if self.swarm is not None:
+            self.swarm.update(dt, self.player_field)
+            # The player is invulnerable for a while after a hit, so one hit
+            # per frame covers any number of monsters in the cell
+            if self.swarm.collisions(self.player.x, self.player.y):
+                self.handle_monster_hit()
+
+        # Serve queued monster searches within this frame's budget
+        self.replan_scheduler.run()
 
         # Update power-ups and check collection
-        player_pos = (int(self.player.x), int(self.player.y))
-        for powerup in self.powerups[:]:
-            if (int(powerup.x), int(powerup.y)) == player_pos:
-                if isinstance(powerup, SpeedPowerUp):
-                    self.player.apply_speed_boost(POWERUP_DURATION)
-                elif isinstance(powerup, FreezePowerUp):
-                    self.player.shield = True
-                    self.player.shield_timer = 10.0
-                self.powerups.remove(powerup)
-                if "powerup" in self.sounds:
-                    self.sounds["powerup"].play()
-                self.add_powerup_effect(player_pos)
+        for powerup in self.powerups.at(player_pos):
+            if isinstance(powerup, SpeedPowerUp):
+                self.player.apply_speed_boost(POWERUP_DURATION)
+            elif isinstance(powerup, FreezePowerUp):
+                self.player.shield = True
+                self.player.shield_timer = 10.0
+            self.powerups.remove(powerup)
+            if "powerup" in self.sounds:
+                self.sounds["powerup"].play()
+            self.add_powerup_effect(player_pos)
 
         # Check win condition
         ex, ey = self.maze.exit_pos
@@ -469,11 +593,8 @@ class Game:
                 self.sounds["win"].play()
             self.add_win_effect()
 
-        # Update particle systems
-        for system in self.particle_systems[:]:
-            system.update(dt)
-            if system.is_finished():
-                self.particle_systems.remove(system)
+        # Update particles
+        self.particles.update(dt)
 
         # --- Storm logic ---
         print(
@@ -501,6 +622,25 @@ class Game:
                     STORM_MIN_INTERVAL, STORM_MAX_INTERVAL
                 )
 
+    def handle_monster_hit(self):
+        # --- Shield logic: if player has shield, consume it instead of health ---
+        if hasattr(self.player, "shield") and self.player.shield:
+            self.player.shield = False
+            self.player.shield_timer = 0
+            self.add_powerup_effect((int(self.player.x), int(self.player.y)))
+        elif self.player.health > 0:
+            is_dead = self.player.take_damage()
+            if is_dead:
+                self.game_state = STATE_GAME_OVER
+                if "game_over" in self.sounds:
+                    self.sounds["game_over"].play()
+                self.add_game_over_effect()
+        else:
+            self.game_state = STATE_GAME_OVER
+            if "game_over" in self.sounds:
+                self.sounds["game_over"].play()
+            self.add_game_over_effect()
+
     def update_effects(self, dt):
         # Update pulse effect
         self.pulse_value += dt * WALL_PULSE_SPEED * self.pulse_direction
@@ -528,26 +668,20 @@ class Game:
     def add_movement_particles(self, old_pos, new_pos):
         x = (old_pos[0] + new_pos[0]) / 2 * CELL_SIZE
         y = (old_pos[1] + new_pos[1]) / 2 * CELL_SIZE
-        self.particle_systems.append(
-            ParticleSystem(x, y, PARTICLE_COUNT, PARTICLE_LIFETIME)
-        )
+        self.particles.emit(x, y, PARTICLE_COUNT, PARTICLE_LIFETIME)
 
     def add_powerup_effect(self, pos):
         x = pos[0] * CELL_SIZE
         y = pos[1] * CELL_SIZE
-        self.particle_systems.append(
-            ParticleSystem(x, y, PARTICLE_COUNT * 2, PARTICLE_LIFETIME * 1.5)
-        )
+        self.particles.emit(x, y, PARTICLE_COUNT * 2, PARTICLE_LIFETIME * 1.5)
         self.effect_timer = EFFECT_DURATION
 
     def add_game_over_effect(self):
         self.effect_timer = EFFECT_DURATION * 2
         center_x = self.screen_width / 2
         center_y = self.screen_height / 2
-        self.particle_systems.append(
-            ParticleSystem(
-                center_x, center_y, PARTICLE_COUNT * 3, PARTICLE_LIFETIME * 2
-            )
+        self.particles.emit(
+            center_x, center_y, PARTICLE_COUNT * 3, PARTICLE_LIFETIME * 2
         )
 
     def add_win_effect(self):
@@ -555,17 +689,36 @@ class Game:
         for i in range(4):
             x = random.randint(0, self.screen_width)
             y = random.randint(0, self.screen_height)
-            self.particle_systems.append(
-                ParticleSystem(x, y, PARTICLE_COUNT * 2, PARTICLE_LIFETIME * 1.5)
-            )
+            self.particles.emit(x, y, PARTICLE_COUNT * 2, PARTICLE_LIFETIME * 1.5)
+
+    def frame_kind(self):
+        """
+        What the next frame shows, for the dirty-rect renderer: frames of the
+        same kind in a row are drawn incrementally. None means the frame is
+        always drawn in full.
+        """
+        if (
+            self.menu_state in (STATE_MENU, STATE_HOW_TO_PLAY)
+            or self.game_state != STATE_PLAYING
+            or self.storm_active
+            or self.transition_alpha > 0
+        ):
+            return None
+        return (self.maze, self.maze.version)
 
     def draw(self):
+        incremental = self.renderer.begin(self.frame_kind())
+        # The menu screens paint their own full background
         if self.menu_state == STATE_MENU:
             self.draw_main_menu()
             return
         if self.menu_state == STATE_HOW_TO_PLAY:
             self.draw_how_to_play()
             return
+        # Full play frames start from a cleared screen; incremental frames
+        # only repaint what changed
+        if not incremental:
+            self.screen.fill(BACKGROUND_COLOR)
         if self.game_state == STATE_GAME_OVER:
             self.draw_game_over_screen()
         elif self.game_state == STATE_WIN:
@@ -576,23 +729,22 @@ class Game:
             )
             overlay.fill((0, 0, 0, 180))
             self.screen.blit(overlay, (0, 0))
-            term_font = pygame.font.SysFont("Consolas", 48, bold=True)
-            win_text = term_font.render("YOU ESCAPED!", True, (0, 255, 80))
+            win_text = self.text_cache.render(
+                self.term_font_big, "YOU ESCAPED!", (0, 255, 80)
+            )
             win_rect = win_text.get_rect(
                 center=(self.screen_width // 2, self.screen_height // 2 - 40)
             )
             self.screen.blit(win_text, win_rect)
-            time_font = pygame.font.SysFont("Consolas", 32, bold=True)
-            time_text = time_font.render(
-                f"Time: {int(self.game_time)} seconds", True, (0, 255, 80)
+            time_text = self.text_cache.render(
+                self.term_font_med, f"Time: {int(self.game_time)} seconds", (0, 255, 80)
             )
             time_rect = time_text.get_rect(
                 center=(self.screen_width // 2, self.screen_height // 2 + 10)
             )
             self.screen.blit(time_text, time_rect)
-            prompt_font = pygame.font.SysFont("Consolas", 28, bold=True)
-            prompt_text = prompt_font.render(
-                "Press R to play again", True, (255, 255, 80)
+            prompt_text = self.text_cache.render(
+                self.term_font_small, "Press R to play again", (255, 255, 80)
             )
             prompt_rect = prompt_text.get_rect(
                 center=(self.screen_width // 2, self.screen_height // 2 + 60)
@@ -605,13 +757,6 @@ class Game:
             self.draw_maze_and_entities()
             # Draw storm darkening overlay if storm is active and only in STATE_PLAYING
             if self.storm_active:
-                overlay = pygame.Surface(
-                    (self.screen_width, self.screen_height), pygame.SRCALPHA
-                )
-                overlay.fill((0, 0, 0, 255))  # Pitch black
-                # Torch effect with smooth non-linear gradient
-                torch_radius = int(2.5 * CELL_SIZE)
-                torch_soft_edge = int(1.2 * CELL_SIZE)
                 px = int(
                     self.player.x * CELL_SIZE
                     + (self.screen_width - MAZE_WIDTH * CELL_SIZE) // 2
@@ -622,36 +767,7 @@ class Game:
                     + (self.screen_height - MAZE_HEIGHT * CELL_SIZE) // 2
                     + CELL_SIZE // 2
                 )
-                for r in range(torch_radius + torch_soft_edge, 0, -1):
-                    # Use a non-linear fade for realism (ease-in)
-                    if r > torch_radius:
-                        t = (r - torch_radius) / torch_soft_edge
-                        alpha = int(255 * (t**2))  # quadratic fade
-                    else:
-                        alpha = 0
-                    pygame.draw.circle(overlay, (0, 0, 0, alpha), (px, py), r)
-                self.screen.blit(overlay, (0, 0))
-
-                # CRT grain and scanlines effect
-                crt_overlay = pygame.Surface(
-                    (self.screen_width, self.screen_height), pygame.SRCALPHA
-                )
-                # Scanlines
-                for y in range(0, self.screen_height, 3):
-                    pygame.draw.line(
-                        crt_overlay, (0, 40, 0, 32), (0, y), (self.screen_width, y)
-                    )
-                # Grain/noise
-                import random
-
-                for _ in range(self.screen_width * self.screen_height // 80):
-                    x = random.randint(0, self.screen_width - 1)
-                    y = random.randint(0, self.screen_height - 1)
-                    g = random.randint(32, 96)
-                    crt_overlay.set_at((x, y), (0, g, 0, random.randint(16, 48)))
-                self.screen.blit(
-                    crt_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD
-                )
+                self.storm_overlay.draw(self.screen, px, py)
 
         # Draw transition effect
         if self.transition_alpha > 0:
@@ -660,7 +776,21 @@ class Game:
             overlay.set_alpha(self.transition_alpha)
             self.screen.blit(overlay, (0, 0))
 
-    def draw_maze_and_entities(self):
+    def get_maze_layer(self):
+        """
+        The background and maze walls and paths, rendered into a cached
+        screen-sized surface that is rebuilt only when the maze changes.
+        """
+        key = (self.maze, self.maze.version)
+        if self.maze_layer is None or self.maze_layer_key != key:
+            self.maze_layer = self.render_maze_layer()
+            self.maze_layer_key = key
+        return self.maze_layer
+
+    def render_maze_layer(self):
+        layer = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        layer.fill(BACKGROUND_COLOR)
+
         # Calculate offset to center maze
         offset_x = (self.screen_width - MAZE_WIDTH * CELL_SIZE) // 2
         offset_y = (self.screen_height - MAZE_HEIGHT * CELL_SIZE) // 2
@@ -675,12 +805,8 @@ class Game:
                         CELL_SIZE,
                         CELL_SIZE,
                     )
-                    pygame.draw.rect(self.screen, CRT_BACKGROUND_COLOR, rect)
+                    pygame.draw.rect(layer, CRT_BACKGROUND_COLOR, rect)
 
-        # Animate grid glow
-        grid_glow = 80 + int(
-            80 * (0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.002))
-        )
         path_color = (80, 255, 80)  # Neon green for path
         path_thickness = 28
         border_color = (0, 40, 0)  # Dark green border
@@ -703,7 +829,7 @@ class Game:
                             ncy = ny * CELL_SIZE + offset_y + CELL_SIZE // 2
                             # Draw border first
                             pygame.draw.line(
-                                self.screen,
+                                layer,
                                 border_color,
                                 (cx, cy),
                                 (ncx, ncy),
@@ -711,7 +837,7 @@ class Game:
                             )
                             # Draw path on top
                             pygame.draw.line(
-                                self.screen,
+                                layer,
                                 path_color,
                                 (cx, cy),
                                 (ncx, ncy),
@@ -728,7 +854,7 @@ class Game:
                         rect = pygame.Rect(cx, cy, corner_radius * 2, corner_radius * 2)
                         # Border arc
                         pygame.draw.arc(
-                            self.screen,
+                            layer,
                             border_color,
                             rect,
                             math.pi,
@@ -737,18 +863,41 @@ class Game:
                         )
                         # Path arc
                         pygame.draw.arc(
-                            self.screen,
+                            layer,
                             path_color,
                             rect,
                             math.pi,
                             1.5 * math.pi,
                             path_thickness,
                         )
+        return layer
+
+    def draw_maze_and_entities(self):
+        # Calculate offset to center maze
+        offset_x = (self.screen_width - MAZE_WIDTH * CELL_SIZE) // 2
+        offset_y = (self.screen_height - MAZE_HEIGHT * CELL_SIZE) // 2
+
+        # The maze itself never changes during a round, so it is drawn once;
+        # incremental frames only restore it where things were drawn
+        renderer = self.renderer
+        if renderer.incremental:
+            renderer.restore(self.get_maze_layer())
+        else:
+            self.screen.blit(self.get_maze_layer(), (0, 0))
+
         # Draw exit as animated glowing portal
         ex, ey = self.maze.exit_pos
         exit_cx = ex * CELL_SIZE + offset_x + CELL_SIZE // 2
         exit_cy = ey * CELL_SIZE + offset_y + CELL_SIZE // 2
         portal_radius = 22
+        renderer.add(
+            pygame.Rect(
+                exit_cx - portal_radius - 8,
+                exit_cy - portal_radius - 8,
+                portal_radius * 2 + 16,
+                portal_radius * 2 + 16,
+            )
+        )
         pulse = 0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.005)
         # Outer glow
         for i in range(6, 0, -1):
@@ -785,25 +934,34 @@ class Game:
             pygame.draw.circle(self.screen, (255, 255, 255), (sx, sy), 2)
         # Draw powerups on top of maze
         for powerup in self.powerups:
-            powerup.draw(self.screen, offset_x, offset_y)
+            renderer.add(powerup.draw(self.screen, offset_x, offset_y))
 
         # Draw monsters and player as before
-        for system in self.particle_systems:
-            system.draw(self.screen)
+        renderer.extend(self.particles.draw(self.screen))
         for monster in self.monsters:
-            monster.draw(self.screen, offset_x, offset_y)
-        self.player.draw(self.screen, offset_x, offset_y)
+            renderer.add(monster.draw(self.screen, offset_x, offset_y))
+        if self.swarm is not None:
+            renderer.extend(self.swarm.draw(self.screen, offset_x, offset_y))
+        renderer.add(self.player.draw(self.screen, offset_x, offset_y))
 
         # Draw UI (pass shake_x, shake_y)
-        self.draw_ui()
+        renderer.extend(self.draw_ui())
 
     def draw_ui(self, shake_x=0, shake_y=0):
+        """
+        Draw the HUD. Returns the rects it drew into.
+        """
         # --- Console/Terminal styled health bar at bottom left ---
         bar_width = 220
         bar_height = 18
         margin = 24
         bar_x = margin + shake_x
         bar_y = self.screen_height - bar_height - margin + shake_y
+        # The bar and shield label, down to the bottom of the screen; text
+        # rects are added as it is drawn
+        hud_rects = [
+            pygame.Rect(bar_x, bar_y - 48, bar_width, self.screen_height - bar_y + 48)
+        ]
 
         # Draw background (black, like a terminal)
         pygame.draw.rect(
@@ -824,14 +982,18 @@ class Game:
 
         # Draw time as terminal text at bottom left
         time_str = f"TIME: {int(self.game_time)}s"
-        time_text = self.term_font.render(time_str, True, (0, 255, 80))
-        self.screen.blit(time_text, (bar_x, bar_y + bar_height + 6))
+        time_text = self.text_cache.render(self.term_font, time_str, (0, 255, 80))
+        hud_rects.append(self.screen.blit(time_text, (bar_x, bar_y + bar_height + 6)))
 
         # Draw power-up status as terminal text
         if self.player.speed_boost:
             boost_str = f"SPEED BOOST: {int(self.player.speed_boost_timer)}s"
-            boost_text = self.term_font.render(boost_str, True, (255, 255, 0))
-            self.screen.blit(boost_text, (bar_x, bar_y + bar_height + 32))
+            boost_text = self.text_cache.render(
+                self.term_font, boost_str, (255, 255, 0)
+            )
+            hud_rects.append(
+                self.screen.blit(boost_text, (bar_x, bar_y + bar_height + 32))
+            )
 
         # Draw shield status as a large, clear label with timer and icon
         if hasattr(self.player, "shield") and self.player.shield:
@@ -841,8 +1003,9 @@ class Game:
                 self.screen, (0, 200, 255), shield_bg_rect, 2, border_radius=8
             )
             shield_str = f"SHIELD {int(self.player.shield_timer)}s"
-            shield_font = pygame.font.SysFont("Consolas", 28, bold=True)
-            shield_text = shield_font.render(shield_str, True, (0, 200, 255))
+            shield_text = self.text_cache.render(
+                self.term_font_small, shield_str, (0, 200, 255)
+            )
             # Draw a shield icon (blue with white border)
             shield_icon_x = bar_x + 24
             shield_icon_y = bar_y - 28
@@ -863,29 +1026,38 @@ class Game:
                     (shield_icon_x + 10, shield_icon_y),
                 ],
             )
-            self.screen.blit(shield_text, (bar_x + 48, bar_y - 42))
+            hud_rects.append(self.screen.blit(shield_text, (bar_x + 48, bar_y - 42)))
 
         # Storm warning/active as terminal text at bottom center
         if self.storm_warning:
             warning_str = "A DARK STORM IS COMING!"
-            warning_text = self.term_font_small.render(warning_str, True, (255, 80, 80))
-            self.screen.blit(
-                warning_text,
-                (
-                    self.screen_width // 2 - warning_text.get_width() // 2,
-                    self.screen_height - 80,
-                ),
+            warning_text = self.text_cache.render(
+                self.term_font_small, warning_str, (255, 80, 80)
+            )
+            hud_rects.append(
+                self.screen.blit(
+                    warning_text,
+                    (
+                        self.screen_width // 2 - warning_text.get_width() // 2,
+                        self.screen_height - 80,
+                    ),
+                )
             )
         if self.storm_active:
             storm_str = "DARK STORM!"
-            storm_text = self.term_font_med.render(storm_str, True, (255, 255, 80))
-            self.screen.blit(
-                storm_text,
-                (
-                    self.screen_width // 2 - storm_text.get_width() // 2,
-                    self.screen_height - 48,
-                ),
+            storm_text = self.text_cache.render(
+                self.term_font_med, storm_str, (255, 255, 80)
+            )
+            hud_rects.append(
+                self.screen.blit(
+                    storm_text,
+                    (
+                        self.screen_width // 2 - storm_text.get_width() // 2,
+                        self.screen_height - 48,
+                    ),
+                )
             )
+        return hud_rects
 
     def draw_title_screen(self):
         # Draw animated background
@@ -895,25 +1067,26 @@ class Game:
         if random.random() < 0.05:
             x = random.randint(0, self.screen_width)
             y = random.randint(0, self.screen_height)
-            self.particle_systems.append(
-                ParticleSystem(x, y, PARTICLE_COUNT, PARTICLE_LIFETIME)
-            )
+            self.particles.emit(x, y, PARTICLE_COUNT, PARTICLE_LIFETIME)
 
-        for system in self.particle_systems:
-            system.draw(self.screen)
+        self.particles.draw(self.screen)
 
         # Draw title with glow effect
-        title_text = self.title_font.render("MAZE RUNNER", True, (0, 200, 255))
+        title_text = self.text_cache.render(
+            self.title_font, "MAZE RUNNER", (0, 200, 255)
+        )
         glow = int(self.pulse_value * 64)
-        title_glow = self.title_font.render(
+        title_glow = self.text_cache.render(
+            self.title_font,
             "MAZE RUNNER",
-            True,
             (min(255, 0 + glow), min(255, 200 + glow), min(255, 255 + glow)),
         )
 
-        subtitle_text = self.font.render("Escape from AI", True, (200, 0, 255))
-        subtitle_glow = self.font.render(
-            "Escape from AI", True, (min(255, 200 + glow), 0, min(255, 255 + glow))
+        subtitle_text = self.text_cache.render(
+            self.font, "Escape from AI", (200, 0, 255)
+        )
+        subtitle_glow = self.text_cache.render(
+            self.font, "Escape from AI", (min(255, 200 + glow), 0, min(255, 255 + glow))
         )
 
         title_rect = title_text.get_rect(
@@ -930,13 +1103,13 @@ class Game:
 
         # Draw instructions with pulse effect
         alpha = int(128 + 127 * self.pulse_value)
-        instructions_text = self.font.render(
-            "Press any key to start", True, UI_TEXT_COLOR
+        instructions_text = self.text_cache.render(
+            self.font, "Press any key to start", UI_TEXT_COLOR
         )
         instructions_text.set_alpha(alpha)
 
-        controls_text = self.small_font.render(
-            "Use WASD or Arrow Keys to move", True, UI_TEXT_COLOR
+        controls_text = self.text_cache.render(
+            self.small_font, "Use WASD or Arrow Keys to move", UI_TEXT_COLOR
         )
         controls_text.set_alpha(alpha)
 
@@ -961,14 +1134,16 @@ class Game:
         self.screen.blit(overlay, (0, 0))
 
         # Draw game over text with terminal style
-        term_font = pygame.font.SysFont("Consolas", 48, bold=True)
-        died_text = term_font.render("YOU DIED!", True, (255, 80, 80))
+        died_text = self.text_cache.render(
+            self.term_font_big, "YOU DIED!", (255, 80, 80)
+        )
         died_rect = died_text.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2 - 40)
         )
         self.screen.blit(died_text, died_rect)
-        prompt_font = pygame.font.SysFont("Consolas", 28, bold=True)
-        prompt_text = prompt_font.render("Press R to restart", True, (255, 255, 80))
+        prompt_text = self.text_cache.render(
+            self.term_font_small, "Press R to restart", (255, 255, 80)
+        )
         prompt_rect = prompt_text.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2 + 40)
         )
@@ -983,11 +1158,11 @@ class Game:
         self.screen.blit(overlay, (0, 0))
 
         # Draw pause text with glow
-        pause_text = self.title_font.render("PAUSED", True, UI_TEXT_COLOR)
+        pause_text = self.text_cache.render(self.title_font, "PAUSED", UI_TEXT_COLOR)
         glow = int(self.pulse_value * 64)
-        pause_glow = self.title_font.render(
+        pause_glow = self.text_cache.render(
+            self.title_font,
             "PAUSED",
-            True,
             (
                 min(255, UI_TEXT_COLOR[0] + glow),
                 min(255, UI_TEXT_COLOR[1] + glow),
@@ -995,7 +1170,9 @@ class Game:
             ),
         )
 
-        continue_text = self.font.render("Press P to continue", True, UI_TEXT_COLOR)
+        continue_text = self.text_cache.render(
+            self.font, "Press P to continue", UI_TEXT_COLOR
+        )
 
         pause_rect = pause_text.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2 - 40)
@@ -1018,7 +1195,7 @@ class Game:
             "Press ESC to return to menu.",
         ]
         for i, line in enumerate(lines):
-            text = self.font.render(line, True, (220, 220, 220))
+            text = self.text_cache.render(self.font, line, (220, 220, 220))
             self.screen.blit(
                 text, (self.screen_width // 2 - text.get_width() // 2, 150 + i * 40)
             )
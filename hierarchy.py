@@ -0,0 +1,347 @@
+import heapq
+from array import array
+
+# Virtual abstract nodes for the start and goal cells of a query
+START = -2
+GOAL = -1
+
+
+class HierarchicalPlanner:
+    """
+    Hierarchical A* (HPA*) over a maze split into square clusters.
+
+    Every run of open cells facing each other across a cluster border gets
+    one entrance: a pair of abstract nodes, one on each side, joined by a
+    single step. The walking distances between the entrances of each
+    cluster, staying inside it, are computed once when the planner is
+    built. A query only searches its start and goal clusters cell by cell;
+    the rest of the route is found over the much smaller abstract graph,
+    and only its first few abstract steps are turned back into cells.
+
+    Cells are flat integer ids (y * width + x), as in pathfinding.py.
+    """
+
+    def __init__(self, maze, cluster_size=16):
+        self.width = maze.width
+        self.height = maze.height
+        self.cells = maze.cells
+        self.neighbor_offsets = maze.neighbor_offsets
+        self.neighbor_ids = maze.neighbor_ids
+        self.cluster_size = cluster_size
+        self.clusters_x = -(-maze.width // cluster_size)
+        # Cluster of every cell, row-major
+        row = array("i")
+        for x in range(maze.width):
+            row.append(x // cluster_size)
+        self.cluster_ids = array("i")
+        for y in range(maze.height):
+            offset = (y // cluster_size) * self.clusters_x
+            self.cluster_ids.extend([cluster + offset for cluster in row])
+        self.node_cells = []  # Node index -> flat cell id
+        self.node_edges = []  # Node index -> [(other node, cost)]
+        self.node_of = array("i", [-1]) * len(maze.cells)
+        self.cluster_nodes = {}  # Cluster -> its entrance nodes
+        self.expanded = 0  # Abstract nodes expanded by the last find_path call
+
+        self._find_entrances()
+        for cluster in self.cluster_nodes:
+            self._link_cluster(cluster)
+
+    def _add_node(self, cell):
+        node = self.node_of[cell]
+        if node == -1:
+            node = len(self.node_cells)
+            self.node_of[cell] = node
+            self.node_cells.append(cell)
+            self.node_edges.append([])
+            self.cluster_nodes.setdefault(self.cluster_ids[cell], []).append(node)
+        return node
+
+    def _find_entrances(self):
+        """
+        Add an entrance pair at the middle of every run of open cells that
+        face each other across a cluster border.
+        """
+        width = self.width
+        height = self.height
+        size = self.cluster_size
+        # Each border segment is (first cell, cells along it, step along it,
+        # step across it). Vertical borders: cell (x, y) faces (x + 1, y);
+        # horizontal borders: cell (x, y) faces (x, y + 1)
+        borders = [
+            (x, y_range, width, 1)
+            for x in range(size - 1, width - 1, size)
+            for y_range in self._segments(height)
+        ] + [
+            (y * width, x_range, 1, width)
+            for y in range(size - 1, height - 1, size)
+            for x_range in self._segments(width)
+        ]
+        for border in borders:
+            self._add_entrances(*border)
+
+    def _add_entrances(self, base, segment, along, across):
+        """
+        Add the entrance pairs of one border segment.
+        """
+        cells = self.cells
+        run = []
+        for position in list(segment) + [None]:
+            if position is not None:
+                cell = base + position * along
+                if cells[cell] == 0 and cells[cell + across] == 0:
+                    run.append(cell)
+                    continue
+            if run:
+                middle = run[len(run) // 2]
+                first = self._add_node(middle)
+                second = self._add_node(middle + across)
+                self.node_edges[first].append((second, 1))
+                self.node_edges[second].append((first, 1))
+                run = []
+
+    def _cluster_borders(self, cluster):
+        """
+        The border segments around one cluster, as in _find_entrances.
+        """
+        width = self.width
+        height = self.height
+        size = self.cluster_size
+        cluster_y, cluster_x = divmod(cluster, self.clusters_x)
+        left, top = cluster_x * size, cluster_y * size
+        rows = range(top, min(top + size, height))
+        columns = range(left, min(left + size, width))
+        borders = []
+        for x in (left - 1, left + size - 1):
+            if 0 <= x < width - 1:
+                borders.append((x, rows, width, 1))
+        for y in (top - 1, top + size - 1):
+            if 0 <= y < height - 1:
+                borders.append((y * width, columns, 1, width))
+        return borders
+
+    def _border_pairs(self, border):
+        """
+        Cells on the near side of a border segment whose entrance is paired
+        with the cell across it.
+        """
+        base, segment, along, across = border
+        node_of = self.node_of
+        pairs = set()
+        for position in segment:
+            cell = base + position * along
+            first, second = node_of[cell], node_of[cell + across]
+            if first != -1 and second != -1 and (second, 1) in self.node_edges[first]:
+                pairs.add(cell)
+        return pairs
+
+    def _unpair(self, first, second):
+        self.node_edges[first].remove((second, 1))
+        self.node_edges[second].remove((first, 1))
+
+    def _link_cluster(self, cluster):
+        """
+        Replace the edges between the entrances of one cluster with their
+        walking distances inside it.
+        """
+        cluster_ids = self.cluster_ids
+        nodes = self.cluster_nodes.get(cluster, [])
+        for node in nodes:
+            cell = self.node_cells[node]
+            distances, _ = self._cluster_search(cell)
+            edges = [
+                (other, cost)
+                for other, cost in self.node_edges[node]
+                if cluster_ids[self.node_cells[other]] != cluster
+            ]
+            for other in nodes:
+                if other != node and self.node_cells[other] in distances:
+                    edges.append((other, distances[self.node_cells[other]]))
+            self.node_edges[node] = edges
+
+    def cells_changed(self, changed):
+        """
+        Repair the graph after the given flat cells were opened or walled,
+        once the maze's adjacency index is up to date. The entrances around
+        each changed cell's cluster are found again, and the distances are
+        measured again inside it and inside any cluster whose entrances on
+        its borders moved.
+        """
+        cluster_ids = self.cluster_ids
+        node_of = self.node_of
+        clusters = set()
+        for cell in changed:
+            clusters.add(cluster_ids[cell])
+            for border in self._cluster_borders(cluster_ids[cell]):
+                base, segment, along, across = border
+                before = self._border_pairs(border)
+                for first in before:
+                    self._unpair(node_of[first], node_of[first + across])
+                self._add_entrances(*border)
+                # The cluster across only needs measuring again if its
+                # entrances on this border moved
+                if self._border_pairs(border) != before:
+                    clusters.add(cluster_ids[base + segment[0] * along])
+                    clusters.add(cluster_ids[base + segment[0] * along + across])
+
+        # Entrances left without a partner across a border are dropped
+        for cluster in clusters:
+            nodes = self.cluster_nodes.get(cluster, [])
+            for node in nodes:
+                if not any(
+                    cluster_ids[self.node_cells[other]] != cluster
+                    for other, _ in self.node_edges[node]
+                ):
+                    node_of[self.node_cells[node]] = -1
+                    self.node_edges[node] = []
+            nodes[:] = [node for node in nodes if self.node_edges[node]]
+        for cluster in clusters:
+            self._link_cluster(cluster)
+
+    def _segments(self, length):
+        """
+        Split 0..length into the ranges covered by each row or column of
+        clusters.
+        """
+        size = self.cluster_size
+        return [range(low, min(low + size, length)) for low in range(0, length, size)]
+
+    def _cluster_search(self, root):
+        """
+        Breadth-first search from root that stays inside root's cluster.
+        Returns (distances, parents), both keyed by flat cell id; following
+        parents from any reached cell leads back to root.
+        """
+        cluster_ids = self.cluster_ids
+        cluster = cluster_ids[root]
+        offsets = self.neighbor_offsets
+        neighbor_ids = self.neighbor_ids
+
+        distances = {root: 0}
+        parents = {root: root}
+        frontier = [root]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for cell in frontier:
+                for neighbor in neighbor_ids[offsets[cell] : offsets[cell + 1]]:
+                    if cluster_ids[neighbor] == cluster and neighbor not in distances:
+                        distances[neighbor] = distance
+                        parents[neighbor] = cell
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances, parents
+
+    def find_path(self, start, goal, refine_steps=None):
+        """
+        Find a path from start to goal. Returns a list of (x, y) cells
+        beginning at start, or [start] if the goal cannot be reached.
+
+        Only the first refine_steps abstract steps are expanded into cells
+        (all of them if refine_steps is None), so the path may stop short of
+        the goal; callers that only take the next step need very few.
+        """
+        width = self.width
+        start_id = start[1] * width + start[0]
+        goal_id = goal[1] * width + goal[0]
+        self.expanded = 0
+        if start_id == goal_id or self.cells[start_id] or self.cells[goal_id]:
+            return [start]
+
+        start_distances, start_parents = self._cluster_search(start_id)
+        goal_distances, goal_parents = self._cluster_search(goal_id)
+        # Entrances of the goal's cluster and their distance to the goal
+        goal_entries = {
+            node: goal_distances[self.node_cells[node]]
+            for node in self.cluster_nodes.get(self.cluster_ids[goal_id], ())
+            if self.node_cells[node] in goal_distances
+        }
+
+        gx, gy = goal
+        g_score = {}
+        parent = {}
+        open_set = []
+
+        def relax(node, g, previous):
+            best = g_score.get(node)
+            if best is None or g < best:
+                g_score[node] = g
+                parent[node] = previous
+                if node == GOAL:
+                    f = g
+                else:
+                    y, x = divmod(self.node_cells[node], width)
+                    f = g + abs(x - gx) + abs(y - gy)
+                heapq.heappush(open_set, (f, g, node))
+
+        if goal_id in start_distances:
+            relax(GOAL, start_distances[goal_id], START)
+        for node in self.cluster_nodes.get(self.cluster_ids[start_id], ()):
+            distance = start_distances.get(self.node_cells[node])
+            if distance is not None:
+                relax(node, distance, START)
+
+        closed = set()
+        while open_set:
+            f, g, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == GOAL:
+                return self._refine(
+                    parent, start_parents, goal_parents, start, refine_steps
+                )
+            closed.add(node)
+            self.expanded += 1
+
+            for other, cost in self.node_edges[node]:
+                if other not in closed:
+                    relax(other, g + cost, node)
+            if node in goal_entries:
+                relax(GOAL, g + goal_entries[node], node)
+        return [start]
+
+    def _refine(self, parent, start_parents, goal_parents, start, refine_steps):
+        """
+        Expand the first refine_steps abstract steps ending at GOAL into
+        cell steps.
+        """
+        chain = [GOAL]
+        while chain[-1] != START:
+            chain.append(parent[chain[-1]])
+        chain.reverse()
+        hops = list(zip(chain, chain[1:]))
+        if refine_steps is not None:
+            hops = hops[:refine_steps]
+
+        width = self.width
+        path = [start]
+        current = start[1] * width + start[0]
+        for first, second in hops:
+            if second == GOAL:
+                # The goal search's parents lead from here to the goal
+                segment = self._walk(goal_parents, current)[1:]
+            elif first == START:
+                segment = self._walk(start_parents, self.node_cells[second])
+                segment = segment[-2::-1]
+            else:
+                target = self.node_cells[second]
+                if self.cluster_ids[current] != self.cluster_ids[target]:
+                    segment = [target]  # Across a cluster border
+                else:
+                    _, parents = self._cluster_search(current)
+                    segment = self._walk(parents, target)[-2::-1]
+            path.extend((cell % width, cell // width) for cell in segment)
+            if segment:
+                current = segment[-1]
+        return path
+
+    def _walk(self, parents, cell):
+        """
+        Cells from cell back to the root of a cluster search, inclusive.
+        """
+        cells = [cell]
+        while parents[cell] != cell:
+            cell = parents[cell]
+            cells.append(cell)
+        return cells
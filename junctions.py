@@ -0,0 +1,286 @@
+import heapq
+from array import array
+
+# Virtual search nodes for a start or goal cell that sits inside a corridor
+START = -2
+GOAL = -1
+
+
+class JunctionGraph:
+    """
+    Weighted graph of a maze with its corridors collapsed.
+
+    Nodes are dead ends and junctions (open cells without exactly two open
+    neighbors). Edges are the corridors between them, weighted by their
+    length in steps. A corridor cell knows its edge and its position along
+    it, so a search can start or end in the middle of a corridor and the
+    result can be expanded back into cell steps.
+
+    Cells are flat integer ids (y * width + x), as in pathfinding.py.
+    """
+
+    def __init__(self, maze):
+        self.width = maze.width
+        size = len(maze.cells)
+        self.node_cells = []  # Node index -> flat cell id
+        self.node_edges = []  # Node index -> [(edge, other node, length, forward)]
+        self.node_of = array("i", [-1]) * size
+        self.edge_of = array("i", [-1]) * size
+        self.edge_pos = array("i", [0]) * size  # Steps from the edge's first node
+        self.edge_ends = []  # Edge -> (first node, last node)
+        self.edge_lengths = []
+        self.edge_cells = []  # Edge -> corridor cells from first to last node
+        self.expanded = 0  # Nodes expanded by the last find_path call
+
+        offsets = maze.neighbor_offsets
+        neighbor_ids = maze.neighbor_ids
+        cells = maze.cells
+        for cell in range(size):
+            if cells[cell] == 0 and offsets[cell + 1] - offsets[cell] != 2:
+                self._add_node(cell)
+        for node in range(len(self.node_cells)):
+            self._trace_edges(node, offsets, neighbor_ids)
+
+        # Loops made only of corridor cells have no junction on them; make
+        # one of their cells a node so they are still covered
+        for cell in range(size):
+            if cells[cell] == 0 and self.node_of[cell] == -1 and self.edge_of[cell] == -1:
+                self._trace_edges(self._add_node(cell), offsets, neighbor_ids)
+
+    def _add_node(self, cell):
+        self.node_of[cell] = len(self.node_cells)
+        self.node_cells.append(cell)
+        self.node_edges.append([])
+        return self.node_of[cell]
+
+    def _trace_edges(self, node, offsets, neighbor_ids):
+        """
+        Follow every corridor leaving node until it reaches another node.
+        """
+        node_cell = self.node_cells[node]
+        for first in neighbor_ids[offsets[node_cell] : offsets[node_cell + 1]]:
+            other = self.node_of[first]
+            if other != -1:
+                # Two nodes side by side; add the edge once
+                if not any(
+                    end == other and length == 1
+                    for _, end, length, _ in self.node_edges[node]
+                ):
+                    self._add_edge(node, other, [])
+                continue
+            if self.edge_of[first] != -1:
+                continue  # Already traced from its other end
+
+            corridor = []
+            previous, current = node_cell, first
+            while self.node_of[current] == -1:
+                corridor.append(current)
+                a, b = neighbor_ids[offsets[current] : offsets[current + 1]]
+                previous, current = current, (b if a == previous else a)
+            self._add_edge(node, self.node_of[current], corridor)
+
+    def _add_edge(self, first, last, corridor):
+        edge = len(self.edge_ends)
+        length = len(corridor) + 1
+        for position, cell in enumerate(corridor, 1):
+            self.edge_of[cell] = edge
+            self.edge_pos[cell] = position
+        self.edge_ends.append((first, last))
+        self.edge_lengths.append(length)
+        self.edge_cells.append(array("i", corridor))
+        self.node_edges[first].append((edge, last, length, True))
+        self.node_edges[last].append((edge, first, length, False))
+
+    def cells_changed(self, maze, changed):
+        """
+        Repair the graph after the given flat cells were opened or walled,
+        once the maze's adjacency index is up to date. Only the nodes and
+        corridors touching the changed cells and their neighbors are traced
+        again; nodes and edges that go away are left as unreachable entries.
+        """
+        offsets = maze.neighbor_offsets
+        neighbor_ids = maze.neighbor_ids
+        cells = maze.cells
+        width = self.width
+        size = len(cells)
+        touched = set()
+        for cell in changed:
+            touched.add(cell)
+            if cell % width > 0:
+                touched.add(cell - 1)
+            if cell % width < width - 1:
+                touched.add(cell + 1)
+            if cell >= width:
+                touched.add(cell - width)
+            if cell + width < size:
+                touched.add(cell + width)
+
+        # Drop every edge that runs through or ends at a touched cell
+        edges = set()
+        for cell in touched:
+            if self.edge_of[cell] != -1:
+                edges.add(self.edge_of[cell])
+            node = self.node_of[cell]
+            if node != -1:
+                edges.update(edge for edge, _, _, _ in self.node_edges[node])
+        ends = set()
+        freed = []
+        for edge in edges:
+            first, last = self.edge_ends[edge]
+            ends.update((first, last))
+            for cell in self.edge_cells[edge]:
+                self.edge_of[cell] = -1
+                freed.append(cell)
+            self.node_edges[first] = [e for e in self.node_edges[first] if e[0] != edge]
+            self.node_edges[last] = [e for e in self.node_edges[last] if e[0] != edge]
+            self.edge_ends[edge] = (-1, -1)
+
+        # Touched cells become or stop being nodes as their degree changed
+        for cell in touched:
+            is_node = cells[cell] == 0 and offsets[cell + 1] - offsets[cell] != 2
+            node = self.node_of[cell]
+            if node != -1 and not is_node:
+                self.node_of[cell] = -1
+                ends.discard(node)
+                freed.append(cell)
+            elif node == -1 and is_node:
+                ends.add(self._add_node(cell))
+        for node in ends:
+            self._trace_edges(node, offsets, neighbor_ids)
+
+        # As when building, a loop left without a junction gets a node
+        for cell in freed + list(touched):
+            if cells[cell] == 0 and self.node_of[cell] == -1 and self.edge_of[cell] == -1:
+                self._trace_edges(self._add_node(cell), offsets, neighbor_ids)
+
+    def find_path(self, start, goal):
+        """
+        Find a shortest path from start to goal with A* over the junction
+        graph. Returns a list of (x, y) cells including start and goal, or
+        [start] if the goal cannot be reached.
+        """
+        width = self.width
+        start_id = start[1] * width + start[0]
+        goal_id = goal[1] * width + goal[0]
+        self.expanded = 0
+        if start_id == goal_id:
+            return [start]
+
+        gx, gy = goal
+        g_score = {}
+        parent = {}  # Node -> (previous node, edge, walked forward)
+        open_set = []
+
+        def relax(node, g, via):
+            best = g_score.get(node)
+            if best is None or g < best:
+                g_score[node] = g
+                parent[node] = via
+                if node == GOAL:
+                    f = g
+                else:
+                    y, x = divmod(self.node_cells[node], width)
+                    f = g + abs(x - gx) + abs(y - gy)
+                heapq.heappush(open_set, (f, g, node))
+
+        # Where the goal can be entered from: its own node, or both ends of
+        # its corridor
+        target = self.node_of[goal_id]
+        goal_edge = self.edge_of[goal_id]
+        if target == -1:
+            if goal_edge == -1:
+                return [start]  # Wall
+            target = GOAL
+
+        start_node = self.node_of[start_id]
+        if start_node != -1:
+            relax(start_node, 0, (START, -1, True))
+        else:
+            edge = self.edge_of[start_id]
+            if edge == -1:
+                return [start]  # Wall
+            position = self.edge_pos[start_id]
+            first, last = self.edge_ends[edge]
+            relax(first, position, (START, edge, False))
+            relax(last, self.edge_lengths[edge] - position, (START, edge, True))
+            if edge == goal_edge:
+                # Straight along the shared corridor
+                goal_position = self.edge_pos[goal_id]
+                relax(
+                    GOAL,
+                    abs(goal_position - position),
+                    (START, edge, goal_position > position),
+                )
+
+        node_edges = self.node_edges
+        closed = set()
+        while open_set:
+            f, g, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == target:
+                return self._expand(parent, target, start, goal)
+            closed.add(node)
+            self.expanded += 1
+
+            for edge, other, length, forward in node_edges[node]:
+                # A dead end leads nowhere unless it is the goal itself
+                if other not in closed and (other == target or len(node_edges[other]) > 1):
+                    relax(other, g + length, (node, edge, forward))
+            if target == GOAL:
+                first, last = self.edge_ends[goal_edge]
+                goal_position = self.edge_pos[goal_id]
+                if node == first:
+                    relax(GOAL, g + goal_position, (node, goal_edge, True))
+                if node == last:
+                    relax(
+                        GOAL,
+                        g + self.edge_lengths[goal_edge] - goal_position,
+                        (node, goal_edge, False),
+                    )
+        return [start]
+
+    def _expand(self, parent, target, start, goal):
+        """
+        Turn the chain of graph hops ending at target into cell steps.
+        """
+        hops = []
+        node = target
+        while node != START:
+            previous, edge, forward = parent[node]
+            hops.append((previous, node, edge, forward))
+            node = previous
+        hops.reverse()
+
+        width = self.width
+        start_id = start[1] * width + start[0]
+        goal_id = goal[1] * width + goal[0]
+        path = [start]
+        for previous, node, edge, forward in hops:
+            if edge == -1:
+                continue  # Search began on the start node itself
+            length = self.edge_lengths[edge]
+            if previous == START:
+                position = self.edge_pos[start_id]
+            else:
+                position = 0 if forward else length
+            if node == GOAL:
+                end = self.edge_pos[goal_id]
+            else:
+                end = length if forward else 0
+            step = 1 if forward else -1
+            for position in range(position + step, end + step, step):
+                cell = self._cell_at(edge, position)
+                path.append((cell % width, cell // width))
+        return path
+
+    def _cell_at(self, edge, position):
+        """
+        Cell at a number of steps along an edge from its first node.
+        """
+        first, last = self.edge_ends[edge]
+        if position == 0:
+            return self.node_cells[first]
+        if position == self.edge_lengths[edge]:
+            return self.node_cells[last]
+        return self.edge_cells[edge][position - 1]
@@ -1,7 +1,7 @@
 import pygame
 import sys
 from game import Game
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, FPS, BACKGROUND_COLOR
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, FPS
 
 
 def main():
@@ -30,19 +30,17 @@ def main():
         # Update game state
         game.update()
 
-        # Clear the screen
-        screen.fill(BACKGROUND_COLOR)
-
-        # Draw the game
+        # Draw the game; it clears the screen itself when it redraws it all
         game.draw()
 
-        # Update the display
-        pygame.display.flip()
+        # Update the display, or only the parts of it that changed
+        game.renderer.present()
 
         # Control the frame rate
         clock.tick(FPS)
 
     # Clean up
+    game.close()
     pygame.quit()
     sys.exit()
 
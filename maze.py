@@ -1,107 +1,391 @@
+import heapq
 import random
+from array import array
+from itertools import accumulate
+from hierarchy import HierarchicalPlanner
+from junctions import JunctionGraph
+from pathfinding import PathCache, bfs_distances
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python paths give the same mazes
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Possible directions to carve: (dx, dy)
+DIRECTIONS = ((0, -2), (2, 0), (0, 2), (-2, 0))
 
 
 class Maze:
-    def __init__(self, width, height):
+    def __init__(self, width, height, vectorized=HAS_NUMPY):
         """
         Initialize a maze with given dimensions.
         Width and height should be odd numbers.
+        vectorized selects the NumPy backend for braiding and cell scans; a
+        given random seed produces the same maze either way.
         """
         self.width = width
         self.height = height
-        self.grid = self._generate_maze()
+        self.vectorized = vectorized and HAS_NUMPY
+        # One byte per cell, row-major; grid[y][x] reads through read-only
+        # per-row views of the same buffer
+        self.cells = self._generate_maze()
+        self.grid = self._make_grid()
+        # Braid the maze to add loops and multiple paths
+        self._braid_maze(braid_chance=0.12)
+        # Flat ids of every open cell in row-major order, shared by the
+        # placement steps below
+        self.path_cells = self._find_path_cells()
+        # Open neighbors of every cell in CSR form: the neighbors of cell i
+        # are neighbor_ids[neighbor_offsets[i]:neighbor_offsets[i + 1]]
+        self.neighbor_offsets, self.neighbor_ids = self._build_adjacency()
+        self.junction_graph = None  # Built on first use
+        self.hierarchy = None  # Built on first use
+        # Bumped whenever the grid changes, so cached paths can be dropped;
+        # changed_cells[v] is the (x, y) cell changed by edit v + 1, so
+        # planners can catch up on the edits since the version they saw
+        self.version = 0
+        self.changed_cells = []
+        self.path_cache = self._make_path_cache()
         self.start_pos, self.exit_pos = self._set_start_and_exit()
         self.powerup_positions = self._place_powerups()
 
+    @classmethod
+    def from_cells(cls, width, height, cells, vectorized=HAS_NUMPY):
+        """
+        Wrap an existing buffer of width * height cells, such as a shared
+        memory block, in a maze that supports pathfinding. Nothing is
+        generated or placed, so start, exit and power-ups are not set.
+        """
+        maze = cls.__new__(cls)
+        maze.width = width
+        maze.height = height
+        maze.vectorized = vectorized and HAS_NUMPY
+        maze.cells = cells
+        maze.grid = maze._make_grid()
+        maze.neighbor_offsets, maze.neighbor_ids = maze._build_adjacency()
+        maze.junction_graph = None
+        maze.hierarchy = None
+        maze.version = 0
+        maze.changed_cells = []
+        maze.path_cache = maze._make_path_cache()
+        return maze
+
+    def _make_grid(self):
+        """
+        Read-only views of each row of cells, so every write has to go
+        through set_cell and keep the derived indexes in step.
+        """
+        cells = memoryview(self.cells).toreadonly()
+        width = self.width
+        return [cells[y * width : (y + 1) * width] for y in range(self.height)]
+
+    def _make_path_cache(self):
+        """
+        Create the maze's LRU path cache, sized from the config.
+        """
+        from config import PATH_CACHE_SIZE
+
+        return PathCache(self, PATH_CACHE_SIZE)
+
     def _generate_maze(self):
         """
-        Generate a maze using recursive backtracking algorithm.
-        Return a 2D grid where:
+        Generate a maze using the recursive backtracking algorithm, run with
+        an explicit stack so large mazes do not hit the recursion limit.
+        Return a flat bytearray of width * height cells where:
             1 = wall
             0 = path
         """
+        width = self.width
+        height = self.height
         # Initialize grid with walls
-        grid = [[1 for _ in range(self.width)] for _ in range(self.height)]
-
-        # Helper function for recursive backtracking
-        def carve_passages(x, y, grid):
-            # Mark current cell as path
-            grid[y][x] = 0
-
-            # Define possible directions to move: (dx, dy)
-            directions = [(0, -2), (2, 0), (0, 2), (-2, 0)]
-            random.shuffle(directions)
-
-            # Try each direction
-            for dx, dy in directions:
-                new_x, new_y = x + dx, y + dy
-
-                # Check if the new position is within bounds and is a wall
-                if (
-                    0 < new_x < self.width - 1
-                    and 0 < new_y < self.height - 1
-                    and grid[new_y][new_x] == 1
-                ):
-                    # Carve passage by making the wall between current and new cell a path
-                    grid[y + dy // 2][x + dx // 2] = 0
-                    # Continue from the new cell
-                    carve_passages(new_x, new_y, grid)
+        cells = bytearray(b"\x01") * (width * height)
 
         # Start from a random cell (must be odd coordinates)
-        start_x = random.randrange(1, self.width - 1, 2)
-        start_y = random.randrange(1, self.height - 1, 2)
-        carve_passages(start_x, start_y, grid)
+        start_x = random.randrange(1, width - 1, 2)
+        start_y = random.randrange(1, height - 1, 2)
+        cells[start_y * width + start_x] = 0
 
-        # Braid the maze to add loops and multiple paths
-        self._braid_maze(grid, braid_chance=0.12)
-        return grid
+        # Each stack entry packs a cell id with the directions still to try
+        # from it, so the stack costs 8 bytes per cell of depth
+        stack = array("q", [(start_y * width + start_x) << 12 | self._shuffled_directions()])
 
-    def _braid_maze(self, grid, braid_chance=0.12):
+        while stack:
+            frame = stack[-1]
+            pending = frame & 0xFFF
+            if not pending:
+                # Every direction tried: backtrack
+                stack.pop()
+                continue
+            cell = frame >> 12
+            stack[-1] = cell << 12 | pending >> 3
+            dx, dy = DIRECTIONS[(pending & 7) - 1]
+            y, x = divmod(cell, width)
+            new_x, new_y = x + dx, y + dy
+
+            # Check if the new position is within bounds and is a wall
+            if (
+                0 < new_x < width - 1
+                and 0 < new_y < height - 1
+                and cells[new_y * width + new_x] == 1
+            ):
+                # Carve passage by making the wall between current and new cell a path
+                cells[(y + dy // 2) * width + x + dx // 2] = 0
+                cells[new_y * width + new_x] = 0
+                # Continue from the new cell
+                stack.append((new_y * width + new_x) << 12 | self._shuffled_directions())
+
+        return cells
+
+    def _shuffled_directions(self):
+        """
+        Shuffle the four carving directions and pack them three bits each
+        (index + 1), first direction to try in the lowest bits.
+        """
+        order = [0, 1, 2, 3]
+        random.shuffle(order)
+        packed = 0
+        for index in reversed(order):
+            packed = packed << 3 | (index + 1)
+        return packed
+
+    def _braid_maze(self, braid_chance=0.12):
         """
         Randomly remove some walls to create loops and multiple paths.
+
+        Cells are visited in row-major order and a wall with exactly two open
+        neighbors is opened with probability braid_chance. Opening a wall only
+        changes the counts of the cells to its right and below, so instead of
+        scanning every cell, the walls with two open neighbors are listed a
+        block of rows at a time and the cells touched by an opening are
+        queued and visited in order with them. The count is checked again
+        when each cell's turn comes.
+        """
+        if self.vectorized:
+            candidates = self._braid_candidates_numpy()
+        else:
+            candidates = self._braid_candidates()
+
+        width = self.width
+        cells = self.cells
+        last_x = width - 2
+        last_row = (self.height - 2) * width
+        rand = random.random
+        touched = []
+        candidate = next(candidates, None)
+        previous = -1
+        while candidate is not None or touched:
+            if touched and (candidate is None or touched[0] <= candidate):
+                cell = heapq.heappop(touched)
+            else:
+                cell = candidate
+                candidate = next(candidates, None)
+            if cell == previous:
+                continue
+            previous = cell
+
+            open_neighbors = (
+                (cells[cell - width] == 0)
+                + (cells[cell + width] == 0)
+                + (cells[cell - 1] == 0)
+                + (cells[cell + 1] == 0)
+            )
+            if open_neighbors == 2 and rand() < braid_chance:
+                cells[cell] = 0
+                if cell % width < last_x and cells[cell + 1] == 1:
+                    heapq.heappush(touched, cell + 1)
+                if cell < last_row and cells[cell + width] == 1:
+                    heapq.heappush(touched, cell + width)
+
+    def _braid_candidates(self):
+        """
+        Yield flat ids of inner walls with exactly two open neighbors, in
+        row-major order.
         """
+        width = self.width
+        cells = self.cells
         for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if grid[y][x] == 1:
-                    neighbors = []
-                    if grid[y - 1][x] == 0:
-                        neighbors.append((y - 1, x))
-                    if grid[y + 1][x] == 0:
-                        neighbors.append((y + 1, x))
-                    if grid[y][x - 1] == 0:
-                        neighbors.append((y, x - 1))
-                    if grid[y][x + 1] == 0:
-                        neighbors.append((y, x + 1))
-                    if len(neighbors) == 2 and random.random() < braid_chance:
-                        grid[y][x] = 0
+            row = y * width
+            for cell in range(row + 1, row + width - 1):
+                if cells[cell] == 1 and (
+                    (cells[cell - width] == 0)
+                    + (cells[cell + width] == 0)
+                    + (cells[cell - 1] == 0)
+                    + (cells[cell + 1] == 0)
+                ) == 2:
+                    yield cell
 
-    def _set_start_and_exit(self):
+    def _braid_candidates_numpy(self):
         """
-        Set random start and exit positions at opposite ends of the maze.
+        NumPy version of _braid_candidates: open-neighbor counts for a block
+        of rows at a time from four shifted views of the grid.
         """
-        # Find all valid path cells
-        path_cells = [
-            (x, y)
-            for y in range(self.height)
-            for x in range(self.width)
-            if self.grid[y][x] == 0
-        ]
+        width = self.width
+        grid = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, width)
+        block = max(1, 65536 // width)
+        for top in range(1, self.height - 1, block):
+            bottom = min(top + block, self.height - 1)
+            is_open = grid[top - 1 : bottom + 1] == 0
+            counts = (
+                is_open[:-2, 1:-1].astype(np.uint8)
+                + is_open[2:, 1:-1]
+                + is_open[1:-1, :-2]
+                + is_open[1:-1, 2:]
+            )
+            ys, xs = np.nonzero((counts == 2) & ~is_open[1:-1, 1:-1])
+            yield from ((ys + top) * width + xs + 1).tolist()
+
+    def _find_path_cells(self):
+        """
+        Flat ids (y * width + x) of all path cells in row-major order.
+        """
+        if self.vectorized:
+            return np.flatnonzero(np.frombuffer(self.cells, dtype=np.uint8) == 0)
+        return array("q", (i for i, cell in enumerate(self.cells) if cell == 0))
+
+    def _build_adjacency(self):
+        """
+        Build the CSR adjacency index over flat cell ids. Each open cell lists
+        its open neighbors left, up, down, right, i.e. in (x, y) order; walls
+        have no neighbors.
+        """
+        if self.vectorized:
+            return self._build_adjacency_numpy()
+
+        counts, neighbor_ids = self._adjacency_rows(0, len(self.cells))
+        offsets = array("i", [0])
+        offsets.extend(accumulate(counts))
+        return offsets, neighbor_ids
+
+    def _adjacency_rows(self, first, last):
+        """
+        Open neighbors of cells first to last - 1, in index order. Returns
+        (neighbor count of each cell, their neighbor ids one after another).
+        """
+        width = self.width
+        cells = self.cells
+        size = len(cells)
+        counts = []
+        neighbor_ids = array("i")
+        for cell in range(first, last):
+            before = len(neighbor_ids)
+            if cells[cell] == 0:
+                x = cell % width
+                if x > 0 and cells[cell - 1] == 0:
+                    neighbor_ids.append(cell - 1)
+                if cell >= width and cells[cell - width] == 0:
+                    neighbor_ids.append(cell - width)
+                if cell + width < size and cells[cell + width] == 0:
+                    neighbor_ids.append(cell + width)
+                if x < width - 1 and cells[cell + 1] == 0:
+                    neighbor_ids.append(cell + 1)
+            counts.append(len(neighbor_ids) - before)
+        return counts, neighbor_ids
+
+    def _patch_adjacency(self, cell):
+        """
+        Rebuild the CSR rows of cell and its four neighbors in place, from
+        the row above it to the row below it.
+        """
+        first = max(0, cell - self.width)
+        last = min(len(self.cells), cell + self.width + 1)
+        offsets = self.neighbor_offsets
+        counts, neighbor_ids = self._adjacency_rows(first, last)
+        start, end = offsets[first], offsets[last]
+        self.neighbor_ids[start:end] = neighbor_ids
+        for index, offset in enumerate(accumulate(counts, initial=start)):
+            offsets[first + index] = offset
+
+        # Every later row moves by the change in length
+        delta = len(neighbor_ids) - (end - start)
+        if delta and self.vectorized:
+            tail = np.frombuffer(offsets, dtype=np.int32)[last + 1 :]
+            tail += delta
+            del tail  # Let go of the buffer
+        elif delta:
+            offsets[last + 1 :] = array("i", map(delta.__add__, offsets[last + 1 :]))
+
+    def _build_adjacency_numpy(self):
+        """
+        NumPy version of _build_adjacency.
+        """
+        width = self.width
+        is_open = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, width) == 0
+        # has[y, x, k]: the k-th neighbor (left, up, down, right) is open
+        has = np.zeros((self.height, width, 4), dtype=bool)
+        has[:, 1:, 0] = is_open[:, 1:] & is_open[:, :-1]
+        has[1:, :, 1] = is_open[1:] & is_open[:-1]
+        has[:-1, :, 2] = is_open[:-1] & is_open[1:]
+        has[:, :-1, 3] = is_open[:, :-1] & is_open[:, 1:]
+        has = has.reshape(-1, 4)
+
+        ids = np.arange(len(self.cells), dtype=np.int32)[:, None]
+        neighbors = ids + np.array([-1, -width, width, 1], dtype=np.int32)
+        offsets = np.zeros(len(self.cells) + 1, dtype=np.int32)
+        np.cumsum(has.sum(axis=1), out=offsets[1:])
+        return (
+            array("i", offsets.tobytes()),
+            array("i", neighbors[has].astype(np.int32).tobytes()),
+        )
+
+    def set_cell(self, x, y, value):
+        """
+        Set a cell to 1 (wall) or 0 (path), patch the adjacency index and
+        any prepared search structures around it, and invalidate cached
+        paths. grid is read-only, so every change goes through here.
+        """
+        self.cells[y * self.width + x] = value
+        self.cells_written([(x, y)])
+
+    def cells_written(self, cells):
+        """
+        Bring the adjacency index, prepared search structures and version
+        up to date after the given (x, y) cells were written to the buffer,
+        by set_cell or by another process sharing it.
+        """
+        width = self.width
+        changed = [y * width + x for x, y in cells]
+        for cell in changed:
+            self._patch_adjacency(cell)
+        # Prepared structures are repaired around the changed cells only,
+        # so an edit costs about as much as a few corridors and clusters
+        if self.junction_graph is not None:
+            self.junction_graph.cells_changed(self, changed)
+        if self.hierarchy is not None:
+            self.hierarchy.cells_changed(changed)
+        self.changed_cells.extend(cells)
+        self.version += len(cells)
 
-        # Choose two distant cells
-        start_pos = random.choice(path_cells)
+    def use_buffer(self, buffer):
+        """
+        Copy the cells into buffer, such as a shared memory block, and keep
+        them there from now on.
+        """
+        buffer[: len(self.cells)] = self.cells
+        self.cells = buffer
+        self.grid = self._make_grid()
+        if self.hierarchy is not None:
+            self.hierarchy.cells = buffer
 
-        # Find the farthest cell from start (approximation)
-        farthest_cell = None
-        max_distance = 0
+    def _set_start_and_exit(self):
+        """
+        Pick a random start cell and put the exit on the path cell farthest
+        from it by walking distance.
+        """
+        width = self.width
 
-        for cell in path_cells:
-            # Manhattan distance
-            distance = abs(cell[0] - start_pos[0]) + abs(cell[1] - start_pos[1])
-            if distance > max_distance:
-                max_distance = distance
-                farthest_cell = cell
+        start_id = int(random.choice(self.path_cells))
+        start_pos = (start_id % width, start_id // width)
 
-        return start_pos, farthest_cell
+        # Walking distance from the start to every cell, kept for spawn
+        # placement and AI; the first farthest cell in row-major order wins
+        self.start_distances = bfs_distances(self, start_pos)
+        max_distance = max(self.start_distances)
+        if max_distance <= 0:
+            return start_pos, None
+        exit_id = self.start_distances.index(max_distance)
+        return start_pos, (exit_id % width, exit_id // width)
 
     def _place_powerups(self):
         """
@@ -109,21 +393,31 @@ class Maze:
         """
         from config import POWERUP_COUNT
 
+        width = self.width
+        excluded = [pos[1] * width + pos[0] for pos in (self.start_pos, self.exit_pos) if pos]
+
         # Find valid path cells excluding start and exit
-        path_cells = [
-            (x, y)
-            for y in range(self.height)
-            for x in range(self.width)
-            if self.grid[y][x] == 0
-            and (x, y) != self.start_pos
-            and (x, y) != self.exit_pos
+        if self.vectorized:
+            path_cells = self.path_cells[~np.isin(self.path_cells, excluded)]
+        else:
+            path_cells = [cell for cell in self.path_cells if cell not in excluded]
+
+        # Choose random positions for power-ups; sampling indices picks the
+        # same cells as sampling the cells themselves
+        count = min(len(path_cells), POWERUP_COUNT)
+        chosen = random.sample(range(len(path_cells)), count)
+        return [
+            (int(path_cells[i]) % width, int(path_cells[i]) // width) for i in chosen
         ]
 
-        # Choose random positions for power-ups
-        if len(path_cells) < POWERUP_COUNT:
-            return random.sample(path_cells, len(path_cells))
-        else:
-            return random.sample(path_cells, POWERUP_COUNT)
+    def distance_from_start(self, x, y):
+        """
+        Walking distance from the start to the given cell, or -1 for walls,
+        unreachable cells and positions outside the maze.
+        """
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            return -1
+        return self.start_distances[y * self.width + x]
 
     def is_wall(self, x, y):
         """
@@ -142,13 +436,51 @@ class Maze:
         """
         return not self.is_wall(x, y)
 
+    def prepare_pathfinding(self, mode):
+        """
+        Build the search structure the given PATHFINDING_MODE uses up front,
+        so the first monster query does not pay for it inside a frame.
+        """
+        if mode == "junction":
+            self.get_junction_graph()
+        elif mode == "hierarchical":
+            self.get_hierarchy()
+
+    def get_junction_graph(self):
+        """
+        Get the maze's junction graph (corridors collapsed into weighted
+        edges), building it the first time it is needed.
+        """
+        if self.junction_graph is None:
+            self.junction_graph = JunctionGraph(self)
+        return self.junction_graph
+
+    def get_hierarchy(self):
+        """
+        Get the maze's hierarchical (HPA*) planner, building its cluster
+        graph the first time it is needed.
+        """
+        from config import HPA_CLUSTER_SIZE
+
+        if self.hierarchy is None:
+            self.hierarchy = HierarchicalPlanner(self, HPA_CLUSTER_SIZE)
+        return self.hierarchy
+
     def get_neighbors(self, x, y):
         """
-        Get valid neighboring cells (for pathfinding).
+        Get valid neighboring cells (for pathfinding), in Up, Right, Down,
+        Left order.
         """
-        neighbors = []
-        for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:  # Up, Right, Down, Left
-            nx, ny = x + dx, y + dy
-            if self.is_valid_move(nx, ny):
-                neighbors.append((nx, ny))
-        return neighbors
+        if not 0 <= x < self.width or not 0 <= y < self.height:
+            return []
+        width = self.width
+        cell = y * width + x
+        # The index lists them left, up, down, right
+        neighbors = self.neighbor_ids[
+            self.neighbor_offsets[cell] : self.neighbor_offsets[cell + 1]
+        ]
+        return [
+            (x + dx, y + dy)
+            for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0))
+            if cell + dy * width + dx in neighbors
+        ]
@@ -1,7 +1,15 @@
-import pygame
-import heapq
-from config import CELL_SIZE, MONSTER_COLOR, MONSTER_MOVE_DELAY, MONSTER_BASE_SPEED
+from config import (
+    CELL_SIZE,
+    HPA_REFINE_STEPS,
+    MONSTER_COLOR,
+    MONSTER_MOVE_DELAY,
+    MONSTER_BASE_SPEED,
+    PATHFINDING_MODE,
+)
 import math
+from pathfinding import find_path
+from replanner import IncrementalPlanner
+from sprites import get_monster_frames
 
 
 class Monster:
@@ -11,6 +19,7 @@ class Monster:
         self.target_x = x
         self.target_y = y
         self.path = []
+        self.planner = None
         self.move_timer = 0
         self.frozen = False
         self.freeze_timer = 0
@@ -24,20 +33,11 @@ class Monster:
         self.animation_frame = 0
         self.animation_timer = 0
         self.animation_speed = 0.12  # seconds per frame
-        # Load spritesheet
-        self.spritesheet = pygame.image.load(
-            "assets/enemy_spritesheet.png"
-        ).convert_alpha()
-        self.frames = []
-        self.frame_size = self.spritesheet.get_height() // 5  # 5 columns
-        for i in range(5):  # 5 columns
-            # Add 1-pixel margin to avoid clipping
-            rect = pygame.Rect(
-                i * self.frame_size + 1, 1, self.frame_size - 2, self.frame_size - 2
-            )
-            self.frames.append(self.spritesheet.subsurface(rect))
-
-    def update(self, dt, player, maze):
+        # Frames for every facing, loaded and transformed once per process
+        self.facing_frames, self.frame_size = get_monster_frames()
+        self.frames = self.facing_frames["right"]
+
+    def update(self, dt, player, maze, player_field=None, scheduler=None):
         if self.frozen:
             self.freeze_timer -= dt
             if self.freeze_timer <= 0:
@@ -86,9 +86,27 @@ class Monster:
                 player_x = int(player.x + 0.5)
                 player_y = int(player.y + 0.5)
 
-                self.path = self._find_path_to_player(
-                    maze, (int(self.x), int(self.y)), (player_x, player_y)
-                )
+                start = (int(self.x), int(self.y))
+                if player_field is not None and player_field.root == (
+                    player_x,
+                    player_y,
+                ):
+                    # Shared player-rooted field: one lookup instead of a search
+                    next_pos = player_field.next_step(start)
+                    self.path = [start] if next_pos is None else [start, next_pos]
+                elif scheduler is not None:
+                    # Walk on along the last path and queue a replan from the
+                    # cell it leads to; the result is picked up next move
+                    if start in self.path:
+                        self.path = self.path[self.path.index(start) :]
+                    else:
+                        self.path = [start]
+                    next_cell = self.path[1] if len(self.path) > 1 else start
+                    scheduler.request(self, maze, next_cell, (player_x, player_y))
+                else:
+                    self.path = self._find_path_to_player(
+                        maze, start, (player_x, player_y)
+                    )
 
                 if len(self.path) > 1:
                     next_pos = self.path[1]
@@ -102,38 +120,32 @@ class Monster:
             self.pulse = 0
             self.pulse_direction = 1
 
-    def _find_path_to_player(self, maze, start, goal):
-        open_set = []
-        heapq.heappush(open_set, (0 + self._heuristic(start, goal), 0, start, [start]))
-        visited = set()
-
-        while open_set:
-            f, g, current, path = heapq.heappop(open_set)
-            if current == goal:
-                return path
-
-            visited.add(current)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-                if (
-                    0 <= neighbor[0] < maze.width
-                    and 0 <= neighbor[1] < maze.height
-                    and maze.grid[neighbor[1]][neighbor[0]] == 0
-                    and neighbor not in visited
-                ):
-                    heapq.heappush(
-                        open_set,
-                        (
-                            g + 1 + self._heuristic(neighbor, goal),
-                            g + 1,
-                            neighbor,
-                            path + [neighbor],
-                        ),
-                    )
-        return [start]
+    def replan(self, maze, start, goal):
+        """
+        Replace the monster's path with a fresh one from start to goal.
+        """
+        self.path = self._find_path_to_player(maze, start, goal)
 
-    def _heuristic(self, a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    def _find_path_to_player(self, maze, start, goal):
+        # Monsters on the same cell, or replanning before the player has
+        # moved, ask for the same path
+        path = maze.path_cache.get(start, goal)
+        if path is None:
+            path = self._search(maze, start, goal)
+            maze.path_cache.put(start, goal, path)
+        return path
+
+    def _search(self, maze, start, goal):
+        if PATHFINDING_MODE == "incremental":
+            # Keep the search tree between replans and only repair it
+            if self.planner is None or self.planner.maze is not maze:
+                self.planner = IncrementalPlanner(maze)
+            return self.planner.find_path(start, goal)
+        if PATHFINDING_MODE == "junction":
+            return maze.get_junction_graph().find_path(start, goal)
+        if PATHFINDING_MODE == "hierarchical":
+            return maze.get_hierarchy().find_path(start, goal, HPA_REFINE_STEPS)
+        return find_path(maze, start, goal)
 
     def freeze(self, duration):
         self.frozen = True
@@ -145,17 +157,10 @@ class Monster:
         screen_y = (
             int(self.y * CELL_SIZE + CELL_SIZE // 2 - self.frame_size // 4) + offset_y
         )
-        # Draw current animation frame
-        frame = self.frames[self.animation_frame]
-        # Flip or rotate based on facing
-        if self.facing == "left":
-            frame = pygame.transform.flip(frame, True, False)
-        elif self.facing == "up":
-            frame = pygame.transform.rotate(frame, 90)
-        elif self.facing == "down":
-            frame = pygame.transform.rotate(frame, -90)
+        # Draw current animation frame, pre-transformed for the facing
+        frame = self.facing_frames[self.facing][self.animation_frame]
         frame_rect = frame.get_rect(center=(screen_x, screen_y))
-        screen.blit(frame, frame_rect)
+        return screen.blit(frame, frame_rect)
 
         # Add animation effect when moving (energy particles)
         # if abs(self.x - self.target_x) > 0.01 or abs(self.y - self.target_y) > 0.01:
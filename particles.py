@@ -1,7 +1,18 @@
 import pygame
 import random
 import math
-from config import PARTICLE_COLORS
+from config import (
+    PARTICLE_ALPHA_LEVELS,
+    PARTICLE_COLORS,
+    PARTICLE_MAX_RECTS,
+    PARTICLE_SIZE_STEP,
+)
+
+try:
+    import numpy as np
+except ImportError:  # Game falls back to ParticleList without NumPy
+    np = None
+
 
 class Particle:
     def __init__(self, x, y, lifetime):
@@ -14,66 +25,298 @@ class Particle:
         self.angle = random.uniform(0, 2 * math.pi)
         self.size = random.uniform(2, 4)
         self.alpha = 255  # Initialize alpha value
-        
+
         # Calculate velocity components
         self.vx = math.cos(self.angle) * self.speed
         self.vy = math.sin(self.angle) * self.speed
-        
+
         # Add some gravity effect
         self.gravity = random.uniform(50, 100)
-    
+
     def update(self, dt):
         self.lifetime -= dt
         self.vy += self.gravity * dt
-        
+
         self.x += self.vx * dt
         self.y += self.vy * dt
-        
+
         # Fade out based on lifetime
         self.alpha = int((self.lifetime / self.max_lifetime) * 255)
-    
+
     def draw(self, screen):
         if self.lifetime <= 0:
             return
-        
-        # Create surface for particle with alpha
-        particle_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), 
-                                        pygame.SRCALPHA)
-        
-        # Draw particle with fade
-        color_with_alpha = (*self.color, self.alpha)
-        pygame.draw.circle(particle_surface, color_with_alpha,
-                         (int(self.size), int(self.size)), self.size)
-        
-        # Draw glow effect
-        glow_size = self.size * 2
-        glow_surface = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), 
-                                    pygame.SRCALPHA)
-        glow_alpha = int(self.alpha * 0.5)
-        pygame.draw.circle(glow_surface, (*self.color, glow_alpha),
-                         (int(glow_size), int(glow_size)), glow_size)
-        
-        # Blit both surfaces to screen
-        screen.blit(glow_surface, 
-                   (int(self.x - glow_size), int(self.y - glow_size)))
-        screen.blit(particle_surface, 
-                   (int(self.x - self.size), int(self.y - self.size)))
-
-class ParticleSystem:
-    def __init__(self, x, y, count, lifetime):
-        self.particles = []
-        for _ in range(count):
-            self.particles.append(Particle(x, y, lifetime))
-    
+        blits = []
+        add_particle_blits(blits, self.x, self.y, self.size, self.color, self.alpha)
+        screen.blits(blits, False)
+
+
+# Particle sprites, the glow with its core drawn over it, by (color, size
+# bucket, alpha bucket); rendered on first use and shared by every particle
+_sprite_cache = {}
+
+
+def get_particle_sprite(color, size_bucket, alpha_bucket):
+    """
+    The sprite for a particle of the given color whose size and alpha have
+    been rounded to the nearest bucket. It is centered on the particle.
+    """
+    key = (color, size_bucket, alpha_bucket)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        size = size_bucket * PARTICLE_SIZE_STEP
+        alpha = round(alpha_bucket * 255 / (PARTICLE_ALPHA_LEVELS - 1))
+
+        # Glow at twice the size and half the alpha
+        glow_size = size * 2
+        sprite = pygame.Surface((int(glow_size * 2), int(glow_size * 2)),
+                                pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, int(alpha * 0.5)),
+                           (int(glow_size), int(glow_size)), glow_size)
+
+        # Core circle at full particle alpha, blended over the glow
+        core = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(core, (*color, alpha), (int(size), int(size)), size)
+        sprite.blit(core, (int(glow_size) - int(size), int(glow_size) - int(size)))
+        # Run-length encode the transparent corners so blits skip them
+        sprite.set_alpha(255, pygame.RLEACCEL)
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def add_particle_blits(blits, x, y, size, color, alpha):
+    """
+    Append the blit of one particle to a blits list.
+    """
+    alpha_bucket = round(alpha * (PARTICLE_ALPHA_LEVELS - 1) / 255)
+    if alpha_bucket <= 0:
+        return
+    size_bucket = round(size / PARTICLE_SIZE_STEP)
+    glow_size = size_bucket * PARTICLE_SIZE_STEP * 2
+    sprite = get_particle_sprite(color, size_bucket, alpha_bucket)
+    blits.append((sprite, (int(x - glow_size), int(y - glow_size))))
+
+
+def merge_rects(rects):
+    """
+    Union runs of neighbouring rects so at most PARTICLE_MAX_RECTS remain.
+    Rects are in emit order, so a run is bursts emitted one after another.
+    """
+    if len(rects) <= PARTICLE_MAX_RECTS:
+        return rects
+    step = -(-len(rects) // PARTICLE_MAX_RECTS)
+    return [
+        rects[start].unionall(rects[start + 1 : start + step])
+        for start in range(0, len(rects), step)
+    ]
+
+
+class ParticleEngine:
+    """
+    Every live particle of every effect, stored as NumPy arrays, one entry
+    per particle.
+
+    Bursts are written into preallocated arrays that double when full.
+    Each frame, all live particles are integrated with one vectorized step
+    and dead ones are compacted away with a mask, keeping the live ones
+    packed at the front in the order they were emitted, so each burst is
+    one contiguous run.
+    """
+
+    FIELDS = ("x", "y", "vx", "vy", "gravity", "lifetime", "max_lifetime", "size")
+    COLUMNS = (*FIELDS, "color", "burst")
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        self.color = np.zeros(capacity, dtype=np.int8)  # Index into PARTICLE_COLORS
+        self.burst = np.zeros(capacity, dtype=np.int64)  # Which emit call
+        self.bursts = 0
+        # Sprites by key, for the size buckets seen so far, filled on first
+        # use so draw looks them all up with one index
+        self.sprite_sizes = 0
+        self.sprite_table = np.empty(0, dtype=object)
+        self.sprite_ready = np.zeros(0, dtype=bool)
+        self.rng = np.random.default_rng()
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, needed):
+        capacity = len(self.x)
+        while capacity < needed:
+            capacity *= 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def emit(self, x, y, count, lifetime):
+        """
+        Add a burst of count particles flying out from (x, y), with the same
+        random spread a Particle gets.
+        """
+        start = self.count
+        end = start + count
+        if end > len(self.x):
+            self._grow(end)
+        rng = self.rng
+        speed = rng.uniform(50, 150, count)
+        angle = rng.uniform(0, 2 * math.pi, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        self.gravity[start:end] = rng.uniform(50, 100, count)
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.size[start:end] = rng.uniform(2, 4, count)
+        self.color[start:end] = rng.integers(len(PARTICLE_COLORS), size=count)
+        self.burst[start:end] = self.bursts
+        self.bursts += 1
+        self.count = end
+
     def update(self, dt):
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
-    
+        """
+        Advance every live particle by dt seconds and drop the dead ones.
+        """
+        n = self.count
+        if not n:
+            return
+        self.lifetime[:n] -= dt
+        self.vy[:n] += self.gravity[:n] * dt
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+
+        alive = self.lifetime[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for name in self.COLUMNS:
+                values = getattr(self, name)
+                values[:live] = values[:n][alive]
+            self.count = live
+
+    def clear(self):
+        """
+        Drop every particle.
+        """
+        self.count = 0
+
+    def draw(self, screen):
+        """
+        Draw every live particle with cached sprites, in one batched blit
+        call. Returns the rects around each burst, at most
+        PARTICLE_MAX_RECTS of them.
+        """
+        n = self.count
+        if not n:
+            return []
+        # Fade out based on lifetime, as Particle.update does, then round
+        # alpha and size to their sprite buckets
+        alpha = (self.lifetime[:n] / self.max_lifetime[:n] * 255).astype(np.int64)
+        alpha_bucket = np.rint(alpha * (PARTICLE_ALPHA_LEVELS - 1) / 255).astype(
+            np.int64
+        )
+        visible = alpha_bucket > 0
+        if not visible.any():
+            return []
+        alpha_bucket = alpha_bucket[visible]
+        size_bucket = np.rint(self.size[:n][visible] / PARTICLE_SIZE_STEP).astype(
+            np.int64
+        )
+        color = self.color[:n][visible].astype(np.int64)
+        glow_size = size_bucket * PARTICLE_SIZE_STEP * 2
+        left = (self.x[:n][visible] - glow_size).astype(np.int64)
+        top = (self.y[:n][visible] - glow_size).astype(np.int64)
+
+        # Key every particle's sprite, then fetch from the cache only the
+        # keys this engine has not drawn before
+        sizes = int(size_bucket.max()) + 1
+        if sizes > self.sprite_sizes:
+            self.sprite_sizes = sizes
+            length = len(PARTICLE_COLORS) * sizes * PARTICLE_ALPHA_LEVELS
+            self.sprite_table = np.empty(length, dtype=object)
+            self.sprite_ready = np.zeros(length, dtype=bool)
+        sizes = self.sprite_sizes
+        keys = (color * sizes + size_bucket) * PARTICLE_ALPHA_LEVELS + alpha_bucket
+        ready = self.sprite_ready[keys]
+        if not ready.all():
+            for key in np.unique(keys[~ready]).tolist():
+                rest, alpha_step = divmod(key, PARTICLE_ALPHA_LEVELS)
+                color_index, size_step = divmod(rest, sizes)
+                self.sprite_table[key] = get_particle_sprite(
+                    PARTICLE_COLORS[color_index], size_step, alpha_step
+                )
+            self.sprite_ready[keys] = True
+        # Blit pairs are made lazily as blits consumes them, so thousands of
+        # tuples are never alive at once to set off the garbage collector
+        screen.blits(
+            zip(
+                self.sprite_table[keys].tolist(),
+                zip(left.tolist(), top.tolist()),
+            ),
+            False,
+        )
+
+        # One rect per burst, each burst being a run of equal burst numbers
+        right = left + (glow_size * 2).astype(np.int64)
+        bottom = top + (glow_size * 2).astype(np.int64)
+        burst = self.burst[:n][visible]
+        starts = np.flatnonzero(burst[1:] != burst[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+        if len(starts) > PARTICLE_MAX_RECTS:
+            starts = starts[:: -(-len(starts) // PARTICLE_MAX_RECTS)]
+        return [
+            pygame.Rect(x, y, r - x, b - y)
+            for x, y, r, b in zip(
+                np.minimum.reduceat(left, starts).tolist(),
+                np.minimum.reduceat(top, starts).tolist(),
+                np.maximum.reduceat(right, starts).tolist(),
+                np.maximum.reduceat(bottom, starts).tolist(),
+            )
+        ]
+
+
+class ParticleList:
+    """
+    Particle objects, one list per burst, with the same interface as
+    ParticleEngine, for when NumPy is not available.
+    """
+
+    def __init__(self):
+        self.bursts = []
+
+    def __len__(self):
+        return sum(map(len, self.bursts))
+
+    def emit(self, x, y, count, lifetime):
+        self.bursts.append([Particle(x, y, lifetime) for _ in range(count)])
+
+    def update(self, dt):
+        bursts = []
+        for burst in self.bursts:
+            for particle in burst:
+                particle.update(dt)
+            burst = [particle for particle in burst if particle.lifetime > 0]
+            if burst:
+                bursts.append(burst)
+        self.bursts = bursts
+
+    def clear(self):
+        self.bursts = []
+
     def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
-    
-    def is_finished(self):
-        return len(self.particles) == 0
\ No newline at end of file
+        rects = []
+        for burst in self.bursts:
+            blits = []
+            for particle in burst:
+                add_particle_blits(
+                    blits, particle.x, particle.y, particle.size, particle.color,
+                    particle.alpha,
+                )
+            drawn = screen.blits(blits)
+            if drawn:
+                rects.append(drawn[0].unionall(drawn))
+        return merge_rects(rects)
@@ -0,0 +1,206 @@
+import heapq
+from array import array
+from collections import OrderedDict
+
+
+def manhattan(a, b):
+    """
+    Manhattan distance between two (x, y) cells.
+    """
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def find_path(maze, start, goal):
+    """
+    Find the shortest path from start to goal using A*.
+
+    Cells are handled as flat integer ids (y * width + x). The search keeps
+    a best-g table, a closed set and one parent pointer per cell, so no
+    partial paths are copied while searching.
+
+    When several shortest paths exist, the lexicographically smallest one
+    (comparing the (x, y) cells from the start) is returned. Returns a list
+    of (x, y) cells including start and goal, or [start] if the goal cannot
+    be reached.
+    """
+    width = maze.width
+    offsets = maze.neighbor_offsets
+    neighbor_ids = maze.neighbor_ids
+    gx, gy = goal
+    start_id = start[1] * width + start[0]
+    goal_id = gy * width + gx
+
+    g_score = {start_id: 0}
+    parent = {start_id: -1}
+    closed = set()
+    open_set = [(manhattan(start, goal), 0, start_id)]
+
+    while open_set:
+        f, g, current = heapq.heappop(open_set)
+        if current in closed:
+            continue
+        if current == goal_id:
+            return _reconstruct_path(parent, current, width)
+        closed.add(current)
+
+        ng = g + 1
+        for neighbor in neighbor_ids[offsets[current] : offsets[current + 1]]:
+            if neighbor in closed:
+                continue
+            best = g_score.get(neighbor)
+            if best is None or ng < best:
+                g_score[neighbor] = ng
+                parent[neighbor] = current
+                ny, nx = divmod(neighbor, width)
+                heapq.heappush(
+                    open_set, (ng + abs(nx - gx) + abs(ny - gy), ng, neighbor)
+                )
+            elif ng == best and _path_precedes(parent, current, parent[neighbor], width):
+                # Equal cost: keep the lexicographically smaller route
+                parent[neighbor] = current
+    return [start]
+
+
+def _path_precedes(parent, a, b, width):
+    """
+    Check whether the path ending at cell a comes before the equally long
+    path ending at cell b, comparing (x, y) cells from the start.
+    """
+    # Walk both chains back to their common ancestor; the cells just after
+    # it are the first place where the two paths differ.
+    while True:
+        pa = parent[a]
+        pb = parent[b]
+        if pa == pb:
+            break
+        a, b = pa, pb
+    return (a % width, a // width) < (b % width, b // width)
+
+
+def _reconstruct_path(parent, cell, width):
+    """
+    Follow parent pointers back from cell and return the (x, y) path.
+    """
+    path = []
+    while cell != -1:
+        y, x = divmod(cell, width)
+        path.append((x, y))
+        cell = parent[cell]
+    path.reverse()
+    return path
+
+
+def bfs_distances(maze, root):
+    """
+    Breadth-first walking distances from root to every cell.
+
+    Returns a flat array indexed by y * width + x holding the number of steps
+    from root, or -1 for walls and unreachable cells. Runs in time linear in
+    the number of cells.
+    """
+    offsets = maze.neighbor_offsets
+    neighbor_ids = maze.neighbor_ids
+    distances = array("i", [-1]) * len(maze.cells)
+    root_id = root[1] * maze.width + root[0]
+    distances[root_id] = 0
+    frontier = [root_id]
+    distance = 0
+
+    # Expand one layer of equally distant cells at a time
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for current in frontier:
+            for neighbor in neighbor_ids[offsets[current] : offsets[current + 1]]:
+                if distances[neighbor] == -1:
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+
+class DistanceField:
+    """
+    Distance/flow field rooted at one cell, shared by every agent that walks
+    toward it.
+    """
+
+    def __init__(self, maze, root):
+        self.width = maze.width
+        self.neighbor_offsets = maze.neighbor_offsets
+        self.neighbor_ids = maze.neighbor_ids
+        self.root = root
+        self.distances = bfs_distances(maze, root)
+
+    def distance(self, cell):
+        """
+        Walking distance from cell to the root, or -1 if unreachable.
+        """
+        return self.distances[cell[1] * self.width + cell[0]]
+
+    def next_step(self, cell):
+        """
+        Return the neighbor of cell that is one step closer to the root, or
+        None if cell is the root or cannot reach it.
+
+        Neighbors are tried in (x, y) order, so the step is the same as the
+        second cell of find_path(maze, cell, root).
+        """
+        cell_id = cell[1] * self.width + cell[0]
+        distances = self.distances
+        target = distances[cell_id] - 1
+        if target < 0:
+            return None
+        # Adjacency rows are stored in (x, y) order
+        offsets = self.neighbor_offsets
+        for neighbor in self.neighbor_ids[offsets[cell_id] : offsets[cell_id + 1]]:
+            if distances[neighbor] == target:
+                return (neighbor % self.width, neighbor // self.width)
+        return None
+
+
+class PathCache:
+    """
+    Least-recently-used cache of paths keyed by (start, goal) cells.
+
+    Entries are only valid for one version of the maze grid: when the
+    maze's version counter changes, the whole cache is dropped on the next
+    lookup. Cached paths are shared between callers and must not be
+    modified.
+    """
+
+    def __init__(self, maze, capacity=256):
+        self.maze = maze
+        self.capacity = capacity
+        self.paths = OrderedDict()
+        self.version = maze.version
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version(self):
+        if self.version != self.maze.version:
+            self.paths.clear()
+            self.version = self.maze.version
+
+    def get(self, start, goal):
+        """
+        Return the cached path from start to goal, or None.
+        """
+        self._check_version()
+        path = self.paths.get((start, goal))
+        if path is None:
+            self.misses += 1
+            return None
+        self.paths.move_to_end((start, goal))
+        self.hits += 1
+        return path
+
+    def put(self, start, goal, path):
+        """
+        Cache a path, evicting the least recently used one if full.
+        """
+        self._check_version()
+        self.paths[(start, goal)] = path
+        self.paths.move_to_end((start, goal))
+        if len(self.paths) > self.capacity:
+            self.paths.popitem(last=False)
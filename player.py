@@ -9,7 +9,11 @@ from config import (
     MOVE_RIGHT,
 )
 import math
-import os
+from sprites import get_player_frames, get_player_variant
+
+# The invulnerability flash is drawn from this many cached intensity levels
+FLASH_LEVELS = 8
+
 
 class Player:
     def __init__(self, x, y):
@@ -41,67 +45,9 @@ class Player:
         self.animation_timer = 0
         self.animation_speed = 0.12  # seconds per frame
 
-        # Load all sprite frames
-        self.sprites = {
-            "up": {
-                "idle": [
-                    pygame.image.load(
-                        os.path.join("assets", "elf_back_idle", "elf_back_idle.png")
-                    ).convert_alpha()
-                ],
-                "walk": [
-                    pygame.image.load(
-                        os.path.join("assets", "elf_back_walk", f"elf_back_walk{i}.png")
-                    ).convert_alpha()
-                    for i in range(1, 9)
-                ],
-            },
-            "down": {
-                "idle": [
-                    pygame.image.load(
-                        os.path.join("assets", "elf_front_idle", "elf_front_idle.png")
-                    ).convert_alpha()
-                ],
-                "walk": [
-                    pygame.image.load(
-                        os.path.join(
-                            "assets", "elf_front_walk", f"elf_front_walk{i}.png"
-                        )
-                    ).convert_alpha()
-                    for i in range(1, 9)
-                ],
-            },
-            "right": {
-                "idle": [
-                    pygame.image.load(
-                        os.path.join("assets", "elf_side01_idle", "elf_side01_idle.png")
-                    ).convert_alpha()
-                ],
-                "walk": [
-                    pygame.image.load(
-                        os.path.join(
-                            "assets", "elf_side01_walk", f"elf_side01_walk{i}.png"
-                        )
-                    ).convert_alpha()
-                    for i in range(1, 9)
-                ],
-            },
-            "left": {
-                "idle": [
-                    pygame.image.load(
-                        os.path.join("assets", "elf_side02_idle", "elf_side02_idle.png")
-                    ).convert_alpha()
-                ],
-                "walk": [
-                    pygame.image.load(
-                        os.path.join(
-                            "assets", "elf_side02_walk", f"elf_side02_walk{i}.png"
-                        )
-                    ).convert_alpha()
-                    for i in range(1, 9)
-                ],
-            },
-        }
+        # Frames are loaded and scaled once per process and shared, as are
+        # their tinted and flashing variants
+        self.sprites = get_player_frames()
 
     def handle_event(self, event, maze):
         if event.type == pygame.KEYDOWN:
@@ -201,36 +147,25 @@ class Player:
     def draw(self, screen, offset_x=0, offset_y=0):
         screen_x = int(self.x * CELL_SIZE + CELL_SIZE // 2) + offset_x
         screen_y = int(self.y * CELL_SIZE + CELL_SIZE // 2) + offset_y
-        
+
         # Get the current frame
         frames = self.sprites[self.direction][self.state]
-        frame = frames[self.animation_frame % len(frames)]
-        scale = 1.5
-        new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
-        frame_scaled = pygame.transform.smoothscale(frame, new_size)
-        
-        # Create a copy for tinting
-        tinted_frame = frame_scaled.copy()
-        
-        # Calculate tint based on health
-        health_percentage = self.health / 100
-        tint_value = int(255 * health_percentage)
-        tint_surface = pygame.Surface(tinted_frame.get_size())
-        tint_surface.fill((tint_value, tint_value, tint_value))
-        
-        # Apply tint
-        tinted_frame.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_MULT)
-        
-        # Flash red during invulnerability
+        index = self.animation_frame % len(frames)
+        # Health moves in damage_per_hit steps
+        health = round(self.health / self.damage_per_hit) * self.damage_per_hit
+        flash_alpha = None
         if self.invulnerable:
-            flash = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.01))
-            flash_surface = pygame.Surface(tinted_frame.get_size(), pygame.SRCALPHA)
-            flash_surface.fill((255, 0, 0, flash))
-            tinted_frame.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-        
+            # Snap the pulsing flash to one of FLASH_LEVELS cached levels
+            flash = 128 + 127 * math.sin(pygame.time.get_ticks() * 0.01)
+            level = round(flash * (FLASH_LEVELS - 1) / 255)
+            flash_alpha = level * 255 // (FLASH_LEVELS - 1)
+
+        baked = get_player_variant(
+            self.direction, self.state, index, health, flash_alpha
+        )
+
         # Draw the tinted frame
-        frame_rect = tinted_frame.get_rect(center=(screen_x, screen_y))
-        screen.blit(tinted_frame, frame_rect)
+        return screen.blit(baked, baked.get_rect(center=(screen_x, screen_y)))
 
     def take_damage(self):
         if self.invulnerable:
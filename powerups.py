@@ -27,7 +27,8 @@ class PowerUp:
 
     def draw(self, screen, offset_x=0, offset_y=0):
         """
-        Draw the power-up.
+        Draw the power-up. Returns the rect of its glow, which covers
+        everything drawn.
         """
         # Calculate screen position (center of cell)
         screen_x = int(self.x * CELL_SIZE + CELL_SIZE // 2) + offset_x
@@ -41,10 +42,11 @@ class PowerUp:
         glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
         glow_color = (*self.color, 100)  # Semi-transparent
         pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-        screen.blit(glow_surf, (screen_x - glow_size, screen_y - glow_size))
+        rect = screen.blit(glow_surf, (screen_x - glow_size, screen_y - glow_size))
 
         # Draw power-up
         pygame.draw.circle(screen, self.color, (screen_x, screen_y), size)
+        return rect
 
 
 class SpeedPowerUp(PowerUp):
@@ -58,7 +60,7 @@ class SpeedPowerUp(PowerUp):
         """
         Draw speed power-up with lightning bolt symbol.
         """
-        super().draw(screen, offset_x, offset_y)
+        rect = super().draw(screen, offset_x, offset_y)
 
         # Calculate screen position
         screen_x = int(self.x * CELL_SIZE + CELL_SIZE // 2) + offset_x
@@ -75,6 +77,7 @@ class SpeedPowerUp(PowerUp):
         ]
 
         pygame.draw.polygon(screen, (0, 0, 0), bolt_points)
+        return rect
 
 
 class FreezePowerUp(PowerUp):
@@ -86,7 +89,7 @@ class FreezePowerUp(PowerUp):
 
     def draw(self, screen, offset_x=0, offset_y=0):
         # Draw base blue circle with glow
-        super().draw(screen, offset_x, offset_y)
+        rect = super().draw(screen, offset_x, offset_y)
         screen_x = int(self.x * CELL_SIZE + CELL_SIZE // 2) + offset_x
         screen_y = int(self.y * CELL_SIZE + CELL_SIZE // 2) + offset_y
         # Draw shield icon (blue with white border)
@@ -107,3 +110,4 @@ class FreezePowerUp(PowerUp):
                 (screen_x + 7, screen_y),
             ],
         )
+        return rect
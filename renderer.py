@@ -0,0 +1,70 @@
+import pygame
+
+
+class DirtyRenderer:
+    """
+    Pushes only the parts of the screen that changed to the display.
+
+    Each frame, everything drawn marks the rect it covered. On an
+    incremental frame the rects marked last frame are first restored from
+    the cached background, everything is drawn again on top, and only the
+    old and new rects are sent with pygame.display.update. A frame is drawn
+    in full, and flipped, whenever its kind differs from the last frame's:
+    on state changes, storms, transitions and a new maze.
+    """
+
+    def __init__(self, screen, enabled=True):
+        self.screen = screen
+        self.enabled = enabled
+        self.kind = None  # Kind of the last frame; None is never incremental
+        self.incremental = False
+        self.previous = []  # Rects drawn last frame
+        self.current = []  # Rects drawn this frame
+        self.full_frames = 0
+        self.incremental_frames = 0
+
+    def begin(self, kind):
+        """
+        Start a frame of the given kind, or None for a frame that must be
+        drawn in full. Returns whether the frame is incremental.
+        """
+        self.incremental = self.enabled and kind is not None and kind == self.kind
+        self.kind = kind
+        if not self.incremental:
+            self.previous = []
+        self.current = []
+        return self.incremental
+
+    def restore(self, background):
+        """
+        Copy the background over everything drawn last frame.
+        """
+        screen = self.screen
+        for rect in self.previous:
+            screen.blit(background, rect, rect)
+
+    def add(self, rect):
+        """
+        Mark a rect drawn this frame.
+        """
+        if rect:
+            self.current.append(rect)
+
+    def extend(self, rects):
+        """
+        Mark several rects drawn this frame.
+        """
+        self.current.extend(rect for rect in rects if rect)
+
+    def present(self):
+        """
+        Send the frame to the display.
+        """
+        if self.incremental:
+            pygame.display.update(self.previous + self.current)
+            self.incremental_frames += 1
+        else:
+            pygame.display.flip()
+            self.full_frames += 1
+        self.previous = self.current
+        self.current = []
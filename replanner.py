@@ -0,0 +1,199 @@
+import heapq
+
+
+class IncrementalPlanner:
+    """
+    A* search tree rooted at a moving agent that is kept between queries and
+    repaired instead of rebuilt (fringe-retrieving incremental A*).
+
+    - When the goal moves, the expanded region is reused as-is: if the new
+      goal is already expanded its path is returned without any search,
+      otherwise the saved open list is re-keyed and the search resumes.
+    - When the agent steps to a cell inside the tree, the subtree below that
+      cell is kept (its g-values are all off by the same constant, which
+      does not change the search order) and only the branches left behind
+      are deleted.
+    - When a cell turns into a wall, only the subtree hanging off it is
+      deleted; the cells around the hole are reopened and the search refills
+      it on the next query. Walls changed with Maze.set_cell are picked up
+      from the maze's edit log at the start of the next query.
+
+    Cells are flat integer ids (y * width + x), as in pathfinding.py.
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.width = maze.width
+        self.expanded = 0  # Cells expanded by the last find_path call
+        self.version = maze.version  # Maze edits already repaired
+        self.reset()
+
+    def reset(self):
+        """
+        Throw away all search state.
+        """
+        self.root = None
+        self.goal = None
+        self.g = {}
+        self.parent = {}
+        self.children = {}
+        self.closed = set()
+        self.open = set()
+        self.heap = []
+
+    def find_path(self, start, goal):
+        """
+        Return a shortest path from start to goal as a list of (x, y) cells,
+        or [start] if the goal cannot be reached.
+        """
+        width = self.width
+        start_id = start[1] * width + start[0]
+        goal_id = goal[1] * width + goal[0]
+        self.expanded = 0
+
+        if self.version != self.maze.version:
+            for cell in self.maze.changed_cells[self.version :]:
+                self.cell_changed(cell)
+            self.version = self.maze.version
+        if start_id != self.root:
+            self._move_root(start_id)
+        if goal != self.goal:
+            self.goal = goal
+            self._rekey_open()
+
+        if goal_id not in self.closed and not self._search(goal_id):
+            return [start]
+        return self._path_to(goal_id)
+
+    def cell_changed(self, cell):
+        """
+        Repair the search after the maze cell at (x, y) changed.
+        """
+        x, y = cell
+        cell_id = y * self.width + x
+        if self.maze.grid[y][x] == 0:
+            # Opening a cell can shorten paths anywhere in the tree
+            self.reset()
+        elif cell_id in self.g:
+            if cell_id == self.root:
+                self.reset()
+            else:
+                self._delete_subtree(cell_id)
+
+    def _move_root(self, start_id):
+        if start_id not in self.closed:
+            # Not settled in the old tree, so nothing below it can be reused
+            self.reset()
+            self.root = start_id
+            self.g[start_id] = 0
+            self.parent[start_id] = -1
+            self.open.add(start_id)
+            return
+
+        # Distances inside the new root's subtree only shift by a constant
+        old_root = self.root
+        self._detach(start_id)
+        self.parent[start_id] = -1
+        self.root = start_id
+        self._delete_subtree(old_root)
+
+    def _detach(self, cell):
+        siblings = self.children.get(self.parent[cell])
+        if siblings is not None:
+            siblings.discard(cell)
+
+    def _delete_subtree(self, cell):
+        """
+        Remove cell and all of its descendants from the tree, then reopen the
+        expanded cells that bordered them so the gap is searched again.
+        """
+        self._detach(cell)
+        removed = []
+        stack = [cell]
+        while stack:
+            current = stack.pop()
+            removed.append(current)
+            stack.extend(self.children.pop(current, ()))
+            del self.g[current]
+            del self.parent[current]
+            self.closed.discard(current)
+            self.open.discard(current)
+
+        for current in removed:
+            for neighbor in self._neighbors(current):
+                if neighbor in self.closed:
+                    self.closed.discard(neighbor)
+                    self.open.add(neighbor)
+                    self._push(neighbor)
+
+    def _rekey_open(self):
+        # The heuristic points at the goal, so a new goal re-keys the open list
+        gx, gy = self.goal
+        width = self.width
+        g = self.g
+        self.heap = []
+        for cell in self.open:
+            y, x = divmod(cell, width)
+            self.heap.append((g[cell] + abs(x - gx) + abs(y - gy), g[cell], cell))
+        heapq.heapify(self.heap)
+
+    def _push(self, cell):
+        y, x = divmod(cell, self.width)
+        g = self.g[cell]
+        heapq.heappush(
+            self.heap, (g + abs(x - self.goal[0]) + abs(y - self.goal[1]), g, cell)
+        )
+
+    def _neighbors(self, cell):
+        offsets = self.maze.neighbor_offsets
+        return self.maze.neighbor_ids[offsets[cell] : offsets[cell + 1]]
+
+    def _search(self, goal_id):
+        """
+        Resume A* until goal_id is expanded. Returns False if it is unreachable.
+        """
+        heap = self.heap
+        g_score = self.g
+        parent = self.parent
+        children = self.children
+        closed = self.closed
+        open_set = self.open
+        gx, gy = self.goal
+        width = self.width
+
+        while heap:
+            f, g, current = heapq.heappop(heap)
+            if current not in open_set or g_score[current] != g:
+                continue  # Stale entry
+            open_set.discard(current)
+            closed.add(current)
+            self.expanded += 1
+
+            ng = g + 1
+            for neighbor in self._neighbors(current):
+                best = g_score.get(neighbor)
+                if best is not None and best <= ng:
+                    continue
+                if best is not None:
+                    children[parent[neighbor]].discard(neighbor)
+                    closed.discard(neighbor)
+                g_score[neighbor] = ng
+                parent[neighbor] = current
+                children.setdefault(current, set()).add(neighbor)
+                open_set.add(neighbor)
+                y, x = divmod(neighbor, width)
+                heapq.heappush(heap, (ng + abs(x - gx) + abs(y - gy), ng, neighbor))
+            # The goal is only reported once its neighbors have been relaxed,
+            # so every closed cell stays settled for later queries
+            if current == goal_id:
+                return True
+        return False
+
+    def _path_to(self, cell):
+        path = []
+        while cell != -1:
+            y, x = divmod(cell, self.width)
+            path.append((x, y))
+            cell = self.parent[cell]
+        path.reverse()
+        return path
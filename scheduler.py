@@ -0,0 +1,73 @@
+import time
+
+
+class ReplanScheduler:
+    """
+    Queue of monster replan requests served within a per-frame time budget.
+
+    Each monster has at most one pending request: a newer one replaces it
+    in place, so the monster keeps its turn in the queue. A request is
+    dropped as stale if, by the time it is served, the monster is no longer
+    heading for the cell the search would start from. Monsters keep
+    walking their last path until a result arrives.
+    """
+
+    def __init__(self, budget_ms):
+        self.budget_ms = budget_ms
+        self.pending = {}  # Monster -> (maze, start, goal), in request order
+        self.queue_depth = 0  # Requests left waiting after the last frame
+        self.used_ms = 0.0  # Time spent serving requests in the last frame
+        self.served = 0
+        self.dropped = 0
+        # Totals and peaks over every frame, for report
+        self.frames = 0
+        self.total_ms = 0.0
+        self.peak_ms = 0.0
+        self.peak_queue_depth = 0
+
+    def request(self, monster, maze, start, goal):
+        """
+        Queue a replan for monster from start to goal, replacing any request
+        it already has waiting.
+        """
+        if monster in self.pending:
+            self.dropped += 1
+        self.pending[monster] = (maze, start, goal)
+
+    def run(self):
+        """
+        Serve queued requests in order until this frame's budget is spent.
+        At least one request is served per frame so the queue always moves,
+        even if a single search takes longer than the budget.
+        """
+        began = time.perf_counter()
+        deadline = began + self.budget_ms / 1000
+        served_any = False
+        while self.pending:
+            if served_any and time.perf_counter() >= deadline:
+                break
+            monster = next(iter(self.pending))
+            maze, start, goal = self.pending.pop(monster)
+            if (monster.target_x, monster.target_y) != start:
+                self.dropped += 1
+                continue
+            monster.replan(maze, start, goal)
+            self.served += 1
+            served_any = True
+        self.queue_depth = len(self.pending)
+        self.used_ms = (time.perf_counter() - began) * 1000
+        self.frames += 1
+        self.total_ms += self.used_ms
+        self.peak_ms = max(self.peak_ms, self.used_ms)
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+
+    def report(self):
+        """
+        One-line summary of requests served and budget use so far.
+        """
+        average = self.total_ms / self.frames if self.frames else 0.0
+        return (
+            f"{self.served} replans served, {self.dropped} dropped, queue depth "
+            f"peak {self.peak_queue_depth}; {average:.2f} ms/frame average and "
+            f"{self.peak_ms:.2f} ms peak of a {self.budget_ms} ms budget"
+        )
@@ -0,0 +1,57 @@
+class CellIndex:
+    """
+    Spatial hash of entities by the maze cell they are in.
+
+    Each cell keeps its entities in a dict used as an insertion-ordered
+    set, so adding, moving and removing an entity and looking up a cell
+    are all O(1). Iterating the index yields every entity in the order it
+    was added.
+    """
+
+    def __init__(self):
+        self.buckets = {}  # (x, y) -> {entity: None}
+        self.cells = {}  # Entity -> (x, y)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def add(self, entity, cell):
+        """
+        Add an entity in the given (x, y) cell.
+        """
+        self.cells[entity] = cell
+        self.buckets.setdefault(cell, {})[entity] = None
+
+    def move(self, entity, cell):
+        """
+        Record that an entity is now in cell; cheap when it has not left
+        its old one.
+        """
+        old_cell = self.cells[entity]
+        if old_cell == cell:
+            return
+        self._discard(entity, old_cell)
+        self.add(entity, cell)
+
+    def remove(self, entity):
+        """
+        Remove an entity from the index.
+        """
+        self._discard(entity, self.cells.pop(entity))
+
+    def _discard(self, entity, cell):
+        bucket = self.buckets[cell]
+        del bucket[entity]
+        if not bucket:
+            del self.buckets[cell]
+
+    def at(self, cell):
+        """
+        Entities in the given (x, y) cell, as a list that is safe to keep
+        while the index changes.
+        """
+        bucket = self.buckets.get(cell)
+        return list(bucket) if bucket else []
@@ -0,0 +1,268 @@
+import json
+import mmap
+import os
+import struct
+import time
+
+import pygame
+from config import ATLAS_PATH
+
+# Atlas file layout: magic, little-endian uint32 index length, JSON index
+# of path -> [offset, width, height, PNG mtime_ns, PNG size], then raw RGBA
+# pixels at each offset
+ATLAS_MAGIC = b"MZATLAS2"
+ATLAS_HEADER = struct.Struct("<8sI")
+ATLAS_ALIGN = 16
+
+
+class AssetRegistry:
+    """
+    Process-wide cache of images.
+
+    Each image is loaded and converted with convert_alpha exactly once;
+    later requests get the same shared Surface, so callers must not draw
+    onto it. Images are read from the packed atlas when there is one,
+    straight from its memory-mapped pixels without PNG decoding, and from
+    their PNG files otherwise, or when the PNG has changed since the atlas
+    was built. Load counts and time spent loading are kept for reporting.
+    """
+
+    def __init__(self, atlas_path=None):
+        self.atlas_path = atlas_path
+        self.atlas = None  # Memory-mapped atlas file, once opened
+        self.atlas_index = None  # Path -> (offset, width, height, mtime_ns, size)
+        self.images = {}  # Path -> Surface
+        self.loads = 0
+        self.atlas_loads = 0  # How many of the loads came from the atlas
+        self.hits = 0
+        self.load_time = 0.0  # Seconds spent reading and converting images
+
+    def _open_atlas(self):
+        """
+        Memory-map the atlas and read its index, or fall back to PNG files
+        if there is no usable atlas.
+        """
+        self.atlas_index = {}
+        if not self.atlas_path or not os.path.exists(self.atlas_path):
+            return
+        with open(self.atlas_path, "rb") as file:
+            atlas = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = ATLAS_HEADER.unpack_from(atlas)
+        if magic != ATLAS_MAGIC:
+            print(f"Warning: {self.atlas_path} is not a sprite atlas; using PNGs")
+            atlas.close()
+            return
+        start = ATLAS_HEADER.size
+        index = json.loads(atlas[start : start + index_length])
+        self.atlas = atlas
+        self.atlas_index = {path: tuple(entry) for path, entry in index.items()}
+
+    def image(self, *parts):
+        """
+        Get the image at the path joined from parts, loading it on first use.
+        """
+        path = "/".join(parts)
+        surface = self.images.get(path)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        began = time.perf_counter()
+        if self.atlas_index is None:
+            self._open_atlas()
+        entry = self.atlas_index.get(path)
+        if entry is not None and self._stale(path, entry):
+            print(f"Warning: {path} changed since the atlas was built; using the PNG")
+            entry = None
+        if entry is not None:
+            offset, width, height = entry[:3]
+            pixels = memoryview(self.atlas)[offset : offset + width * height * 4]
+            surface = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+            # convert_alpha copies the pixels, so the view can be let go
+            surface = surface.convert_alpha()
+            pixels.release()
+            self.atlas_loads += 1
+        else:
+            surface = pygame.image.load(path).convert_alpha()
+        self.load_time += time.perf_counter() - began
+        self.loads += 1
+        self.images[path] = surface
+        return surface
+
+    @staticmethod
+    def _stale(path, entry):
+        """
+        Whether the PNG at path no longer matches the one packed as entry.
+        An atlas shipped without its PNGs is never stale.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) != tuple(entry[3:])
+
+    def report(self):
+        """
+        One-line summary of the registry's loads and hits.
+        """
+        return (
+            f"{self.loads} images loaded in {self.load_time * 1000:.1f} ms "
+            f"({self.atlas_loads} from the atlas), {self.hits} served from cache"
+        )
+
+
+def write_atlas(path, root="assets"):
+    """
+    Pack every PNG under root into an atlas file at path. Keys are the
+    paths the registry is asked for, e.g. "assets/enemy_spritesheet.png".
+    Returns the number of images packed.
+    """
+    images = []
+    index = {}
+    for folder, _, files in sorted(os.walk(root)):
+        for name in sorted(files):
+            if name.lower().endswith(".png"):
+                image_path = "/".join(os.path.join(folder, name).split(os.sep))
+                stat = os.stat(image_path)
+                image = pygame.image.load(image_path)
+                images.append((image_path, image))
+                index[image_path] = [
+                    0, *image.get_size(), stat.st_mtime_ns, stat.st_size
+                ]
+
+    # Offsets depend on the index length, which depends on the offsets, so
+    # lay out pixels after an index of the last measured length until the
+    # index fits in it; it only grows, so this settles in a pass or two
+    index_length = 0
+    while True:
+        offset = _align(ATLAS_HEADER.size + index_length)
+        for image_path, image in images:
+            index[image_path][0] = offset
+            width, height = image.get_size()
+            offset = _align(offset + width * height * 4)
+        length = len(json.dumps(index).encode())
+        if length <= index_length:
+            break
+        index_length = length
+    index_bytes = json.dumps(index).encode().ljust(index_length)
+    assert len(index_bytes) == index_length
+
+    with open(path, "wb") as file:
+        file.write(ATLAS_HEADER.pack(ATLAS_MAGIC, index_length))
+        file.write(index_bytes)
+        for image_path, image in images:
+            file.seek(index[image_path][0])
+            file.write(pygame.image.tobytes(image, "RGBA"))
+    return len(images)
+
+
+def _align(offset):
+    return (offset + ATLAS_ALIGN - 1) // ATLAS_ALIGN * ATLAS_ALIGN
+
+
+# The registry shared by the whole process; surfaces need a display, so
+# nothing is loaded until first use
+assets = AssetRegistry(ATLAS_PATH)
+
+# Derived frame sets, built from registry images on first use
+_monster_frames = None
+_player_frames = None
+# Tinted and flashing player frames by (direction, state, frame, health,
+# flash alpha), baked on first use and shared by every Player
+_player_variants = {}
+
+# Player sprite folders for each facing under assets/
+PLAYER_SPRITE_NAMES = {
+    "up": "elf_back",
+    "down": "elf_front",
+    "right": "elf_side01",
+    "left": "elf_side02",
+}
+
+
+def get_monster_frames():
+    """
+    Monster animation frames for every facing, shared by all monsters.
+
+    The spritesheet is sliced once per process, and the flipped and
+    rotated copies are made up front, so creating and drawing monsters
+    does no file I/O and no transforms. Returns (frames, frame_size), where
+    frames maps "right", "left", "up" and "down" to the five frames.
+    """
+    global _monster_frames
+    if _monster_frames is None:
+        spritesheet = assets.image("assets", "enemy_spritesheet.png")
+        frame_size = spritesheet.get_height() // 5  # 5 columns
+        right = []
+        for i in range(5):
+            # Add 1-pixel margin to avoid clipping
+            rect = pygame.Rect(i * frame_size + 1, 1, frame_size - 2, frame_size - 2)
+            right.append(spritesheet.subsurface(rect))
+        frames = {
+            "right": right,
+            "left": [pygame.transform.flip(frame, True, False) for frame in right],
+            "up": [pygame.transform.rotate(frame, 90) for frame in right],
+            "down": [pygame.transform.rotate(frame, -90) for frame in right],
+        }
+        _monster_frames = (frames, frame_size)
+    return _monster_frames
+
+
+def get_player_frames(scale=1.5):
+    """
+    Player animation frames, shared by every Player: a dict of facing ->
+    {"idle": [frame], "walk": [8 frames]}, smoothscaled once per process.
+    """
+    global _player_frames
+    if _player_frames is None:
+        _player_frames = {}
+        for facing, name in PLAYER_SPRITE_NAMES.items():
+            idle = [assets.image("assets", f"{name}_idle", f"{name}_idle.png")]
+            walk = [
+                assets.image("assets", f"{name}_walk", f"{name}_walk{i}.png")
+                for i in range(1, 9)
+            ]
+            _player_frames[facing] = {
+                "idle": [_scale_frame(frame, scale) for frame in idle],
+                "walk": [_scale_frame(frame, scale) for frame in walk],
+            }
+    return _player_frames
+
+
+def get_player_variant(direction, state, index, health, flash_alpha=None):
+    """
+    A player frame tinted for health, a percentage snapped to the player's
+    damage steps, and flashed red at flash_alpha (one of a few cached
+    levels) unless it is None. Baked once per process.
+    """
+    key = (direction, state, index, health, flash_alpha)
+    baked = _player_variants.get(key)
+    if baked is None:
+        frame = get_player_frames()[direction][state][index]
+        baked = _bake_player_frame(frame, health, flash_alpha)
+        _player_variants[key] = baked
+    return baked
+
+
+def _bake_player_frame(frame, health, flash_alpha):
+    """
+    Make the tinted (and flashing) copy of a scaled frame.
+    """
+    baked = frame.copy()
+
+    # Calculate tint based on health
+    tint_value = int(255 * health / 100)
+    tint_surface = pygame.Surface(baked.get_size())
+    tint_surface.fill((tint_value, tint_value, tint_value))
+    baked.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_MULT)
+
+    # Flash red during invulnerability
+    if flash_alpha is not None:
+        flash_surface = pygame.Surface(baked.get_size(), pygame.SRCALPHA)
+        flash_surface.fill((255, 0, 0, flash_alpha))
+        baked.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    return baked
+
+
+def _scale_frame(frame, scale):
+    new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+    return pygame.transform.smoothscale(frame, new_size)
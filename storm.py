@@ -0,0 +1,99 @@
+import random
+
+import pygame
+from config import CELL_SIZE, STORM_NOISE_TEXTURES
+
+try:
+    import numpy as np
+except ImportError:  # Noise textures are then built pixel by pixel, once
+    np = None
+
+
+class StormOverlay:
+    """
+    The darkness, torch light, scanlines and grain drawn over the screen
+    during a storm, pre-baked so a storm frame is a few blits.
+
+    The torch gradient is rendered once into a mask around its center and
+    blitted at the player, with the rest of the screen filled black. The
+    scanlines and grain are baked into a small pool of full-screen noise
+    textures, one of which is added to the screen each frame.
+    """
+
+    def __init__(self, width, height, noise_textures=STORM_NOISE_TEXTURES):
+        self.width = width
+        self.height = height
+        self.torch_mask, self.torch_center = self._bake_torch()
+        self.noise = [self._bake_noise() for _ in range(noise_textures)]
+
+    def _bake_torch(self):
+        """
+        Render the torch: clear within torch_radius, then a quadratic fade
+        to black over the soft edge. Returns (mask, center offset).
+        """
+        torch_radius = int(2.5 * CELL_SIZE)
+        torch_soft_edge = int(1.2 * CELL_SIZE)
+        outer = torch_radius + torch_soft_edge
+        center = outer + 1
+        mask = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+        mask.fill((0, 0, 0, 255))  # Pitch black
+        for r in range(outer, 0, -1):
+            # Use a non-linear fade for realism (ease-in)
+            if r > torch_radius:
+                t = (r - torch_radius) / torch_soft_edge
+                alpha = int(255 * (t**2))  # quadratic fade
+            else:
+                alpha = 0
+            pygame.draw.circle(mask, (0, 0, 0, alpha), (center, center), r)
+        return mask, center
+
+    def _bake_noise(self):
+        """
+        One CRT texture: scanlines every third row, and grain sprinkled over
+        them at random.
+        """
+        texture = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for y in range(0, self.height, 3):
+            pygame.draw.line(texture, (0, 40, 0, 32), (0, y), (self.width, y))
+
+        count = self.width * self.height // 80
+        if np is not None:
+            rng = np.random.default_rng(random.getrandbits(32))
+            xs = rng.integers(0, self.width, count)
+            ys = rng.integers(0, self.height, count)
+            colors = pygame.surfarray.pixels3d(texture)
+            alphas = pygame.surfarray.pixels_alpha(texture)
+            colors[xs, ys] = 0
+            colors[xs, ys, 1] = rng.integers(32, 97, count)
+            alphas[xs, ys] = rng.integers(16, 49, count)
+            # Unlock the texture before it is blitted
+            del colors, alphas
+        else:
+            for _ in range(count):
+                x = random.randint(0, self.width - 1)
+                y = random.randint(0, self.height - 1)
+                g = random.randint(32, 96)
+                texture.set_at((x, y), (0, g, 0, random.randint(16, 48)))
+        return texture
+
+    def draw(self, screen, player_x, player_y):
+        """
+        Darken the screen around the torch at (player_x, player_y), in
+        screen pixels, and add a texture from the noise pool.
+        """
+        mask = self.torch_mask
+        left = player_x - self.torch_center
+        top = player_y - self.torch_center
+        torch_rect = mask.get_rect(topleft=(left, top))
+
+        # Outside the torch mask the storm is pitch black
+        black = (0, 0, 0)
+        screen.fill(black, (0, 0, self.width, max(0, top)))
+        screen.fill(black, (0, torch_rect.bottom, self.width, self.height))
+        screen.fill(black, (0, top, max(0, left), torch_rect.height))
+        screen.fill(black, (torch_rect.right, top, self.width, torch_rect.height))
+        screen.blit(mask, torch_rect)
+
+        # CRT grain and scanlines effect
+        noise = self.noise[random.randrange(len(self.noise))]
+        screen.blit(noise, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
@@ -0,0 +1,173 @@
+import random
+
+from config import CELL_SIZE, MONSTER_BASE_SPEED, MONSTER_MOVE_DELAY
+from sprites import get_monster_frames
+
+try:
+    import numpy as np
+except ImportError:  # Swarm mode needs NumPy; Game falls back to Monster objects
+    np = None
+
+# Facing codes, indexing the pre-rotated frame lists
+RIGHT, LEFT, UP, DOWN = range(4)
+
+
+class MonsterSwarm:
+    """
+    Many monsters stored as NumPy arrays, one entry per monster, instead of
+    one Monster object each.
+
+    Every frame, interpolation, freeze countdown, move timers and the
+    player-collision test each run as one vectorized step over the whole
+    swarm. Monsters whose move timer expires step along the shared
+    distance field toward the player, taking the same step
+    DistanceField.next_step would.
+    """
+
+    def __init__(self, maze, count):
+        self.width = maze.width
+        cells = self._spawn_cells(maze, count)
+        self.x = (cells % maze.width).astype(np.float64)
+        self.y = (cells // maze.width).astype(np.float64)
+        self.target_x = self.x.copy()
+        self.target_y = self.y.copy()
+        self.move_timer = np.zeros(count)
+        self.frozen = np.zeros(count, dtype=bool)
+        self.freeze_timer = np.zeros(count)
+        self.speed = np.full(count, MONSTER_BASE_SPEED * 0.8)
+        self.speed[:1] = MONSTER_BASE_SPEED  # The first monster is the fastest
+        self.facing = np.zeros(count, dtype=np.int8)
+        # Spread animation phases so the swarm does not move in lockstep
+        self.animation_phase = np.arange(count) % 5
+        self.animation_clock = 0.0
+        self.animation_speed = 0.12  # seconds per frame
+        # Neighbor offsets in (x, y) order: left, up, down, right
+        self.neighbor_steps = np.array([-1, -maze.width, maze.width, 1])
+        self.field = None
+        self.field_distances = None
+        self._load_frames()
+
+    def __len__(self):
+        return len(self.x)
+
+    def _spawn_cells(self, maze, count):
+        """
+        Pick flat ids of open cells at least 10 steps of walking from the
+        player's start, with repeats allowed.
+        """
+        distances = np.frombuffer(maze.start_distances, dtype=np.int32)
+        candidates = np.flatnonzero(distances > 10)
+        if not len(candidates):
+            candidates = np.flatnonzero(distances >= 0)
+        return candidates[[random.randrange(len(candidates)) for _ in range(count)]]
+
+    def _load_frames(self):
+        """
+        Index the shared monster frames by facing code.
+        """
+        frames, self.frame_size = get_monster_frames()
+        self.frames = [frames["right"], frames["left"], frames["up"], frames["down"]]
+
+    def freeze(self, duration, mask=None):
+        """
+        Freeze the monsters selected by mask (all of them by default).
+        """
+        if mask is None:
+            mask = np.ones(len(self), dtype=bool)
+        self.frozen |= mask
+        self.freeze_timer[mask] = duration
+
+    def update(self, dt, field):
+        """
+        Advance every monster by dt seconds, stepping toward the root of the
+        distance field when move timers expire.
+        """
+        if field is not self.field:
+            self.field = field
+            self.field_distances = np.frombuffer(field.distances, dtype=np.int32)
+
+        # Freeze countdown
+        self.freeze_timer[self.frozen] -= dt
+        self.frozen &= self.freeze_timer > 0
+        active = ~self.frozen
+
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        # Facing follows the larger component; it is left alone while idle
+        horizontal = np.abs(dx) > np.abs(dy)
+        self.facing[active & horizontal & (dx > 0)] = RIGHT
+        self.facing[active & horizontal & (dx < 0)] = LEFT
+        self.facing[active & ~horizontal & (dy > 0)] = DOWN
+        self.facing[active & ~horizontal & (dy < 0)] = UP
+
+        # Interpolate toward targets at each monster's speed, snapping when
+        # close enough
+        dist = np.hypot(dx, dy)
+        moving = active & (dist > 0.001)
+        scale = np.zeros_like(dist)
+        scale[moving] = (
+            np.minimum(self.speed[moving] * dt, dist[moving]) / dist[moving]
+        )
+        self.x += dx * scale
+        self.y += dy * scale
+        arrived = active & ~moving
+        self.x[arrived] = self.target_x[arrived]
+        self.y[arrived] = self.target_y[arrived]
+
+        self.animation_clock += dt
+
+        # Step along the field for every monster whose timer ran out
+        self.move_timer[active] -= dt
+        due = np.flatnonzero(active & (self.move_timer <= 0))
+        if len(due):
+            self.move_timer[due] = MONSTER_MOVE_DELAY
+            cells = self.y[due].astype(np.int64) * self.width + self.x[due].astype(
+                np.int64
+            )
+            distances = self.field_distances
+            wanted = distances[cells] - 1
+            # Distances of the four neighbors, tried in (x, y) order; the
+            # first one a step closer wins, as in DistanceField.next_step
+            neighbors = cells[:, None] + self.neighbor_steps
+            closer = distances[neighbors] == wanted[:, None]
+            can_step = (wanted >= 0) & closer.any(axis=1)
+            steps = neighbors[np.arange(len(due)), closer.argmax(axis=1)]
+            stepping = due[can_step]
+            self.target_x[stepping] = steps[can_step] % self.width
+            self.target_y[stepping] = steps[can_step] // self.width
+
+    def collisions(self, player_x, player_y):
+        """
+        Number of unfrozen monsters in the same cell as the player.
+        """
+        return int(
+            np.count_nonzero(
+                (self.x.astype(np.int64) == int(player_x))
+                & (self.y.astype(np.int64) == int(player_y))
+                & ~self.frozen
+            )
+        )
+
+    def draw(self, screen, offset_x=0, offset_y=0):
+        """
+        Draw every monster with one batched blit call. Returns the rects
+        drawn.
+        """
+        frame_index = (
+            int(self.animation_clock / self.animation_speed) + self.animation_phase
+        ) % 5
+        centers_x = (self.x * CELL_SIZE + CELL_SIZE // 2).astype(np.int64) + offset_x
+        centers_y = (
+            self.y * CELL_SIZE + CELL_SIZE // 2 - self.frame_size // 4
+        ).astype(np.int64) + offset_y
+        frames = self.frames
+        blits = []
+        for facing, index, center_x, center_y in zip(
+            self.facing.tolist(),
+            frame_index.tolist(),
+            centers_x.tolist(),
+            centers_y.tolist(),
+        ):
+            frame = frames[facing][index]
+            blits.append((frame, frame.get_rect(center=(center_x, center_y))))
+        return screen.blits(blits)
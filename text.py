@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    """
+    Process-wide cache of system fonts.
+
+    Looking up a system font is slow, so each (name, size, bold) font is
+    created with SysFont once and shared afterwards.
+    """
+
+    def __init__(self):
+        self.fonts = {}  # (name, size, bold) -> Font
+        self.loads = 0
+        self.hits = 0
+
+    def get(self, name, size, bold=False):
+        """
+        Get the system font with the given name, size and weight.
+        """
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        pygame.font.init()
+        font = pygame.font.SysFont(name, size, bold=bold)
+        self.loads += 1
+        self.fonts[key] = font
+        return font
+
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text surfaces keyed by (font,
+    text, color).
+
+    A label is only rendered again when its text or color changes, so a
+    counter such as the HUD timer re-renders once per change of its value
+    instead of every frame. Cached surfaces are shared between callers; a
+    caller that sets their alpha must set it every time it draws them.
+    """
+
+    def __init__(self, capacity=128):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key):
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def _put(self, key, surface):
+        # Run-length encode the transparent parts so blits skip them
+        surface.set_alpha(255, pygame.RLEACCEL)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+
+    def render(self, font, text, color):
+        """
+        Get text rendered antialiased in font and color, rendering it on a
+        miss and evicting the least recently used surface if full.
+        """
+        key = (font, text, color)
+        surface = self._get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._put(key, surface)
+        return surface
+
+    def render_scaled(self, font, text, color, scale):
+        """
+        Get text rendered as by render, then smoothscaled by scale.
+        """
+        key = (font, text, color, scale)
+        surface = self._get(key)
+        if surface is None:
+            surface = self.render(font, text, color)
+            size = (int(surface.get_width() * scale), int(surface.get_height() * scale))
+            surface = pygame.transform.smoothscale(surface, size)
+            self._put(key, surface)
+        return surface
+
+
+# The font registry shared by the whole process
+fonts = FontRegistry()